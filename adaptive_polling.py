@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Adaptive polling for Leonardo AI generations
+Instead of a fixed 2 second sleep, the first status check for a job is
+scheduled near the moment jobs of the same model usually finish, then the
+interval ramps up exponentially (with jitter) to a cap. Completion times are
+remembered per model ID so later runs poll at the right time straight away.
+"""
+
+import json
+import os
+import random
+import threading
+
+from generation_cache import CACHE_DIR
+
+HISTORY_FILE = os.path.join(CACHE_DIR, 'completion_history.json')
+
+
+def model_id(payload):
+    return payload.get('modelId') or 'default'
+
+
+class CompletionHistory:
+    """Recent completion times (seconds) per model ID, optionally persisted to `path`"""
+
+    def __init__(self, path=None, window=50):
+        self.path = path
+        self.window = window
+        self.lock = threading.Lock()
+        self.samples = self.load()
+
+    def load(self):
+        if not self.path:
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.samples, f)
+        os.replace(tmp_path, self.path)
+
+    def record(self, model, seconds):
+        with self.lock:
+            samples = self.samples.setdefault(model, [])
+            samples.append(round(seconds, 3))
+            del samples[:-self.window]
+            self.save()
+
+    def percentile(self, model, fraction):
+        """Completion time at `fraction` (0-1) for a model, or None without history"""
+        with self.lock:
+            samples = sorted(self.samples.get(model, []))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+class FixedPoller:
+    """The old behaviour: poll every `interval` seconds"""
+
+    def __init__(self, interval=2.0):
+        self.interval = interval
+        self.cap = interval
+
+    def first_delay(self, model):
+        return self.interval
+
+    def next_delay(self, model, attempt, elapsed=0.0):
+        return self.interval
+
+    def record(self, model, seconds):
+        pass
+
+
+class AdaptivePoller:
+    """
+    - first poll at ~the fastest typical completion time for the model
+      (`initial` seconds when there's no history yet)
+    - every `initial` seconds while inside the model's usual completion window
+    - past it, initial * factor^attempt capped at `cap`
+    - all delays +/- `jitter` so a batch of jobs doesn't poll in lockstep
+    """
+
+    def __init__(self, history=None, initial=0.5, factor=1.3, cap=5.0, jitter=0.2, lead=0.9):
+        self.history = history or CompletionHistory()
+        self.initial = initial
+        self.factor = factor
+        self.cap = cap
+        self.jitter = jitter
+        self.lead = lead
+
+    def spread(self, delay):
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def first_delay(self, model):
+        expected = self.history.percentile(model, 0.1)
+        if expected is None:
+            return self.spread(self.initial)
+        return max(self.initial, expected * self.lead)
+
+    def next_delay(self, model, attempt, elapsed=0.0):
+        usual = self.history.percentile(model, 0.9)
+        if usual is not None and elapsed < usual:
+            return self.spread(self.initial)
+        return self.spread(min(self.cap, self.initial * self.factor ** attempt))
+
+    def record(self, model, seconds):
+        self.history.record(model, seconds)
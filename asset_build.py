@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+WETCAT Asset Build Graph
+make/ninja-style incremental rebuilds for the sprite pipeline. Every sprite
+in asset_manifest.py becomes a node (source -> transforms -> outputs); a
+node only re-runs when its source, its transform chain or one of its
+outputs changed since the last build.
+
+Usage: python asset_build.py [--force] [--dry-run] [sprite names...]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+
+from asset_fingerprint import fingerprint_assets
+from asset_manifest import DRAW_SCALE, SPRITES, output_paths, source_path
+from sprite_processing import apply_transforms, decode_image, encode_image, write_outputs
+
+STATE_FILE = ".asset_build_state.json"
+
+# Bump when the meaning of a transform changes so every node rebuilds
+TRANSFORM_VERSION = 2
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildNode:
+    """One build step: `action(node)` turns `inputs` into `outputs`"""
+
+    def __init__(self, name, inputs, outputs, action, signature=""):
+        self.name = name
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.action = action
+        self.signature = signature
+
+    def __repr__(self):
+        return f"BuildNode({self.name!r})"
+
+
+class BuildGraph:
+    """
+    Nodes plus a persisted record of what each one last consumed/produced.
+    Files are compared by (size, mtime) first and only hashed when those
+    differ, so a warm no-op build is a handful of stat() calls.
+    """
+
+    def __init__(self, state_path=STATE_FILE, verbose=True):
+        self.state_path = state_path
+        self.verbose = verbose
+        self.nodes = {}
+        self.producers = {}
+        self.lock = threading.Lock()
+        self.state = self.load_state()
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def load_state(self):
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self):
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def add(self, node):
+        self.nodes[node.name] = node
+        for path in node.outputs:
+            self.producers[path] = node.name
+        return node
+
+    def order(self, names=None):
+        """Topologically sorted nodes (dependencies of `names` included)"""
+        ordered = []
+        visiting = set()
+        done = set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle in asset graph at {name}")
+            visiting.add(name)
+            for path in self.nodes[name].inputs:
+                if path in self.producers:
+                    visit(self.producers[path])
+            visiting.discard(name)
+            done.add(name)
+            ordered.append(self.nodes[name])
+
+        for name in (names or self.nodes):
+            if name not in self.nodes:
+                raise KeyError(f"Unknown asset node: {name}")
+            visit(name)
+        return ordered
+
+    def fingerprint(self, path, previous=None):
+        """{size, mtime_ns, sha256} for a file, reusing the old hash when stat() is unchanged"""
+        st = os.stat(path)
+        if previous and previous['size'] == st.st_size and previous['mtime_ns'] == st.st_mtime_ns:
+            return previous
+        return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': file_hash(path)}
+
+    def changed(self, path, recorded):
+        """True when `path` no longer matches its recorded fingerprint"""
+        if not recorded or not os.path.exists(path):
+            return True
+        return self.fingerprint(path, recorded)['sha256'] != recorded['sha256']
+
+    def dirty_reason(self, node):
+        """Why `node` must run, or None if it is up to date"""
+        record = self.state.get(node.name)
+        if not record:
+            return "never built"
+        if record.get('signature') != node.signature:
+            return "transforms changed"
+        for path in node.inputs:
+            if self.changed(path, record['inputs'].get(path)):
+                return f"input changed: {path}"
+        for path in node.outputs:
+            if self.changed(path, record['outputs'].get(path)):
+                return f"output missing or modified: {path}"
+        return None
+
+    def record(self, node):
+        previous = self.state.get(node.name, {})
+        with self.lock:
+            self.state[node.name] = {
+                'signature': node.signature,
+                'inputs': {p: self.fingerprint(p, previous.get('inputs', {}).get(p)) for p in node.inputs},
+                'outputs': {p: self.fingerprint(p, previous.get('outputs', {}).get(p)) for p in node.outputs},
+                'built_at': time.time()
+            }
+            self.save_state()
+
+    def build(self, names=None, force=False, dry_run=False):
+        """Run every out-of-date node; returns (built, skipped) name lists"""
+        built, skipped = [], []
+        for node in self.order(names):
+            missing = [path for path in node.inputs if not os.path.exists(path)]
+            if missing:
+                self.log(f"⏭️  {node.name}: no source yet ({missing[0]})")
+                skipped.append(node.name)
+                continue
+
+            reason = "forced" if force else self.dirty_reason(node)
+            if not reason:
+                skipped.append(node.name)
+                continue
+
+            self.log(f"🔨 {node.name}: {reason}")
+            if not dry_run:
+                node.action(node)
+                self.record(node)
+            built.append(node.name)
+        return built, skipped
+
+
+def transform_steps(spec):
+    """Declarative manifest flags -> ordered transform chain"""
+    steps = []
+    if spec.get("chroma_key"):
+        steps.append(("chroma_key",))
+    if spec.get("size"):
+        steps.append(("resize", *spec["size"]))
+    if spec.get("draw_size"):
+        width, height = spec["draw_size"]
+        steps.append(("fit", width * DRAW_SCALE, height * DRAW_SCALE))
+    return steps
+
+
+def render_sprite(spec, data):
+    """Source bytes -> encoded output bytes (pure CPU, nothing written)"""
+    steps = transform_steps(spec)
+    if not steps:
+        return data
+    return encode_image(apply_transforms(decode_image(data), steps), spec.get("ext", "png"))
+
+
+def sprite_node(spec):
+    """Build node for one manifest sprite"""
+    steps = transform_steps(spec)
+
+    def action(node):
+        with open(node.inputs[0], 'rb') as f:
+            data = f.read()
+        for path in write_outputs(render_sprite(spec, data), node.outputs):
+            print(f"✅ Built: {path}")
+
+    signature = json.dumps({'steps': steps, 'version': TRANSFORM_VERSION})
+    return BuildNode(spec["name"], [source_path(spec)], output_paths(spec), action, signature)
+
+
+def sprite_graph(state_path=STATE_FILE, verbose=True):
+    """The full sprite build graph from asset_manifest.SPRITES"""
+    graph = BuildGraph(state_path, verbose=verbose)
+    for spec in SPRITES:
+        graph.add(sprite_node(spec))
+    return graph
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally rebuild WETCAT sprites")
+    parser.add_argument('names', nargs='*', help="sprite names to build (default: all)")
+    parser.add_argument('--force', action='store_true', help="rebuild even if up to date")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would be rebuilt")
+    parser.add_argument('--state', default=STATE_FILE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    built, skipped = sprite_graph(args.state).build(args.names or None, args.force, args.dry_run)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n🎮 {len(built)} rebuilt, {len(skipped)} up to date or skipped in {elapsed:.0f}ms")
+
+    if built and not args.dry_run:
+        fingerprint_assets()
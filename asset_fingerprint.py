@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+WETCAT Asset Fingerprinting
+Publishes a content-hashed copy of every sprite the game loads from the
+working copies in src/assets/sprites into public/sprites
+(kid1_stand.png -> public/sprites/kid1_stand.<hash>.png) and generates
+src/game/data/assetManifest.js mapping Game.loadAssets names to those URLs.
+A hashed URL never changes content, so it can be cached forever; only
+sprites whose bytes changed get a new URL. Plain names never reach the
+deploy root, so nothing ships twice.
+
+Usage: python asset_fingerprint.py [--sprite-dir src/assets/sprites] [--out src/game/data/assetManifest.js]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+from asset_manifest import SPRITE_DIRS, SPRITES
+from sprite_processing import write_atomic
+
+HASH_LENGTH = 10
+MANIFEST_MODULE = "src/game/data/assetManifest.js"
+# Hashed sprites are published here and served under URL_PREFIX
+PUBLISH_DIR = "public/sprites"
+URL_PREFIX = "sprites/"
+# Responsive variants listed by image_variants.py (URLs are already hashed)
+VARIANTS_FILE = "src/assets/images/variants.json"
+# Seamless tiles and their mip levels from seamless_tile.py (URLs are already hashed)
+TILES_FILE = os.path.join(SPRITE_DIRS[0], "tiles.json")
+# Low-bitrate music variants from audio_optimize.py (URLs are already hashed)
+MUSIC_FILE = "src/assets/audio/music.json"
+FINGERPRINTED = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})\.(?P<ext>\w+)$" % HASH_LENGTH)
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def fingerprinted_name(filename, data):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{content_hash(data)}{ext}"
+
+
+def prune_stale(directory, filename, keep):
+    """Remove older fingerprinted copies of `filename` (anything but `keep`)"""
+    stem, ext = os.path.splitext(filename)
+    for entry in os.listdir(directory):
+        match = FINGERPRINTED.match(entry)
+        if match and entry != keep and match["stem"] == stem and f".{match['ext']}" == ext:
+            os.remove(os.path.join(directory, entry))
+
+
+def publish(path, data=None, directory=None):
+    """
+    Write a hashed copy of `path` (or of `data`, published under `path`'s
+    name) into `directory` (default: next to `path`); returns the hashed
+    file name. The copy is its own file, never a link, so rewriting the
+    working copy can't change what an immutable URL serves.
+    """
+    source_dir, filename = os.path.split(path)
+    directory = source_dir if directory is None else directory
+    if data is None:
+        with open(path, 'rb') as f:
+            data = f.read()
+    hashed = fingerprinted_name(filename, data)
+    hashed_path = os.path.join(directory, hashed)
+    if not os.path.exists(hashed_path):
+        write_atomic(hashed_path, data)
+    prune_stale(directory, filename, hashed)
+    return hashed
+
+
+def publish_atlas(atlas_path, directory=PUBLISH_DIR):
+    """Fingerprint the atlas sheets, then the atlas JSON pointing at them; returns its hashed name"""
+    source_dir = os.path.dirname(atlas_path)
+    with open(atlas_path) as f:
+        atlas = json.load(f)
+    for sheet in atlas["meta"]["sheets"]:
+        sheet["image"] = publish(os.path.join(source_dir, sheet["image"]), directory=directory)
+    data = json.dumps(atlas, indent=2, sort_keys=True).encode()
+    return publish(atlas_path, data, directory)
+
+
+def build_manifest(sprite_dir=SPRITE_DIRS[0], publish_dir=PUBLISH_DIR, url_prefix=URL_PREFIX,
+                   variants_file=VARIANTS_FILE, tiles_file=TILES_FILE, music_file=MUSIC_FILE):
+    """
+    {"images": {asset name: hashed URL}, "atlas" / "placeholders" / "effects": hashed URL or None,
+     "variants": {name: [{scale, width, height, webp, fallback}]}, "tiles": {name: {"levels": [...]}},
+     "music": {track: {"lite": hashed URL}}}
+    """
+    manifest = {"images": {}, "atlas": None, "placeholders": None, "effects": None, "variants": {}, "tiles": {},
+                "music": {}}
+    for spec in SPRITES:
+        path = os.path.join(sprite_dir, f"{spec['name']}.{spec.get('ext', 'png')}")
+        if spec.get("key") and os.path.exists(path):
+            manifest["images"][spec["key"]] = url_prefix + publish(path, directory=publish_dir)
+
+    for key, filename in (("atlas", "atlas.json"), ("placeholders", "placeholders.json"), ("effects", "effects.json")):
+        atlas_path = os.path.join(sprite_dir, filename)
+        if os.path.exists(atlas_path):
+            manifest[key] = url_prefix + publish_atlas(atlas_path, publish_dir)
+
+    for key, path in (("variants", variants_file), ("tiles", tiles_file), ("music", music_file)):
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest[key] = json.load(f)
+    return manifest
+
+
+def manifest_module(manifest):
+    # JSON is a valid JS expression, quotes and all
+    body = json.dumps(manifest, indent=2, sort_keys=True)
+    return (
+        "// Generated by asset_fingerprint.py - do not edit by hand.\n"
+        "// Maps asset names to content-hashed URLs under public/.\n"
+        f"export const ASSET_MANIFEST = {body};\n"
+    )
+
+
+def read_manifest(path=MANIFEST_MODULE):
+    """The manifest a previous write_manifest() wrote, or {} before the first run"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        source = f.read()
+    return json.loads(source[source.index("=") + 1:source.rindex(";")])
+
+
+def write_manifest(manifest, path=MANIFEST_MODULE):
+    """Write the ES module; returns True if its content changed"""
+    source = manifest_module(manifest).encode()
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == source:
+                return False
+    write_atomic(path, source)
+    return True
+
+
+def fingerprint_assets(sprite_dir=SPRITE_DIRS[0], out=MANIFEST_MODULE, publish_dir=PUBLISH_DIR):
+    manifest = build_manifest(sprite_dir, publish_dir)
+    changed = write_manifest(manifest, out)
+    print(f"{'✅ Wrote' if changed else '⏭️  Unchanged'}: {out} ({len(manifest['images'])} images)")
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fingerprint sprites and write the asset manifest module")
+    parser.add_argument("--sprite-dir", default=SPRITE_DIRS[0], help="working copies to publish from")
+    parser.add_argument("--publish-dir", default=PUBLISH_DIR, help="where hashed copies are written")
+    parser.add_argument("--out", default=MANIFEST_MODULE)
+    args = parser.parse_args()
+
+    fingerprint_assets(args.sprite_dir, args.out, args.publish_dir)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+WETCAT Asset Reference Graph
+Extracts every asset path the game's JS references (new Audio(...), .src =,
+loader calls, the generated asset manifest and any other asset-like string
+or template literal), hashes all media under public/, assets/, src/assets/
+and wetcat_assets/, and reports:
+
+- missing:    referenced by code but not in public/
+- unused:     shipped in public/ but never referenced
+- duplicates: byte-identical media files, with the bytes they waste
+- unresolved: template literals like `${name}.mp3` with no static file
+              name, which could load anything, so match nothing
+
+With --prune DIR, unused media are deleted from a built bundle (e.g. dist/
+after `npm run build`); the source tree is never modified.
+
+Usage: python asset_graph.py [--json] [--prune dist] [--dry-run]
+"""
+
+import argparse
+import difflib
+import fnmatch
+import json
+import os
+from collections import defaultdict
+
+from file_index import FileIndex
+from js_path_rewriter import DEFAULT_RULES, PathPolicy, matches_context, tokenize
+
+INDEX_FILE = ".asset_index.json"
+SOURCE_ROOTS = ["src", "index.html"]
+MEDIA_ROOTS = ["public", "assets", "src/assets", "wetcat_assets"]
+DEPLOY_ROOT = "public"
+MEDIA_EXTENSIONS = (".mp3", ".ogg", ".wav", ".mp4", ".webm", ".png", ".jpg", ".jpeg", ".webp", ".gif")
+# Generated data describing images by path; its keys don't load anything
+METADATA_MODULES = {os.path.normpath("src/game/data/imagePreviews.js")}
+
+
+class Reference:
+    """One asset path (or glob, for template literals) found in a source file"""
+
+    def __init__(self, path, source, line, rule):
+        self.path = path
+        self.source = source
+        self.line = line
+        self.rule = rule
+
+    @property
+    def is_pattern(self):
+        return "*" in self.path
+
+    @property
+    def is_unresolved(self):
+        """A pattern whose file name has no static stem (`${name}.mp3`): it can't say which file it loads"""
+        stem = os.path.splitext(self.path.rsplit("/", 1)[-1])[0]
+        return self.is_pattern and not stem.strip("*")
+
+    def __repr__(self):
+        return f"{self.source}:{self.line} {self.path} ({self.rule})"
+
+
+def template_pattern(text):
+    """`/kid_laughing_${type}.mp3` -> '/kid_laughing_*.mp3' (None if it has no static text)"""
+    body = text[1:-1]
+    pattern = []
+    i = 0
+    while i < len(body):
+        if body.startswith("${", i):
+            depth = 1
+            i += 2
+            while i < len(body) and depth:
+                depth += {"{": 1, "}": -1}.get(body[i], 0)
+                i += 1
+            pattern.append("*")
+        else:
+            pattern.append(body[i])
+            i += 1
+    pattern = "".join(pattern)
+    return pattern if pattern.strip("*") else None
+
+
+def extract_references(source, filename, policy=None):
+    """Every asset reference in one JS file"""
+    policy = policy or PathPolicy("relative")
+    significant = [token for token in tokenize(source) if token.kind != "comment"]
+    references = []
+    for index, token in enumerate(significant):
+        if token.kind == "string":
+            path = token.text[1:-1]
+        elif token.kind == "template":
+            path = template_pattern(token.text)
+        else:
+            continue
+        if not path or not policy.is_asset(path.replace("*", "x")):
+            continue
+        rule = next((name for name, context in DEFAULT_RULES if matches_context(significant, index, context)),
+                    "literal")
+        line = source.count("\n", 0, token.start) + 1
+        references.append(Reference(policy.canonical(path.split("?", 1)[0]), filename, line, rule))
+    return references
+
+
+class AssetGraph:
+    def __init__(self, source_roots=SOURCE_ROOTS, media_roots=MEDIA_ROOTS, deploy_root=DEPLOY_ROOT,
+                 index_path=INDEX_FILE):
+        self.deploy_root = deploy_root
+        self.references = []
+        self.media = {}
+        index = FileIndex(index_path, rule_version="media")
+
+        for path, _ in index.scan(source_roots, suffixes=(".js",)):
+            if os.path.normpath(path) in METADATA_MODULES:
+                continue
+            with open(path, encoding="utf-8") as f:
+                self.references.extend(extract_references(f.read(), path))
+
+        for path, st in index.scan(media_roots, suffixes=MEDIA_EXTENSIONS + (".json",)):
+            path = os.path.normpath(path)
+            self.media[path] = {"size": st.st_size, "sha256": index.hash(path, st)}
+        index.save()
+
+        self.follow_json_references()
+
+    def deployed(self):
+        """Media in the deploy root, keyed by URL path relative to it"""
+        prefix = self.deploy_root + os.sep
+        return {path[len(prefix):].replace(os.sep, "/"): path
+                for path in self.media if path.startswith(prefix) and path.endswith(MEDIA_EXTENSIONS)}
+
+    def follow_json_references(self):
+        """Referenced JSON files pull in what they point at: atlas sheet images, the audio sprite file"""
+        pending = [ref for ref in self.references if ref.path.endswith(".json") and not ref.is_pattern]
+        while pending:
+            ref = pending.pop()
+            path = os.path.join(self.deploy_root, ref.path)
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            directory = os.path.dirname(ref.path)
+            for sheet in data.get("meta", {}).get("sheets", []):
+                image = "/".join(filter(None, [directory, sheet["image"]]))
+                self.references.append(Reference(image, path, 0, "atlas-sheet"))
+            if isinstance(data.get("file"), str):
+                audio = "/".join(filter(None, [directory, data["file"]]))
+                self.references.append(Reference(audio, path, 0, "audio-sprite"))
+
+    def resolved(self):
+        """{deployed url: [references]} for everything the code can load"""
+        deployed = self.deployed()
+        used = defaultdict(list)
+        for ref in self.references:
+            if ref.is_unresolved:
+                continue
+            for url in (fnmatch.filter(deployed, ref.path) if ref.is_pattern else [ref.path]):
+                if url in deployed:
+                    used[url].append(ref)
+        return used
+
+    def missing(self):
+        deployed = self.deployed()
+        missing = []
+        for ref in self.references:
+            if ref.is_unresolved:
+                continue
+            if ref.path.endswith(".json") and os.path.exists(os.path.join(self.deploy_root, ref.path)):
+                continue
+            found = fnmatch.filter(deployed, ref.path) if ref.is_pattern else ref.path in deployed
+            if not found:
+                missing.append(ref)
+        return missing
+
+    def unused(self):
+        used = self.resolved()
+        return sorted(path for url, path in self.deployed().items() if url not in used)
+
+    def duplicates(self):
+        """[[paths...]] of byte-identical media, largest waste first"""
+        groups = defaultdict(list)
+        for path, info in self.media.items():
+            if path.endswith(MEDIA_EXTENSIONS):
+                groups[info["sha256"]].append(path)
+        duplicates = [sorted(paths) for paths in groups.values() if len(paths) > 1]
+        return sorted(duplicates, key=lambda paths: -self.media[paths[0]]["size"] * (len(paths) - 1))
+
+    def size(self, paths):
+        return sum(self.media[path]["size"] for path in paths)
+
+    def report(self):
+        unused = self.unused()
+        shipped = set(self.deployed().values())
+        candidates = [url for url, path in self.deployed().items() if path in unused]
+
+        missing = []
+        for ref in self.missing():
+            suggestion = difflib.get_close_matches(ref.path, candidates, n=1)
+            missing.append({"path": ref.path, "source": ref.source, "line": ref.line, "rule": ref.rule,
+                            "suggestion": suggestion[0] if suggestion else None})
+
+        duplicates = []
+        for paths in self.duplicates():
+            size = self.media[paths[0]]["size"]
+            in_bundle = sum(1 for path in paths if path in shipped)
+            duplicates.append({"paths": paths, "bytes": size, "wasted_bytes": size * (len(paths) - 1),
+                               "deployed_wasted_bytes": size * max(0, in_bundle - 1)})
+
+        return {
+            "references": len(self.references),
+            "missing": missing,
+            "unresolved": [{"path": ref.path, "source": ref.source, "line": ref.line, "rule": ref.rule}
+                           for ref in self.references if ref.is_unresolved],
+            "unused": [{"path": path, "bytes": self.media[path]["size"]} for path in unused],
+            "unused_bytes": self.size(unused),
+            "duplicates": duplicates,
+            "duplicate_bytes": sum(group["wasted_bytes"] for group in duplicates),
+            "deployed_duplicate_bytes": sum(group["deployed_wasted_bytes"] for group in duplicates)
+        }
+
+
+def prune_bundle(graph, bundle_dir, dry_run=False):
+    """
+    Delete unused media from a built bundle (dist/ mirrors public/); returns bytes removed.
+    Files an unresolved reference could still load (an mp3 for `${name}.mp3`) are kept.
+    """
+    unresolved = [ref for ref in graph.references if ref.is_unresolved]
+    removed = 0
+    for path in graph.unused():
+        url = os.path.relpath(path, graph.deploy_root).replace(os.sep, "/")
+        target = os.path.join(bundle_dir, url)
+        keep = next((ref for ref in unresolved if fnmatch.fnmatch(url, ref.path)), None)
+        if keep:
+            print(f"⏭️  Kept: {target} (could be {keep.source}:{keep.line})")
+        elif os.path.exists(target):
+            removed += os.path.getsize(target)
+            if not dry_run:
+                os.remove(target)
+            print(f"{'🔍 Would prune' if dry_run else '🗑️  Pruned'}: {target}")
+    return removed
+
+
+def kb(size):
+    return f"{size / 1024:.1f} KB"
+
+
+def print_report(report):
+    print(f"🔗 {report['references']} asset references in code\n")
+
+    print(f"❌ Missing ({len(report['missing'])})")
+    for item in report["missing"]:
+        hint = f"  (did you mean {item['suggestion']}?)" if item["suggestion"] else ""
+        print(f"   {item['path']:<32} {item['source']}:{item['line']}{hint}")
+
+    print(f"\n❔ Unresolved ({len(report['unresolved'])}, file name built at runtime)")
+    for item in report["unresolved"]:
+        print(f"   {item['path']:<32} {item['source']}:{item['line']}")
+
+    print(f"\n💤 Unused in {DEPLOY_ROOT}/ ({len(report['unused'])}, {kb(report['unused_bytes'])})")
+    for item in report["unused"]:
+        print(f"   {item['path']:<48} {kb(item['bytes']):>10}")
+
+    print(f"\n👯 Duplicates ({len(report['duplicates'])} groups, {kb(report['duplicate_bytes'])} wasted, "
+          f"{kb(report['deployed_duplicate_bytes'])} of it inside {DEPLOY_ROOT}/)")
+    for group in report["duplicates"]:
+        print(f"   {kb(group['bytes'])} x{len(group['paths'])}")
+        for path in group["paths"]:
+            print(f"      {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find missing, unused and duplicate game assets")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--prune", metavar="DIR", help="delete unused media from a built bundle (e.g. dist)")
+    parser.add_argument("--dry-run", action="store_true", help="with --prune, only list what would go")
+    args = parser.parse_args()
+
+    graph = AssetGraph()
+    report = graph.report()
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.prune:
+        removed = prune_bundle(graph, args.prune, args.dry_run)
+        print(f"\n🎮 {'Would remove' if args.dry_run else 'Removed'} {kb(removed)} from {args.prune}/")
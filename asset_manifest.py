@@ -0,0 +1,80 @@
+"""
+WETCAT Asset Manifest
+Single declarative description of every sprite the game ships: where its
+raw source lives, which transforms turn it into the in-game file, and
+where the results are written. asset_build.py turns this into a build graph.
+"""
+
+import os
+
+# Raw Leonardo outputs / hand-made sources (never overwritten by the build)
+SOURCE_DIR = "assets/sprites"
+
+# Working copies of every built sprite (and the generated atlases) live here,
+# outside the deploy root; asset_fingerprint.py publishes content-hashed
+# copies of what the game loads into public/sprites
+SPRITE_DIRS = ["src/assets/sprites"]
+
+# Sprites are kept at this multiple of their draw size so they stay crisp on HiDPI screens
+DRAW_SCALE = 2
+
+# name        -> file stem in SOURCE_DIR and SPRITE_DIRS
+# key         -> asset name Game.loadAssets registers it under (if the game loads it)
+# ext         -> file extension (default png)
+# chroma_key  -> remove a background sampled from the opaque corners
+# size        -> (width, height) to resize to with NEAREST
+# draw_size   -> (width, height) the entity is drawn at in game; the build
+#                downscales anything larger than DRAW_SCALE x this (aspect kept)
+SPRITES = [
+    # WETCAT player
+    {"name": "wetcat_stand", "key": "wetcatStand", "chroma_key": True, "size": (64, 80), "draw_size": (48, 64)},
+    {"name": "wetcat_walk1", "key": "wetcatWalk1", "chroma_key": True, "size": (64, 80), "draw_size": (48, 64)},
+    {"name": "wetcat_walk2", "key": "wetcatWalk2", "chroma_key": True, "size": (64, 80), "draw_size": (48, 64)},
+
+    # Items
+    {"name": "coin", "key": "coin", "size": (32, 32), "draw_size": (24, 24)},
+    {"name": "wallet", "key": "wallet", "size": (96, 120), "draw_size": (80, 100)},
+
+    # Scammers (kid sprites)
+    {"name": "kid1_stand", "key": "scammer1Stand", "draw_size": (36, 48)},
+    {"name": "kid1_walk", "key": "scammer1Walk", "draw_size": (36, 48)},
+    {"name": "kid2_stand", "key": "scammer2Stand", "draw_size": (36, 48)},
+    {"name": "kid2_walk", "key": "scammer2Walk", "draw_size": (36, 48)},
+    {"name": "kid3_stand", "key": "scammer3Stand", "draw_size": (36, 48)},
+    {"name": "kid3_walk", "key": "scammer3Walk", "draw_size": (36, 48)},
+
+    # Librarian
+    {"name": "librarian_stand"},
+    {"name": "librarian_walk1"},
+    {"name": "librarian_walk2"},
+
+    # Floors
+    {"name": "wood_floor", "ext": "jpg"},
+    {"name": "wood_floor_tiles", "key": "woodFloor", "ext": "jpg"},
+
+    # Produced by generate_enhanced_wetcat.py
+    {"name": "wetcat_sprint", "chroma_key": True, "size": (64, 80)},
+    {"name": "dollar_particle", "chroma_key": True, "size": (16, 16)},
+    {"name": "splash_particle", "chroma_key": True, "size": (16, 16)},
+]
+
+
+def sprite_spec(name):
+    """Look up a sprite entry by name"""
+    for spec in SPRITES:
+        if spec["name"] == name:
+            return spec
+    raise KeyError(f"Unknown sprite: {name}")
+
+
+def atlas_specs():
+    """Sprites the game loads that can share a texture sheet (PNG frames only)"""
+    return [spec for spec in SPRITES if spec.get("key") and spec.get("ext", "png") == "png"]
+
+
+def source_path(spec):
+    return os.path.join(SOURCE_DIR, f"{spec['name']}.{spec.get('ext', 'png')}")
+
+
+def output_paths(spec):
+    return [os.path.join(directory, f"{spec['name']}.{spec.get('ext', 'png')}") for directory in SPRITE_DIRS]
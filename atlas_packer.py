@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+WETCAT Sprite Atlas Packer
+Trims transparent borders, packs the character and item frames into one
+(or a few) power-of-two sheets with MaxRects and writes a frame map that
+AssetLoader.loadAtlas() consumes, so the game makes one request and one
+texture instead of one per frame.
+
+Usage: python atlas_packer.py [--out src/assets/sprites/atlas] [--max-size 2048] [--padding 2]
+"""
+
+import argparse
+import json
+import os
+
+from PIL import Image
+
+from asset_fingerprint import fingerprint_assets
+from asset_manifest import SPRITE_DIRS, atlas_specs
+from sprite_processing import encode_png_optimized, write_atomic
+
+ATLAS_VERSION = 1
+
+
+class Rect:
+    def __init__(self, x, y, w, h):
+        self.x, self.y, self.w, self.h = x, y, w, h
+
+    def contains(self, other):
+        return (other.x >= self.x and other.y >= self.y
+                and other.x + other.w <= self.x + self.w
+                and other.y + other.h <= self.y + self.h)
+
+    def intersects(self, other):
+        return not (other.x >= self.x + self.w or other.x + other.w <= self.x
+                    or other.y >= self.y + self.h or other.y + other.h <= self.y)
+
+
+class MaxRectsBin:
+    """MaxRects bin packer using the best-short-side-fit heuristic (no rotation)"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.free = [Rect(0, 0, width, height)]
+
+    def find_position(self, w, h):
+        best = None
+        best_score = None
+        for rect in self.free:
+            if w <= rect.w and h <= rect.h:
+                score = (min(rect.w - w, rect.h - h), max(rect.w - w, rect.h - h))
+                if best_score is None or score < best_score:
+                    best, best_score = Rect(rect.x, rect.y, w, h), score
+        return best
+
+    def insert(self, w, h):
+        placed = self.find_position(w, h)
+        if placed is None:
+            return None
+        self.split_free(placed)
+        return placed
+
+    def split_free(self, used):
+        new_free = []
+        for rect in self.free:
+            if not rect.intersects(used):
+                new_free.append(rect)
+                continue
+            if used.x > rect.x:
+                new_free.append(Rect(rect.x, rect.y, used.x - rect.x, rect.h))
+            if used.x + used.w < rect.x + rect.w:
+                new_free.append(Rect(used.x + used.w, rect.y, rect.x + rect.w - used.x - used.w, rect.h))
+            if used.y > rect.y:
+                new_free.append(Rect(rect.x, rect.y, rect.w, used.y - rect.y))
+            if used.y + used.h < rect.y + rect.h:
+                new_free.append(Rect(rect.x, used.y + used.h, rect.w, rect.y + rect.h - used.y - used.h))
+        # Prune rectangles fully contained in another free rectangle
+        self.free = [
+            rect for i, rect in enumerate(new_free)
+            if not any(j != i and other.contains(rect) and (not rect.contains(other) or j < i)
+                       for j, other in enumerate(new_free))
+        ]
+
+
+def next_pow2(value):
+    size = 1
+    while size < value:
+        size *= 2
+    return size
+
+
+def trim(img):
+    """Crop fully transparent borders; returns (cropped image, (x, y) offset)"""
+    img = img.convert("RGBA")
+    bbox = img.getchannel("A").getbbox() or (0, 0, 1, 1)
+    return img.crop(bbox), (bbox[0], bbox[1])
+
+
+def pack_into(frames, size, padding):
+    """Try to place every frame in a size x size bin; returns placements or None"""
+    packer = MaxRectsBin(size, size)
+    placements = {}
+    for frame in frames:
+        rect = packer.insert(frame["image"].width + padding * 2, frame["image"].height + padding * 2)
+        if rect is None:
+            return None
+        placements[frame["key"]] = (rect.x + padding, rect.y + padding)
+    return placements
+
+
+def pack_sheets(frames, max_size=2048, padding=2):
+    """
+    Pack frames into as few power-of-two sheets as possible.
+    Returns a list of (sheet_size, {key: (x, y)}).
+    """
+    pending = sorted(frames, key=lambda f: (-f["image"].height, -f["image"].width, f["key"]))
+    sheets = []
+    while pending:
+        area = sum((f["image"].width + padding * 2) * (f["image"].height + padding * 2) for f in pending)
+        widest = max(max(f["image"].width, f["image"].height) + padding * 2 for f in pending)
+        size = min(max_size, next_pow2(max(widest, int(area ** 0.5))))
+        while True:
+            placements = pack_into(pending, size, padding)
+            if placements is not None or size >= max_size:
+                break
+            size *= 2
+
+        if placements is None:
+            # Fill one max-size sheet greedily and spill the rest to the next
+            packer = MaxRectsBin(size, size)
+            placements = {}
+            for frame in pending:
+                rect = packer.insert(frame["image"].width + padding * 2, frame["image"].height + padding * 2)
+                if rect is not None:
+                    placements[frame["key"]] = (rect.x + padding, rect.y + padding)
+            if not placements:
+                raise ValueError(f"Frame {pending[0]['key']} does not fit in a {max_size}px sheet")
+
+        sheets.append((size, placements))
+        pending = [f for f in pending if f["key"] not in placements]
+    return sheets
+
+
+def load_frames(specs, sprite_dir):
+    frames = []
+    for spec in specs:
+        path = os.path.join(sprite_dir, f"{spec['name']}.png")
+        if not os.path.exists(path):
+            print(f"⏭️  Missing frame: {path}")
+            continue
+        with Image.open(path) as img:
+            source_size = img.size
+            cropped, offset = trim(img)
+        frames.append({
+            "key": spec["key"],
+            "name": spec["name"],
+            "image": cropped,
+            "offset": offset,
+            "source_size": source_size
+        })
+    return frames
+
+
+def build_atlas(frames, out_prefix, max_size=2048, padding=2, aliases=None, meta=None):
+    """
+    Write <out_prefix>_N.png sheets and <out_prefix>.json; returns the frame map.
+    `aliases` ({name: packed key}) adds names that reuse an identical frame;
+    `meta` adds extra keys to the JSON's "meta".
+    """
+    by_key = {frame["key"]: frame for frame in frames}
+    base = os.path.basename(out_prefix)
+    atlas = {"frames": {}, "meta": {**(meta or {}), "version": ATLAS_VERSION, "sheets": []}}
+
+    for index, (size, placements) in enumerate(pack_sheets(frames, max_size, padding)):
+        sheet = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        for key, (x, y) in sorted(placements.items()):
+            frame = by_key[key]
+            sheet.paste(frame["image"], (x, y))
+            atlas["frames"][key] = {
+                "sheet": index,
+                "file": frame["name"],
+                "frame": {"x": x, "y": y, "w": frame["image"].width, "h": frame["image"].height},
+                "spriteSourceSize": {
+                    "x": frame["offset"][0], "y": frame["offset"][1],
+                    "w": frame["image"].width, "h": frame["image"].height
+                },
+                "sourceSize": {"w": frame["source_size"][0], "h": frame["source_size"][1]}
+            }
+        sheet_name = f"{base}_{index}.png"
+        write_atomic(os.path.join(os.path.dirname(out_prefix), sheet_name), encode_png_optimized(sheet))
+        atlas["meta"]["sheets"].append({"image": sheet_name, "size": {"w": size, "h": size}})
+
+    for alias, key in (aliases or {}).items():
+        atlas["frames"][alias] = dict(atlas["frames"][key], file=alias)
+
+    with open(f"{out_prefix}.json", "w") as f:
+        json.dump(atlas, f, indent=2, sort_keys=True)
+    return atlas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack WETCAT sprites into a texture atlas")
+    parser.add_argument("--sprite-dir", default=SPRITE_DIRS[0])
+    parser.add_argument("--out", default=os.path.join(SPRITE_DIRS[0], "atlas"))
+    parser.add_argument("--max-size", type=int, default=2048)
+    parser.add_argument("--padding", type=int, default=2)
+    args = parser.parse_args()
+
+    frames = load_frames(atlas_specs(), args.sprite_dir)
+    atlas = build_atlas(frames, args.out, args.max_size, args.padding)
+
+    for sheet in atlas["meta"]["sheets"]:
+        print(f"✅ {sheet['image']} ({sheet['size']['w']}x{sheet['size']['h']})")
+    print(f"\n🎮 Packed {len(atlas['frames'])} frames into {len(atlas['meta']['sheets'])} sheet(s): {args.out}.json")
+
+    if os.path.dirname(args.out) == args.sprite_dir:
+        fingerprint_assets(args.sprite_dir)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+WETCAT Audio Optimizer
+Prepares the game's audio for a mobile mini-app: sound effects are trimmed
+of leading/trailing silence, downmixed to mono, normalized to one loudness
+and re-encoded at a low bitrate into public/ (then repacked into the audio
+sprite); each music track gets a low-bitrate "-lite" variant, published
+with a content hash and listed under "music" in the asset manifest, that
+SoundManager streams on cellular connections. A track without a lite
+variant in the manifest is always streamed in full. The full tracks are
+left as they are.
+
+Analysis (silence, loudness, gain) is done here with numpy; ffmpeg decodes
+and encodes.
+
+Usage: python audio_optimize.py [--only sfx|music] [--dry-run]
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+
+import numpy as np
+
+from asset_fingerprint import MUSIC_FILE, fingerprint_assets, publish
+from audio_sprite import parse_frames, write_sprite
+from sprite_processing import write_atomic
+
+CATEGORIES = {
+    # Short cues: mono is indistinguishable on a phone speaker, and matching
+    # loudness stops one clip from drowning out the rest
+    "sfx": {"channels": 1, "sample_rate": 44100, "bitrate": 48, "loudness": -16.0, "trim": True},
+    # Streaming variant for cellular clients
+    "music": {"channels": 2, "sample_rate": 44100, "bitrate": 64, "loudness": None, "trim": False},
+}
+
+AUDIO_ASSETS = [
+    {"source": "assets/Menu Select.mp3", "output": "public/menu_select.mp3", "category": "sfx"},
+    {"source": "assets/Pick up Book.mp3", "output": "public/pickup_book.mp3", "category": "sfx"},
+    {"source": "assets/Book on shelf.mp3", "output": "public/book_on_shelf.mp3", "category": "sfx"},
+    {"source": "assets/Uh oh.mp3", "output": "public/uh_oh.mp3", "category": "sfx"},
+    {"source": "assets/Yay.mp3", "output": "public/yay.mp3", "category": "sfx"},
+    {"source": "assets/Out of breath.mp3", "output": "public/out_of_breath.mp3", "category": "sfx"},
+    {"source": "assets/Boy Laughing 1.mp3", "output": "public/kid_laughing_1.mp3", "category": "sfx"},
+    {"source": "assets/Boy Laughing 2.mp3", "output": "public/kid_laughing_2.mp3", "category": "sfx"},
+    {"source": "assets/Kid laughing.mp3", "output": "public/kid_laughing_3.mp3", "category": "sfx"},
+    # Lite tracks are working copies; only their hashed copies go into public/
+    {"source": "public/wetcat-song-1.mp3", "output": "src/assets/audio/wetcat-song-1-lite.mp3", "category": "music",
+     "key": "wetcat-song-1"},
+    {"source": "public/wetcat-song-2.mp3", "output": "src/assets/audio/wetcat-song-2-lite.mp3", "category": "music",
+     "key": "wetcat-song-2"},
+]
+MUSIC_PUBLISH_DIR = "public"
+
+SILENCE_DB = -50.0
+WINDOW_SECONDS = 0.01
+# Kept either side of the trimmed sound so attacks and tails aren't clipped
+PAD_SECONDS = 0.02
+PEAK_CEILING_DB = -1.0
+
+# ITU-R BS.1770 gating: 400 ms blocks every 100 ms, absolute and relative gates
+BLOCK_SECONDS = 0.4
+HOP_SECONDS = 0.1
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+
+
+def db(value):
+    return 20 * math.log10(value) if value > 0 else -math.inf
+
+
+def ffmpeg():
+    path = shutil.which("ffmpeg")
+    if not path:
+        raise RuntimeError("ffmpeg not found on PATH (needed to decode and encode audio)")
+    return path
+
+
+def decode(path, channels=None, sample_rate=None):
+    """(float32 samples shaped (frames, channels), sample rate); defaults to the file's own format"""
+    with open(path, "rb") as f:
+        frames = parse_frames(f.read())
+    if not frames:
+        raise ValueError(f"{path} has no MPEG audio frames")
+    channels = channels or frames[0][0].channels
+    sample_rate = sample_rate or frames[0][0].sample_rate
+    result = subprocess.run(
+        [ffmpeg(), "-v", "error", "-i", path, "-f", "f32le", "-ac", str(channels), "-ar", str(sample_rate), "-"],
+        capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype=np.float32).reshape(-1, channels), sample_rate
+
+
+def encode(samples, sample_rate, path, bitrate):
+    """Encode CBR MP3 without tags (plus a Xing frame for seeking); written via a temp file"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp.mp3"
+    subprocess.run(
+        [ffmpeg(), "-v", "error", "-y", "-f", "f32le", "-ar", str(sample_rate), "-ac", str(samples.shape[1]),
+         "-i", "-", "-c:a", "libmp3lame", "-b:a", f"{bitrate}k", "-map_metadata", "-1", "-id3v2_version", "0",
+         "-write_id3v1", "0", tmp],
+        input=np.ascontiguousarray(samples, dtype=np.float32).tobytes(), capture_output=True, check=True)
+    os.replace(tmp, path)
+
+
+def downmix(samples):
+    return samples.mean(axis=1, keepdims=True)
+
+
+def silence_bounds(samples, sample_rate, threshold_db=SILENCE_DB, window=WINDOW_SECONDS, pad=PAD_SECONDS):
+    """(start, end) sample indices of the audible part, padded; the whole clip if none of it is audible"""
+    size = max(1, int(window * sample_rate))
+    count = math.ceil(len(samples) / size)
+    padded = np.zeros((count * size, samples.shape[1]), dtype=np.float32)
+    padded[:len(samples)] = samples
+    peaks = np.abs(padded).reshape(count, -1).max(axis=1)
+    loud = np.flatnonzero(peaks >= 10 ** (threshold_db / 20))
+    if not len(loud):
+        return 0, len(samples)
+    margin = int(pad * sample_rate)
+    return max(0, loud[0] * size - margin), min(len(samples), (loud[-1] + 1) * size + margin)
+
+
+def loudness(samples, sample_rate):
+    """
+    Gated loudness in dB (BS.1770 gating over mean-square power; no
+    K-weighting). Clips shorter than one block are measured whole.
+    """
+    power = (samples.astype(np.float64) ** 2).mean(axis=1)
+    block = int(BLOCK_SECONDS * sample_rate)
+    hop = int(HOP_SECONDS * sample_rate)
+    if len(power) <= block:
+        blocks = np.array([power.mean()]) if len(power) else np.zeros(1)
+    else:
+        cumulative = np.concatenate(([0.0], np.cumsum(power)))
+        starts = np.arange(0, len(power) - block + 1, hop)
+        blocks = (cumulative[starts + block] - cumulative[starts]) / block
+    levels = 10 * np.log10(np.maximum(blocks, 1e-20))
+    gated = blocks[levels > ABSOLUTE_GATE]
+    if not len(gated):
+        return -math.inf
+    relative = 10 * math.log10(gated.mean()) + RELATIVE_GATE
+    gated = gated[10 * np.log10(gated) > relative]
+    return 10 * math.log10(gated.mean())
+
+
+def normalize(samples, sample_rate, target, ceiling_db=PEAK_CEILING_DB):
+    """(samples, gain dB) moved to `target` loudness, but never with a peak above `ceiling_db`"""
+    level = loudness(samples, sample_rate)
+    peak = db(float(np.abs(samples).max())) if len(samples) else -math.inf
+    if level == -math.inf:
+        return samples, 0.0
+    gain = min(target - level, ceiling_db - peak)
+    return samples * np.float32(10 ** (gain / 20)), gain
+
+
+def prepare(samples, sample_rate, settings):
+    """Trim, downmix and normalize for a category; returns (samples, report)"""
+    report = {"duration_before": len(samples) / sample_rate, "loudness_before": loudness(samples, sample_rate)}
+    if settings["trim"]:
+        start, end = silence_bounds(samples, sample_rate)
+        samples = samples[start:end]
+    if settings["channels"] == 1 and samples.shape[1] > 1:
+        samples = downmix(samples)
+    gain = 0.0
+    if settings["loudness"] is not None:
+        samples, gain = normalize(samples, sample_rate, settings["loudness"])
+    report.update(duration=len(samples) / sample_rate, gain=gain, loudness=loudness(samples, sample_rate))
+    return samples, report
+
+
+def optimize(asset, dry_run=False):
+    """Process one AUDIO_ASSETS entry; returns its report (sizes in bytes, times in seconds)"""
+    settings = CATEGORIES[asset["category"]]
+    samples, sample_rate = decode(asset["source"], sample_rate=settings["sample_rate"])
+    samples, report = prepare(samples, sample_rate, settings)
+    report.update(name=os.path.basename(asset["output"]), before=os.path.getsize(asset["source"]), after=None)
+    if not dry_run:
+        encode(samples, sample_rate, asset["output"], settings["bitrate"])
+        report["after"] = os.path.getsize(asset["output"])
+    return report
+
+
+def music_manifest(assets=AUDIO_ASSETS, publish_dir=MUSIC_PUBLISH_DIR):
+    """Publish every lite track that has been encoded; returns {track: {"lite": hashed URL}}"""
+    return {asset["key"]: {"lite": publish(asset["output"], directory=publish_dir)}
+            for asset in assets if asset["category"] == "music" and os.path.exists(asset["output"])}
+
+
+def write_music(assets=AUDIO_ASSETS, publish_dir=MUSIC_PUBLISH_DIR, music_file=MUSIC_FILE):
+    """Write `music_file` (read by asset_fingerprint.py); returns it"""
+    music = music_manifest(assets, publish_dir)
+    write_atomic(music_file, json.dumps(music, indent=2, sort_keys=True).encode())
+    return music
+
+
+def optimize_audio(assets=AUDIO_ASSETS, categories=tuple(CATEGORIES), dry_run=False):
+    reports = [optimize(asset, dry_run) for asset in assets if asset["category"] in categories]
+    # The sprite is spliced from the public/ SFX, so it has to be rebuilt from the new ones
+    if not dry_run and "sfx" in categories:
+        write_sprite()
+    if not dry_run and "music" in categories:
+        write_music(assets)
+        fingerprint_assets()
+    return reports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Trim, normalize, downmix and re-encode the game's audio")
+    parser.add_argument("--only", choices=sorted(CATEGORIES), help="process a single category")
+    parser.add_argument("--dry-run", action="store_true", help="analyze only, write nothing")
+    args = parser.parse_args()
+
+    reports = optimize_audio(categories=[args.only] if args.only else tuple(CATEGORIES), dry_run=args.dry_run)
+
+    for r in reports:
+        size = f"{r['before'] / 1024:7.1f} KB" + (f" -> {r['after'] / 1024:7.1f} KB" if r["after"] else "")
+        print(f"🔊 {r['name']:<26} {r['duration_before']:6.2f}s -> {r['duration']:6.2f}s  "
+              f"{r['loudness_before']:6.1f} dB -> {r['loudness']:6.1f} dB ({r['gain']:+.1f})  {size}")
+    if not args.dry_run:
+        before = sum(r["before"] for r in reports)
+        after = sum(r["after"] for r in reports)
+        print(f"\n💾 {before / 1024:.1f} KB -> {after / 1024:.1f} KB ({(before - after) / 1024:.1f} KB saved)")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+WETCAT Audio Sprite Builder
+Packs the short sound effects into one MP3 plus a JSON offset map, so the
+game makes one request and decodes one buffer instead of nine. Clips are
+spliced at MP3 frame boundaries (no re-encode, no quality loss) with a few
+silent frames between them, so a slightly late stop never bleeds into the
+next sound. Identical clips are stored once.
+
+All clips must share a sample rate and channel count; re-encode any that
+don't before packing.
+
+Usage: python audio_sprite.py [--out public/sfx] [--gap 0.1] [names...]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+
+from asset_fingerprint import publish
+from sprite_processing import write_atomic
+
+SFX = [
+    "menu_select", "pickup_book", "book_on_shelf", "uh_oh", "yay", "out_of_breath",
+    "kid_laughing_1", "kid_laughing_2", "kid_laughing_3",
+]
+SOURCE_DIRS = ["public", "assets"]
+OUTPUT = "public/sfx"
+SPRITE_VERSION = 1
+GAP_SECONDS = 0.1
+
+# Samples an MP3 decoder emits before the first real one; without a LAME
+# gapless tag browsers keep them, which shifts every clip by this much
+DECODER_DELAY = 529
+
+BITRATES = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+class FrameHeader:
+    """An MPEG audio Layer III frame header"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.version = (raw >> 19) & 3
+        self.layer = (raw >> 17) & 3
+        self.protected = not (raw >> 16) & 1
+        self.bitrate_index = (raw >> 12) & 15
+        self.sample_rate_index = (raw >> 10) & 3
+        self.padding = (raw >> 9) & 1
+        self.channel_mode = (raw >> 6) & 3
+
+    @property
+    def valid(self):
+        return ((self.raw >> 21) & 0x7FF == 0x7FF and self.version != 1 and self.layer == 1
+                and self.bitrate_index not in (0, 15) and self.sample_rate_index != 3)
+
+    @property
+    def mpeg1(self):
+        return self.version == 3
+
+    @property
+    def sample_rate(self):
+        return SAMPLE_RATES[self.version][self.sample_rate_index]
+
+    @property
+    def channels(self):
+        return 1 if self.channel_mode == 3 else 2
+
+    @property
+    def samples(self):
+        return 1152 if self.mpeg1 else 576
+
+    @property
+    def size(self):
+        bitrate = BITRATES[1 if self.mpeg1 else 2][self.bitrate_index] * 1000
+        return (144 if self.mpeg1 else 72) * bitrate // self.sample_rate + self.padding
+
+    @property
+    def side_info_size(self):
+        if self.mpeg1:
+            return 17 if self.channels == 1 else 32
+        return 9 if self.channels == 1 else 17
+
+
+def id3v2_size(data):
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    size = data[6:10]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + footer + ((size[0] << 21) | (size[1] << 14) | (size[2] << 7) | size[3])
+
+
+def is_info_frame(data, header):
+    """A Xing/Info/VBRI header frame: metadata for the original file, silent and wrong once spliced"""
+    body = data[4 + header.side_info_size:4 + header.side_info_size + 4]
+    return body in (b"Xing", b"Info") or data[36:40] == b"VBRI"
+
+
+def parse_frames(data):
+    """[(FrameHeader, frame bytes)] for every audio frame, skipping tags and junk"""
+    frames = []
+    i = id3v2_size(data)
+    while i + 4 <= len(data):
+        if data[i:i + 3] == b"TAG":
+            break
+        header = FrameHeader(int.from_bytes(data[i:i + 4], "big"))
+        if not header.valid or i + header.size > len(data):
+            i += 1
+            continue
+        frame = data[i:i + header.size]
+        if not (not frames and is_info_frame(frame, header)):
+            frames.append((header, frame))
+        i += header.size
+    return frames
+
+
+def silent_frame(header):
+    """
+    A frame of digital silence in the same format: zero side info means
+    zero-length main data, so it can use the lowest bitrate (104 bytes at 44.1 kHz)
+    """
+    raw = header.raw | (1 << 16)            # no CRC
+    raw &= ~((0xF << 12) | (1 << 9))        # lowest bitrate, no padding
+    raw |= 1 << 12
+    silent = FrameHeader(raw)
+    return raw.to_bytes(4, "big") + bytes(silent.size - 4)
+
+
+def find_clip(name, source_dirs=SOURCE_DIRS):
+    for directory in source_dirs:
+        path = os.path.join(directory, f"{name}.mp3")
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No {name}.mp3 in {', '.join(source_dirs)}")
+
+
+def build_sprite(clips, gap=GAP_SECONDS):
+    """
+    clips: [(name, mp3 bytes)] -> (sprite bytes, {name: {"start", "duration"}}, sample rate).
+    Times are seconds into the decoded sprite.
+    """
+    parsed = [(name, parse_frames(data)) for name, data in clips]
+    formats = {(frames[0][0].version, frames[0][0].sample_rate, frames[0][0].channels)
+               for _, frames in parsed if frames}
+    if len(formats) != 1:
+        raise ValueError(f"Clips must share one sample rate and channel count, got {sorted(formats)}")
+    template = next(frames[0][0] for _, frames in parsed if frames)
+    sample_rate = template.sample_rate
+    samples = template.samples
+
+    silence = silent_frame(template)
+    gap_frames = max(1, math.ceil(gap * sample_rate / samples))
+
+    # Lead with silence too, so the first clip isn't inside the decoder's warm-up
+    out = bytearray(silence * gap_frames)
+    frame_count = gap_frames
+    sounds = {}
+    placed = {}
+    for name, frames in parsed:
+        digest = hashlib.sha256(b"".join(frame for _, frame in frames)).hexdigest()
+        if digest not in placed:
+            placed[digest] = (frame_count, len(frames))
+            for _, frame in frames:
+                out += frame
+            out += silence * gap_frames
+            frame_count += len(frames) + gap_frames
+        start, length = placed[digest]
+        sounds[name] = {
+            "start": round((start * samples + DECODER_DELAY) / sample_rate, 4),
+            "duration": round(length * samples / sample_rate, 4)
+        }
+    return bytes(out), sounds, sample_rate
+
+
+def write_sprite(names=SFX, out=OUTPUT, gap=GAP_SECONDS, source_dirs=SOURCE_DIRS):
+    """Write <out>.<hash>.mp3 and <out>.json; returns the map"""
+    clips = []
+    for name in names:
+        with open(find_clip(name, source_dirs), "rb") as f:
+            clips.append((name, f.read()))
+    data, sounds, sample_rate = build_sprite(clips, gap)
+    audio = publish(f"{out}.mp3", data)
+    sprite = {"version": SPRITE_VERSION, "file": audio, "sampleRate": sample_rate, "sounds": sounds}
+    write_atomic(f"{out}.json", json.dumps(sprite, indent=2, sort_keys=True).encode())
+    return sprite
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack the game's sound effects into one audio sprite")
+    parser.add_argument("names", nargs="*", default=SFX)
+    parser.add_argument("--out", default=OUTPUT, help="output prefix (writes <out>.<hash>.mp3 and <out>.json)")
+    parser.add_argument("--gap", type=float, default=GAP_SECONDS, help="seconds of silence between clips")
+    args = parser.parse_args()
+
+    before = sum(os.path.getsize(find_clip(name)) for name in args.names)
+    sprite = write_sprite(args.names, args.out, args.gap)
+    after = os.path.getsize(os.path.join(os.path.dirname(args.out), sprite["file"]))
+
+    for name, region in sprite["sounds"].items():
+        print(f"🔊 {name:<16} {region['start']:7.3f}s  +{region['duration']:.3f}s")
+    print(f"\n🎮 {len(args.names)} clips -> {sprite['file']} ({before / 1024:.1f} KB in {len(args.names)} files "
+          f"-> {after / 1024:.1f} KB in 1) + {args.out}.json")
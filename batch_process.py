@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+WETCAT Batch Sprite Processor
+Spreads chroma key + resize + re-encode over a process pool so reprocessing
+hundreds of generated variants scales with the number of cores.
+
+Usage:
+    python batch_process.py "src/assets/sprites/*.png" "assets/*.png" --chroma-key --size 64x80 --out-dir out/
+    python batch_process.py --manifest            # every sprite in asset_manifest.py
+    python batch_process.py files... --workers 8 --key-color 50
+
+Inputs are sorted and every file is processed independently, so the output
+is byte-for-byte the same whatever the worker count.
+"""
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from asset_build import transform_steps
+from asset_manifest import SPRITES, output_paths, source_path
+from sprite_processing import apply_transforms, decode_image, encode_image, write_outputs
+
+
+def process_file(task):
+    """Worker: (source, outputs, steps) -> (source, bytes written, error)"""
+    source, outputs, steps = task
+    try:
+        with open(source, 'rb') as f:
+            data = f.read()
+        ext = os.path.splitext(outputs[0])[1].lstrip('.') or 'png'
+        if steps:
+            data = encode_image(apply_transforms(decode_image(data), steps), ext)
+        write_outputs(data, outputs)
+        return source, len(data), None
+    except Exception as e:
+        return source, 0, str(e)
+
+
+def expand_inputs(patterns):
+    """Expand globs, drop duplicates and sort for a deterministic order"""
+    files = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern)
+        files.update(matches if matches else [pattern])
+    return sorted(files)
+
+
+def glob_tasks(patterns, steps, out_dir=None):
+    """One task per input file, written in place or into `out_dir`"""
+    tasks = []
+    for path in expand_inputs(patterns):
+        output = os.path.join(out_dir, os.path.basename(path)) if out_dir else path
+        tasks.append((path, [output], steps))
+    return tasks
+
+
+def manifest_tasks(names=None):
+    """One task per manifest sprite that has a source on disk"""
+    return [
+        (source_path(spec), output_paths(spec), transform_steps(spec))
+        for spec in SPRITES
+        if (not names or spec["name"] in names) and os.path.exists(source_path(spec))
+    ]
+
+
+def run_batch(tasks, workers=None):
+    """Process every task on a process pool; results come back in task order"""
+    if workers == 1 or len(tasks) <= 1:
+        return [process_file(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(process_file, tasks))
+
+
+def parse_size(value):
+    width, height = value.lower().split('x')
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-process sprites across all cores")
+    parser.add_argument('inputs', nargs='*', help="image files or glob patterns")
+    parser.add_argument('--manifest', action='store_true', help="process every sprite in asset_manifest.py")
+    parser.add_argument('--chroma-key', action='store_true', help="remove background sampled from the corners")
+    parser.add_argument('--key-color', type=int, metavar='TOLERANCE',
+                        help="remove the top-left color (fix_transparency.py behaviour)")
+    parser.add_argument('--size', type=parse_size, help="resize to WIDTHxHEIGHT with NEAREST")
+    parser.add_argument('--out-dir', help="write results here instead of in place")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    if args.manifest:
+        tasks = manifest_tasks(args.inputs)
+    else:
+        steps = []
+        if args.chroma_key:
+            steps.append(("chroma_key",))
+        if args.key_color is not None:
+            steps.append(("key_color", args.key_color))
+        if args.size:
+            steps.append(("resize", *args.size))
+        tasks = glob_tasks(args.inputs, steps, args.out_dir)
+
+    if not tasks:
+        print("❌ Nothing to process")
+        return
+
+    start = time.perf_counter()
+    results = run_batch(tasks, args.workers)
+    elapsed = time.perf_counter() - start
+
+    failed = 0
+    for source, size, error in results:
+        if error:
+            failed += 1
+            print(f"❌ {source}: {error}")
+        else:
+            print(f"✅ {source} ({size / 1024:.1f} KB)")
+
+    print(f"\n🎮 Processed {len(results) - failed}/{len(results)} images in {elapsed:.2f}s "
+          f"on {args.workers or os.cpu_count()} workers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Chroma key benchmark - per-pixel loops vs chroma_key.py
+Runs both implementations on the raw Leonardo kid/librarian sprites in
+assets/sprites (full size, before keying and downscaling),
+checks the outputs are pixel-identical and prints the speedup.
+
+Usage: python bench_chroma_key.py [--repeat N] [files...]
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+from chroma_key import key_color, key_corners
+
+
+def legacy_key_corners(img):
+    """The original process_sprite loop from generate_enhanced_wetcat.py"""
+    data = img.getdata()
+    new_data = []
+    bg_samples = [
+        img.getpixel((0, 0)),
+        img.getpixel((img.width-1, 0)),
+        img.getpixel((0, img.height-1)),
+        img.getpixel((img.width-1, img.height-1))
+    ]
+    for item in data:
+        is_bg = any(all(abs(item[i] - bg[i]) < 30 for i in range(3)) for bg in bg_samples)
+        if is_bg or item[3] < 50:
+            new_data.append((0, 0, 0, 0))
+        else:
+            new_data.append(item)
+    out = img.copy()
+    out.putdata(new_data)
+    return out
+
+
+def legacy_key_color(img, tolerance=50):
+    """The original remove_background loop from fix_transparency.py"""
+    bg_color = img.getpixel((0, 0))
+    data = img.getdata()
+    new_data = []
+    for item in data:
+        if all(abs(item[i] - bg_color[i]) < tolerance for i in range(3)):
+            new_data.append((255, 255, 255, 0))
+        else:
+            new_data.append(item)
+    out = img.copy()
+    out.putdata(new_data)
+    return out
+
+
+def best_of(fn, img, repeat):
+    """Return (best wall time, last result) over `repeat` runs"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(img)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    files = args.files or sorted(
+        glob.glob("assets/sprites/kid*.png") + glob.glob("assets/sprites/librarian_*.png")
+    )
+    if not files:
+        print("❌ No sprites found - run from the repository root")
+        return
+
+    pairs = [
+        ("corners", legacy_key_corners, key_corners),
+        ("color", legacy_key_color, key_color),
+    ]
+    totals = {name: [0.0, 0.0] for name, _, _ in pairs}
+
+    print(f"{'file':<24} {'size':>10} {'mode':<8} {'loop':>9} {'numpy':>9} {'speedup':>8}")
+    print("-" * 72)
+    for path in files:
+        img = Image.open(path).convert("RGBA")
+        size = f"{img.width}x{img.height}"
+        for name, legacy, vectorized in pairs:
+            loop_time, expected = best_of(legacy, img, 1)
+            np_time, actual = best_of(vectorized, img, args.repeat)
+            if not np.array_equal(np.asarray(expected), np.asarray(actual)):
+                print(f"❌ Output mismatch for {path} ({name})")
+                return
+            totals[name][0] += loop_time
+            totals[name][1] += np_time
+            print(f"{os.path.basename(path):<24} {size:>10} {name:<8} "
+                  f"{loop_time * 1000:>7.1f}ms {np_time * 1000:>7.1f}ms {loop_time / np_time:>7.1f}x")
+
+    print("-" * 72)
+    for name, (loop_total, np_total) in totals.items():
+        print(f"✅ {name}: {loop_total:.2f}s -> {np_total:.3f}s ({loop_total / np_total:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Polling benchmark - fixed 2s polls vs adaptive polls vs webhooks
+Runs the same batch against the local Leonardo stub in each mode and
+prints the mean time from submission to image bytes, plus status polls made.
+
+Usage: python bench_polling.py [--jobs 8] [--latency 3.3]
+"""
+
+import argparse
+import secrets
+import statistics
+
+from adaptive_polling import AdaptivePoller, CompletionHistory, FixedPoller
+from callback_receiver import CallbackReceiver
+from generation_scheduler import GenerationJob, GenerationScheduler
+from leonardo_stub_server import start_stub_server
+
+
+def make_jobs(count):
+    return [GenerationJob(f'asset_{i}', {'prompt': f'wet cat {i}', 'modelId': 'bench', 'width': 256, 'height': 256})
+            for i in range(count)]
+
+
+def run_mode(label, count, latency, poller, callbacks=False):
+    token = secrets.token_hex(16)
+    receiver = CallbackReceiver(token) if callbacks else None
+    server, base_url = start_stub_server(latency=latency, callback_url=receiver.url if receiver else None,
+                                         callback_token=token)
+    try:
+        jobs = make_jobs(count)
+        scheduler = GenerationScheduler('bench', base_url=base_url, max_concurrency=count, rate_limit=0,
+                                        poller=poller, callbacks=receiver, verbose=False)
+        scheduler.run(jobs)
+        times = [job.time_to_image for job in jobs if job.time_to_image is not None]
+        print(f"{label:<28} {statistics.mean(times):>8.2f}s {max(times):>8.2f}s {server.state.polls:>8}")
+    finally:
+        server.shutdown()
+        server.server_close()
+        if receiver:
+            receiver.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare Leonardo polling strategies")
+    parser.add_argument('--jobs', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=3.3, help="stub generation time in seconds")
+    args = parser.parse_args()
+
+    print(f"{'mode':<28} {'mean':>9} {'max':>9} {'polls':>8}")
+    print("-" * 56)
+    run_mode("fixed 2s", args.jobs, args.latency, FixedPoller(2.0))
+    history = CompletionHistory()
+    run_mode("adaptive (no history)", args.jobs, args.latency, AdaptivePoller(history))
+    run_mode("adaptive (warm history)", args.jobs, args.latency, AdaptivePoller(history))
+    run_mode("webhooks", args.jobs, args.latency, AdaptivePoller(), callbacks=True)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Local receiver for Leonardo AI generation webhooks
+When a webhook callback URL is configured for the API key, Leonardo POSTs
+each finished generation to it. Pointing that URL at this receiver (directly
+or through a tunnel) lets GenerationScheduler learn about completions the
+moment they happen instead of polling for them.
+
+Enable it for the generator scripts with LEONARDO_CALLBACK_PORT=8787 and
+LEONARDO_CALLBACK_TOKEN set to the webhook's bearer token. The receiver only
+listens on 127.0.0.1 (expose it through a tunnel) and rejects any POST
+without the token: a forged completion would make the scheduler download an
+arbitrary URL into the sprite tree.
+"""
+
+import hmac
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def parse_webhook(body):
+    """(generation_id, status, image_url) from a webhook payload, or None"""
+    data = body.get('data', {}).get('object', body)
+    generation_id = data.get('id') or data.get('generationId')
+    if not generation_id:
+        return None
+    images = data.get('images') or data.get('generated_images') or []
+    status = data.get('status') or ('COMPLETE' if images else 'FAILED')
+    return generation_id, status, (images[0]['url'] if images else None)
+
+
+class CallbackHandler(BaseHTTPRequestHandler):
+    receiver = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        expected = f"Bearer {self.receiver.token}".encode()
+        if not hmac.compare_digest(self.headers.get('Authorization', '').encode(), expected):
+            self.send_response(401)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        try:
+            event = parse_webhook(json.loads(body or b'{}'))
+        except (ValueError, AttributeError, KeyError, IndexError):
+            event = None
+        self.send_response(200 if event else 400)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        if event:
+            self.receiver.push(*event)
+
+
+class CallbackReceiver:
+    """
+    Collects pushed completions; the scheduler wait()s on it and take()s
+    results by generation ID. Every POST must carry `Authorization: Bearer <token>`.
+    """
+
+    def __init__(self, token, host='127.0.0.1', port=0):
+        if not token:
+            raise ValueError("CallbackReceiver needs a bearer token to authenticate webhooks")
+        self.token = token
+        self.events = {}
+        self.lock = threading.Lock()
+        self.arrived = threading.Event()
+        handler = type('BoundCallbackHandler', (CallbackHandler,), {'receiver': self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}/"
+
+    def push(self, generation_id, status, url):
+        with self.lock:
+            self.events[generation_id] = (status, url)
+        self.arrived.set()
+
+    def wait(self, timeout):
+        """
+        Block until a new completion arrives or `timeout` seconds pass. The
+        wakeup is cleared here, before the caller's take() calls, so anything
+        pushed after those calls look sets it again and the next wait() returns
+        at once instead of sleeping through it.
+        """
+        if self.arrived.wait(timeout):
+            self.arrived.clear()
+
+    def take(self, generation_id):
+        """(status, url) pushed for a generation, or None"""
+        with self.lock:
+            return self.events.pop(generation_id, None)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def callback_receiver_from_env():
+    """A CallbackReceiver on $LEONARDO_CALLBACK_PORT, or None when it isn't set"""
+    port = os.environ.get('LEONARDO_CALLBACK_PORT')
+    if not port:
+        return None
+    token = os.environ.get('LEONARDO_CALLBACK_TOKEN')
+    if not token:
+        raise RuntimeError("LEONARDO_CALLBACK_PORT is set but LEONARDO_CALLBACK_TOKEN isn't: "
+                           "webhooks can't be accepted without authentication")
+    receiver = CallbackReceiver(token, port=int(port))
+    print(f"📬 Listening for Leonardo webhooks on port {receiver.port}")
+    return receiver
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+WETCAT Chroma Key - Vectorized background removal
+Works on whole RGBA arrays instead of walking img.getdata() pixel by pixel.
+Requires: numpy, Pillow
+"""
+
+import numpy as np
+from PIL import Image
+
+TRANSPARENT_BLACK = (0, 0, 0, 0)
+TRANSPARENT_WHITE = (255, 255, 255, 0)
+
+
+def to_rgba_array(img):
+    """Return an (H, W, 4) uint8 array for any PIL image"""
+    return np.asarray(img.convert("RGBA"), dtype=np.uint8)
+
+
+def corner_colors(rgba):
+    """Sample the four corner pixels (top-left, top-right, bottom-left, bottom-right)"""
+    return rgba[[0, 0, -1, -1], [0, -1, 0, -1]]
+
+
+def color_match_mask(rgba, colors, tolerance):
+    """
+    True where a pixel's RGB is within `tolerance` (strictly less than,
+    per channel) of ANY of the given colors.
+    """
+    rgb = rgba[..., :3].astype(np.int16)
+    colors = np.asarray(colors, dtype=np.int16)
+    colors = colors.reshape(-1, colors.shape[-1])[:, :3]
+    mask = np.zeros(rgba.shape[:2], dtype=bool)
+    for color in colors:
+        mask |= (np.abs(rgb - color) < tolerance).all(axis=-1)
+    return mask
+
+
+def background_mask(rgba, tolerance=30, alpha_cutoff=50, opaque_corners_only=False):
+    """
+    Mask of pixels to clear: anything matching one of the corner samples
+    or already mostly transparent (alpha < alpha_cutoff).
+
+    With `opaque_corners_only`, transparent corners are not used as key
+    colors, so re-keying an already transparent sprite doesn't eat its
+    black or white outline.
+    """
+    corners = corner_colors(rgba)
+    if opaque_corners_only:
+        corners = corners[corners[:, 3] >= (alpha_cutoff or 1)]
+    mask = color_match_mask(rgba, corners, tolerance)
+    if alpha_cutoff is not None:
+        mask |= rgba[..., 3] < alpha_cutoff
+    return mask
+
+
+def apply_mask(rgba, mask, fill=TRANSPARENT_BLACK):
+    """Return a copy of `rgba` with masked pixels replaced by `fill`"""
+    out = rgba.copy()
+    out[mask] = fill
+    return out
+
+
+def key_corners(img, tolerance=30, alpha_cutoff=50, fill=TRANSPARENT_BLACK, opaque_corners_only=False):
+    """Remove a background sampled from all four corners (Leonardo sprites)"""
+    rgba = to_rgba_array(img)
+    mask = background_mask(rgba, tolerance, alpha_cutoff, opaque_corners_only)
+    return Image.fromarray(apply_mask(rgba, mask, fill), "RGBA")
+
+
+def key_color(img, color=None, tolerance=50, fill=TRANSPARENT_WHITE):
+    """Remove a single background color (defaults to the top-left pixel)"""
+    rgba = to_rgba_array(img)
+    if color is None:
+        color = rgba[0, 0]
+    mask = color_match_mask(rgba, [color], tolerance)
+    return Image.fromarray(apply_mask(rgba, mask, fill), "RGBA")
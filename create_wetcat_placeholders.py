@@ -1,94 +1,213 @@
-from PIL import Image, ImageDraw, ImageFont
+#!/usr/bin/env python3
+"""
+WETCAT Placeholder Generator
+Draws the character placeholders, the menu background and a batch of flat
+placeholder sprites matching AssetLoader.generatePlaceholderAssets. Fonts
+come from font_resolver (looked up once per size) and the background's
+repeated '$' is rendered once and tiled.
+
+With --atlas, the AssetLoader placeholders are instead baked into
+src/assets/sprites/placeholders.json + sheet (published to public/ by
+asset_fingerprint.py), which the game loads at startup
+rather than drawing canvases.
+
+Usage: python create_wetcat_placeholders.py [--out wetcat_assets] [--scales 1,2] [--specs specs.json]
+       python create_wetcat_placeholders.py --atlas
+"""
+
+import argparse
+import json
 import os
+import time
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from asset_fingerprint import fingerprint_assets
+from asset_manifest import SPRITE_DIRS
+from atlas_packer import build_atlas
+from font_resolver import get_font
 
-# Create output directory
-output_dir = "wetcat_assets"
-os.makedirs(output_dir, exist_ok=True)
+OUTPUT_DIR = "wetcat_assets"
+PLACEHOLDER_DIR = "placeholders"
+PLACEHOLDER_ATLAS = os.path.join(SPRITE_DIRS[0], "placeholders")
 
-# Create WETCAT character sprites (simple placeholder)
-def create_wetcat_sprite(filename, text):
-    # Create a 256x256 image with transparent background
+# Same names, sizes, colors and labels as AssetLoader.generatePlaceholderAssets
+PLACEHOLDER_SPECS = [
+    {"name": "wetcat", "width": 48, "height": 64, "color": "#4169E1", "text": "W"},
+    {"name": "wetcatStand", "width": 48, "height": 64, "color": "#4169E1", "text": "W"},
+    {"name": "wetcatWalk1", "width": 48, "height": 64, "color": "#4169E1", "text": "W1"},
+    {"name": "wetcatWalk2", "width": 48, "height": 64, "color": "#4169E1", "text": "W2"},
+    {"name": "scammer1Stand", "width": 32, "height": 48, "color": "#FF6347", "text": "S1"},
+    {"name": "scammer1Walk", "width": 32, "height": 48, "color": "#FF6347", "text": "S1"},
+    {"name": "scammer2Stand", "width": 32, "height": 48, "color": "#FFA500", "text": "S2"},
+    {"name": "scammer2Walk", "width": 32, "height": 48, "color": "#FFA500", "text": "S2"},
+    {"name": "scammer3Stand", "width": 32, "height": 48, "color": "#FF69B4", "text": "S3"},
+    {"name": "scammer3Walk", "width": 32, "height": 48, "color": "#FF69B4", "text": "S3"},
+    {"name": "coin", "width": 24, "height": 24, "color": "#FFD700", "text": "$"},
+    {"name": "wallet", "width": 64, "height": 64, "color": "#8B4513", "text": "W"},
+    {"name": "woodFloor", "width": 512, "height": 512, "color": "#8B6F47", "text": ""},
+    {"name": "tiles", "width": 32, "height": 32, "color": "#D2691E", "text": ""},
+]
+
+BACKGROUND_SIZE = (1280, 720)
+BACKGROUND_COLOR = (20, 20, 50)
+# One '$' every 64x60 pixels, as the old per-glyph loop drew them
+GLYPH_CELL = (64, 60)
+
+
+def create_wetcat_sprite(filename, text, output_dir=OUTPUT_DIR):
+    """256x256 placeholder wet cat with a label"""
     img = Image.new('RGBA', (256, 256), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
-    
-    # Draw a simple wet cat shape
+
     # Body (oval)
     draw.ellipse([80, 100, 176, 200], fill=(100, 100, 200, 255), outline=(50, 50, 150, 255), width=3)
-    
+
     # Head (circle)
     draw.ellipse([96, 60, 160, 124], fill=(120, 120, 220, 255), outline=(70, 70, 170, 255), width=3)
-    
+
     # Ears (triangles)
     draw.polygon([(100, 80), (90, 60), (110, 70)], fill=(120, 120, 220, 255), outline=(70, 70, 170, 255))
     draw.polygon([(156, 80), (166, 60), (146, 70)], fill=(120, 120, 220, 255), outline=(70, 70, 170, 255))
-    
+
     # Eyes
     draw.ellipse([110, 85, 120, 95], fill=(255, 255, 255, 255))
     draw.ellipse([136, 85, 146, 95], fill=(255, 255, 255, 255))
     draw.ellipse([113, 88, 117, 92], fill=(0, 0, 0, 255))
     draw.ellipse([139, 88, 143, 92], fill=(0, 0, 0, 255))
-    
+
     # $ symbol on body
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
-    except:
-        font = ImageFont.load_default()
-    draw.text((115, 130), "$", fill=(255, 215, 0, 255), font=font)
-    
+    draw.text((115, 130), "$", fill=(255, 215, 0, 255), font=get_font(40))
+
     # Water drops
     for i in range(5):
         x = 90 + i * 20
         y = 210 + (i % 2) * 10
         draw.ellipse([x, y, x+8, y+12], fill=(100, 150, 255, 200))
-    
-    # Add text label
+
+    # Label
     draw.text((128, 230), text, fill=(255, 255, 255, 255), anchor="mm")
-    
+
     img.save(os.path.join(output_dir, filename))
     print(f"Created: {filename}")
 
-# Create character sprites
-create_wetcat_sprite("wetcat_stand.png", "STAND")
-create_wetcat_sprite("wetcat_walk1.png", "WALK1")
-create_wetcat_sprite("wetcat_walk2.png", "WALK2")
-
-# Create menu background
-menu_bg = Image.new('RGB', (1280, 720), (20, 20, 50))
-draw = ImageDraw.Draw(menu_bg)
-
-# Add crypto-themed elements
-for i in range(20):
-    x = i * 64
-    for j in range(12):
-        y = j * 60
-        # Draw dollar signs in background
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
-        except:
-            font = ImageFont.load_default()
-        draw.text((x, y), "$", fill=(50, 50, 100, 100), font=font)
-
-# Add title
-try:
-    title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 80)
-except:
-    title_font = ImageFont.load_default()
-    
-draw.text((640, 200), "$WETCAT", fill=(255, 215, 0), font=title_font, anchor="mm")
-draw.text((640, 300), "SURVIVORS", fill=(255, 255, 255), font=title_font, anchor="mm")
-
-# Add "Get Soaked!" tagline
-try:
-    tag_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
-except:
-    tag_font = ImageFont.load_default()
-draw.text((640, 400), "Get Soaked in the Crypto Chaos!", fill=(100, 200, 255), font=tag_font, anchor="mm")
-
-menu_bg.save(os.path.join(output_dir, "menu_background.jpg"))
-print("Created: menu_background.jpg")
-
-print(f"\nPlaceholder assets created in '{output_dir}' folder!")
-print("\nTo use these assets:")
-print("1. Copy wetcat_*.png to src/assets/sprites/")
-print("2. Copy menu_background.jpg to assets/")
-print("3. Update the game code to use the new sprites")
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def glyph_tile(glyph, font_size, cell, background, fill):
+    """One cell of the repeating pattern as an array (rendered once per style)"""
+    tile = Image.new('RGB', cell, background)
+    ImageDraw.Draw(tile).text((0, 0), glyph, fill=fill, font=get_font(font_size))
+    return np.asarray(tile)
+
+
+def tiled_pattern(size, tile):
+    """Repeat a tile array across `size`, cropping the last row/column"""
+    width, height = size
+    rows = -(-height // tile.shape[0])
+    cols = -(-width // tile.shape[1])
+    return Image.fromarray(np.tile(tile, (rows, cols, 1))[:height, :width])
+
+
+def create_menu_background(output_dir=OUTPUT_DIR):
+    tile = glyph_tile("$", 30, GLYPH_CELL, BACKGROUND_COLOR, (50, 50, 100))
+    menu_bg = tiled_pattern(BACKGROUND_SIZE, tile)
+    draw = ImageDraw.Draw(menu_bg)
+
+    title_font = get_font(80)
+    draw.text((640, 200), "$WETCAT", fill=(255, 215, 0), font=title_font, anchor="mm")
+    draw.text((640, 300), "SURVIVORS", fill=(255, 255, 255), font=title_font, anchor="mm")
+    draw.text((640, 400), "Get Soaked in the Crypto Chaos!", fill=(100, 200, 255), font=get_font(40), anchor="mm")
+
+    menu_bg.save(os.path.join(output_dir, "menu_background.jpg"))
+    print("Created: menu_background.jpg")
+
+
+def placeholder_image(width, height, color="#888888", text=""):
+    """Python twin of AssetLoader.createPlaceholderImage: fill, 2px black border, centered white label"""
+    img = Image.new('RGBA', (width, height), color)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, width - 1, height - 1], outline=(0, 0, 0, 255), width=2)
+    if text:
+        size = max(1, int(min(width, height) * 0.2))
+        draw.text((width / 2, height / 2), text, fill=(255, 255, 255, 255), font=get_font(size), anchor="mm")
+    return img
+
+
+def placeholder_filename(spec, scale=1):
+    return f"{spec['name']}.png" if scale == 1 else f"{spec['name']}@{scale}x.png"
+
+
+def generate_placeholders(specs=PLACEHOLDER_SPECS, output_dir=os.path.join(OUTPUT_DIR, PLACEHOLDER_DIR),
+                          scales=(1,)):
+    """Write one PNG per spec and scale; returns the paths written"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for spec in specs:
+        for scale in scales:
+            img = placeholder_image(spec["width"] * scale, spec["height"] * scale,
+                                    spec.get("color", "#888888"), spec.get("text", ""))
+            path = os.path.join(output_dir, placeholder_filename(spec, scale))
+            # Throwaway art: favour speed over size
+            img.save(path, compress_level=1)
+            paths.append(path)
+    return paths
+
+
+def bake_placeholder_atlas(specs=PLACEHOLDER_SPECS, out_prefix=PLACEHOLDER_ATLAS):
+    """Pack every placeholder into one sheet + JSON; identical placeholders share a frame"""
+    frames = []
+    aliases = {}
+    packed = {}
+    for spec in specs:
+        img = placeholder_image(spec["width"], spec["height"], spec.get("color", "#888888"), spec.get("text", ""))
+        pixels = (img.size, img.tobytes())
+        if pixels in packed:
+            aliases[spec["name"]] = packed[pixels]
+            continue
+        packed[pixels] = spec["name"]
+        frames.append({"key": spec["name"], "name": spec["name"], "image": img,
+                       "offset": (0, 0), "source_size": img.size})
+    return build_atlas(frames, out_prefix, aliases=aliases)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate WETCAT placeholder art")
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    parser.add_argument("--scales", default="1", help="comma-separated scale factors, e.g. 1,2")
+    parser.add_argument("--specs", help="JSON list of {name, width, height, color, text} (default: AssetLoader's set)")
+    parser.add_argument("--atlas", action="store_true",
+                        help=f"only bake the placeholder atlas ({PLACEHOLDER_ATLAS}.json) and refresh the asset manifest")
+    args = parser.parse_args()
+
+    specs = PLACEHOLDER_SPECS
+    if args.specs:
+        with open(args.specs) as f:
+            specs = json.load(f)
+
+    if args.atlas:
+        atlas = bake_placeholder_atlas(specs)
+        for sheet in atlas["meta"]["sheets"]:
+            print(f"✅ {sheet['image']} ({sheet['size']['w']}x{sheet['size']['h']})")
+        print(f"🎮 Baked {len(atlas['frames'])} placeholders into {PLACEHOLDER_ATLAS}.json")
+        fingerprint_assets()
+        raise SystemExit
+
+    os.makedirs(args.out, exist_ok=True)
+    scales = [int(scale) for scale in args.scales.split(",")]
+
+    start = time.perf_counter()
+    create_wetcat_sprite("wetcat_stand.png", "STAND", args.out)
+    create_wetcat_sprite("wetcat_walk1.png", "WALK1", args.out)
+    create_wetcat_sprite("wetcat_walk2.png", "WALK2", args.out)
+    create_menu_background(args.out)
+    paths = generate_placeholders(specs, os.path.join(args.out, PLACEHOLDER_DIR), scales)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Created {len(paths)} placeholder sprites in '{os.path.join(args.out, PLACEHOLDER_DIR)}'")
+    print(f"\nPlaceholder assets created in '{args.out}' folder in {elapsed:.0f}ms!")
+    print("\nTo use these assets:")
+    print("1. Copy wetcat_*.png to src/assets/sprites/")
+    print("2. Copy menu_background.jpg to assets/")
+    print("3. Update the game code to use the new sprites")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+WETCAT Effect Sprites
+Pre-renders the particle effects the game used to draw with fillText and
+paths every frame: the "$" coin glyph at several sizes and rotations, the
+round splash/spark discs and the sparkle cross at each stage of its
+twinkle. Everything is packed into one atlas (src/assets/sprites/effects.json + sheet) whose "meta"
+says which sizes, rotations and colours exist, so the runtime can pick
+the nearest frame and blit it with drawImage. Frames are drawn at 4x and
+downsampled, so edges are antialiased like the canvas versions.
+
+Usage: python effect_sprites.py [--out src/assets/sprites/effects]
+"""
+
+import argparse
+import math
+import os
+
+from PIL import Image, ImageDraw
+
+from asset_fingerprint import fingerprint_assets
+from asset_manifest import SPRITE_DIRS
+from atlas_packer import build_atlas, trim
+from font_resolver import get_font
+
+EFFECTS_ATLAS = os.path.join(SPRITE_DIRS[0], "effects")
+SUPERSAMPLE = 4
+
+# Colours match ParticleSystem's emit() configs (splash is a #4FC3F7 disc,
+# the default particle a disc in its own colour); a particle with a colour
+# that isn't baked is still drawn as vectors
+EFFECTS = {
+    "dollar": {"color": "#FFD93D", "sizes": [12, 16, 24], "rotations": 16},
+    "disc": {"colors": ["#4FC3F7", "#FFD93D", "#9C27B0"], "sizes": [2, 3, 4, 6]},
+    "sparkle": {"colors": ["#FFEB3B"], "sizes": [8], "steps": 8, "lineWidth": 2},
+}
+
+
+def color_key(color):
+    return color.lstrip("#").lower()
+
+
+def canvas(side):
+    """Supersampled transparent square and its centre (in supersampled pixels)"""
+    img = Image.new("RGBA", (side * SUPERSAMPLE, side * SUPERSAMPLE), (0, 0, 0, 0))
+    return img, side * SUPERSAMPLE / 2
+
+
+def downsample(img):
+    return img.resize((img.width // SUPERSAMPLE, img.height // SUPERSAMPLE), Image.BOX)
+
+
+def even_side(extent):
+    """Smallest even frame side holding `extent` pixels, so the centre lands on a pixel corner"""
+    side = math.ceil(extent) + 2
+    return side + side % 2
+
+
+def render_dollar(size, angle, color):
+    """fillText('$') at `size`px, centred and rotated by `angle` radians (clockwise, like ctx.rotate)"""
+    img, centre = canvas(even_side(size * 1.5))
+    ImageDraw.Draw(img).text((centre, centre), "$", font=get_font(size * SUPERSAMPLE), fill=color, anchor="mm")
+    return downsample(img.rotate(-math.degrees(angle), Image.BICUBIC, center=(centre, centre)))
+
+
+def render_disc(radius, color):
+    img, centre = canvas(even_side(radius * 2))
+    r = radius * SUPERSAMPLE
+    ImageDraw.Draw(img).ellipse([centre - r, centre - r, centre + r, centre + r], fill=color)
+    return downsample(img)
+
+
+def render_sparkle(size, arm, color, line_width):
+    """The sparkle's cross: two `line_width` strokes reaching `arm` px from the centre"""
+    img, centre = canvas(even_side(size * 2 + line_width))
+    draw = ImageDraw.Draw(img)
+    a, w = arm * SUPERSAMPLE, line_width * SUPERSAMPLE / 2
+    draw.rectangle([centre - a, centre - w, centre + a - 1, centre + w - 1], fill=color)
+    draw.rectangle([centre - w, centre - a, centre + w - 1, centre + a - 1], fill=color)
+    return downsample(img)
+
+
+def effect_frames(effects=EFFECTS):
+    """{frame name: untrimmed image}; names are what EffectSprites in ParticleSystem.js looks up"""
+    frames = {}
+    dollar = effects["dollar"]
+    for size in dollar["sizes"]:
+        for step in range(dollar["rotations"]):
+            angle = 2 * math.pi * step / dollar["rotations"]
+            frames[f"fx_dollar_{size}_{step}"] = render_dollar(size, angle, dollar["color"])
+
+    for color in effects["disc"]["colors"]:
+        for size in effects["disc"]["sizes"]:
+            frames[f"fx_disc_{color_key(color)}_{size}"] = render_disc(size, color)
+
+    sparkle = effects["sparkle"]
+    for color in sparkle["colors"]:
+        for size in sparkle["sizes"]:
+            for step in range(1, sparkle["steps"] + 1):
+                arm = size * step / sparkle["steps"]
+                frames[f"fx_sparkle_{color_key(color)}_{size}_{step}"] = render_sparkle(
+                    size, arm, color, sparkle["lineWidth"])
+    return frames
+
+
+def bake_effects(out_prefix=EFFECTS_ATLAS, effects=EFFECTS):
+    """Pack every effect frame into one atlas; its meta lists what was rendered"""
+    frames = []
+    for name, img in effect_frames(effects).items():
+        trimmed, offset = trim(img)
+        frames.append({"key": name, "name": name, "image": trimmed, "offset": offset, "source_size": img.size})
+    return build_atlas(frames, out_prefix, meta={"effects": effects})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render particle effects into a sprite sheet")
+    parser.add_argument("--out", default=EFFECTS_ATLAS, help="atlas prefix (writes <out>.json and <out>_N.png)")
+    args = parser.parse_args()
+
+    atlas = bake_effects(args.out)
+    for sheet in atlas["meta"]["sheets"]:
+        print(f"✅ {sheet['image']} ({sheet['size']['w']}x{sheet['size']['h']})")
+    print(f"✨ Baked {len(atlas['frames'])} effect frames into {args.out}.json")
+    fingerprint_assets()
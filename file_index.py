@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Persistent incremental file index
+Remembers (size, mtime, sha256, rule version) for every file a tool has
+processed, so the next run only re-reads files whose stat() changed and only
+reprocesses files whose content or rule version changed. Ignored directories
+are pruned before descending into them.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from sprite_processing import write_atomic
+
+INDEX_VERSION = 1
+SKIP_DIRS = {"node_modules", ".git", "dist", "__pycache__", ".leonardo_cache"}
+
+# A file modified this close to when it was indexed may change again within
+# the same mtime tick, so its stat() can't be trusted on the next run
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def sha256_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan(roots, suffixes=None, skip_dirs=SKIP_DIRS):
+    """Yield (path, stat) for files under `roots`; skipped directories are never entered"""
+    stack = []
+    for root in roots:
+        if os.path.isfile(root):
+            yield root, os.stat(root)
+        elif os.path.isdir(root):
+            stack.append(root)
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name, reverse=True)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    stack.append(entry.path)
+            elif entry.is_file() and (suffixes is None or entry.name.lower().endswith(suffixes)):
+                yield entry.path, entry.stat()
+
+
+class FileIndex:
+    """
+    JSON-backed {path: {size, mtime_ns, sha256, rule_version, racy}}.
+    `rule_version` identifies whatever processing the owning tool applies;
+    entries recorded under another version count as changed.
+    """
+
+    def __init__(self, path, rule_version=""):
+        self.path = path
+        self.rule_version = rule_version
+        self.files = self.load()
+        self.seen = set()
+        self.dirty = False
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get("files", {}) if data.get("version") == INDEX_VERSION else {}
+
+    def save(self):
+        if not self.dirty and os.path.exists(self.path):
+            return
+        self.dirty = False
+        write_atomic(self.path, json.dumps({"version": INDEX_VERSION, "files": self.files},
+                                           indent=2, sort_keys=True).encode())
+
+    def scan(self, roots, suffixes=None, skip_dirs=SKIP_DIRS):
+        for path, st in scan(roots, suffixes, skip_dirs):
+            self.seen.add(path)
+            yield path, st
+
+    def stat_matches(self, entry, st):
+        return (entry is not None and not entry.get("racy")
+                and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns)
+
+    def hash(self, path, st=None):
+        """sha256 of `path`, read from disk only when its stat() changed"""
+        st = st or os.stat(path)
+        entry = self.files.get(path)
+        if self.stat_matches(entry, st):
+            return entry["sha256"]
+        digest = sha256_file(path)
+        processed = entry is not None and entry["sha256"] == digest
+        self.files[path] = self.entry(st, digest, entry["rule_version"] if processed else None)
+        self.dirty = True
+        return digest
+
+    def unchanged(self, path, st=None):
+        """True if `path` was processed under the current rule version and its content hasn't changed since"""
+        st = st or os.stat(path)
+        entry = self.files.get(path)
+        if entry is None or entry.get("rule_version") != self.rule_version:
+            return False
+        if self.stat_matches(entry, st):
+            return True
+        recorded = entry["sha256"]
+        # Touched but identical: refresh the stat so the next run skips the read
+        return self.hash(path, st) == recorded
+
+    def entry(self, st, digest, rule_version):
+        return {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": digest,
+            "rule_version": rule_version,
+            "racy": st.st_mtime_ns >= time.time_ns() - RACY_WINDOW_NS
+        }
+
+    def record(self, path, digest=None):
+        """Mark `path` as processed under the current rule version (hashing it if `digest` isn't given)"""
+        st = os.stat(path)
+        self.files[path] = self.entry(st, digest or sha256_file(path), self.rule_version)
+        self.dirty = True
+
+    def prune(self):
+        """Forget deleted files (only stat()s entries this run's scans didn't see)"""
+        for path in set(self.files) - self.seen:
+            if not os.path.exists(path):
+                del self.files[path]
+                self.dirty = True
@@ -1,46 +1,29 @@
-from PIL import Image
 import os
+from batch_process import run_batch
 
-def remove_background(filepath, tolerance=50):
-    """Remove background color and make it transparent"""
-    if not os.path.exists(filepath):
-        print(f"❌ File not found: {filepath}")
-        return
-    
-    img = Image.open(filepath)
-    img = img.convert("RGBA")
-    
-    # Get the background color from top-left corner
-    bg_color = img.getpixel((0, 0))
-    
-    # Create a new image with transparency
-    data = img.getdata()
-    new_data = []
-    
-    for item in data:
-        # Check if pixel is similar to background color
-        if all(abs(item[i] - bg_color[i]) < tolerance for i in range(3)):
-            # Make it transparent
-            new_data.append((255, 255, 255, 0))
-        else:
-            # Keep the pixel
-            new_data.append(item)
-    
-    img.putdata(new_data)
-    img.save(filepath)
-    print(f"✅ Fixed transparency for {filepath}")
+def remove_background_tasks(filepaths, tolerance=50):
+    """Batch tasks that make each sprite's background color transparent"""
+    tasks = []
+    for filepath in filepaths:
+        if not os.path.exists(filepath):
+            print(f"❌ File not found: {filepath}")
+            continue
+        tasks.append((filepath, [filepath], [("key_color", tolerance)]))
+    return tasks
 
 # Fix transparency for all WETCAT sprites
 sprites = [
-    "public/sprites/wetcat_stand.png",
-    "public/sprites/wetcat_walk1.png", 
-    "public/sprites/wetcat_walk2.png",
     "src/assets/sprites/wetcat_stand.png",
     "src/assets/sprites/wetcat_walk1.png",
     "src/assets/sprites/wetcat_walk2.png"
 ]
 
-for sprite in sprites:
-    remove_background(sprite)
+if __name__ == "__main__":
+    # Every sprite is keyed in its own worker process
+    for filepath, _, error in run_batch(remove_background_tasks(sprites)):
+        if error:
+            print(f"❌ {filepath}: {error}")
+        else:
+            print(f"✅ Fixed transparency for {filepath}")
 
-print("\n🎨 Transparency fixed for all WETCAT sprites!")
\ No newline at end of file
+    print("\n🎨 Transparency fixed for all WETCAT sprites!")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Cached, platform-aware font lookup for the PIL asset scripts
+The first existing candidate for this OS is found once; each size is
+loaded once. Set WETCAT_FONT to a .ttf/.ttc path to override.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+from PIL import ImageFont
+
+FONT_CANDIDATES = {
+    "darwin": [
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+        "/Library/Fonts/Arial.ttf",
+    ],
+    "win32": [
+        r"C:\Windows\Fonts\arial.ttf",
+        r"C:\Windows\Fonts\segoeui.ttf",
+    ],
+    "linux": [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "/usr/share/fonts/liberation-sans/LiberationSans-Regular.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+    ],
+}
+
+
+def font_candidates(platform=None):
+    platform = platform or sys.platform
+    override = os.environ.get("WETCAT_FONT")
+    key = "linux" if platform.startswith(("linux", "freebsd")) else platform
+    return ([override] if override else []) + FONT_CANDIDATES.get(key, [])
+
+
+@lru_cache(maxsize=None)
+def resolve_font_path(platform=None):
+    """First installed candidate font, or None (then PIL's built-in font is used)"""
+    return next((path for path in font_candidates(platform) if os.path.isfile(path)), None)
+
+
+@lru_cache(maxsize=None)
+def get_font(size):
+    path = resolve_font_path()
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1: fixed-size bitmap font only
+        return ImageFont.load_default()
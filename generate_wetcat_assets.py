@@ -1,8 +1,9 @@
-import requests
-import json
-import time
 import os
-from datetime import datetime
+from generation_cache import GenerationCache
+from adaptive_polling import HISTORY_FILE, AdaptivePoller, CompletionHistory
+from callback_receiver import callback_receiver_from_env
+from generation_scheduler import GenerationJob, GenerationScheduler
+from leonardo_client import LeonardoClient
 
 # Leonardo AI API configuration
 API_KEY = os.environ.get('LEONARDO_API_KEY', '')
@@ -10,21 +11,15 @@ if not API_KEY:
     print("Please set LEONARDO_API_KEY environment variable")
     exit(1)
 
-BASE_URL = "https://cloud.leonardo.ai/api/rest/v1"
+# One pooled, retrying session for every API and CDN call
+CLIENT = LeonardoClient(API_KEY)
 
-headers = {
-    "accept": "application/json",
-    "authorization": f"Bearer {API_KEY}",
-    "content-type": "application/json"
-}
+# Polls when jobs of the same model usually finish, learned across runs
+POLLER = AdaptivePoller(CompletionHistory(HISTORY_FILE))
 
-def generate_image(prompt, preset_style="ANIME", width=512, height=512, num_images=1):
-    """Generate an image using Leonardo AI"""
-    
-    # Create generation
-    generation_url = f"{BASE_URL}/generations"
-    
-    payload = {
+def build_payload(prompt, preset_style="ANIME", width=512, height=512, num_images=1):
+    """Build the Leonardo AI generation request for one asset"""
+    return {
         "prompt": prompt,
         "modelId": "6bef9f1b-29cb-40c7-b9df-32b51c1f67d3",  # Leonardo Anime XL
         "width": width,
@@ -34,46 +29,15 @@ def generate_image(prompt, preset_style="ANIME", width=512, height=512, num_imag
         "promptMagic": True,
         "public": False
     }
-    
-    response = requests.post(generation_url, json=payload, headers=headers)
-    
-    if response.status_code != 200:
-        print(f"Error creating generation: {response.text}")
-        return None
-        
-    generation_data = response.json()
-    generation_id = generation_data['sdGenerationJob']['generationId']
-    
-    print(f"Generation started with ID: {generation_id}")
-    
-    # Poll for completion
-    while True:
-        check_url = f"{BASE_URL}/generations/{generation_id}"
-        response = requests.get(check_url, headers=headers)
-        
-        if response.status_code != 200:
-            print(f"Error checking generation: {response.text}")
-            return None
-            
-        data = response.json()
-        status = data['generations_by_pk']['status']
-        
-        if status == 'COMPLETE':
-            images = data['generations_by_pk']['generated_images']
-            return images[0]['url'] if images else None
-        elif status == 'FAILED':
-            print("Generation failed")
-            return None
-            
-        print(f"Status: {status}... waiting")
-        time.sleep(2)
+
+def generate_image(prompt, preset_style="ANIME", width=512, height=512, num_images=1):
+    """Generate a single image using Leonardo AI and return its URL"""
+    job = GenerationJob(prompt[:60], build_payload(prompt, preset_style, width, height, num_images))
+    return GenerationScheduler(client=CLIENT, poller=POLLER).run([job])[job.name]
 
 def download_image(url, filename):
-    """Download image from URL"""
-    response = requests.get(url)
-    if response.status_code == 200:
-        with open(filename, 'wb') as f:
-            f.write(response.content)
+    """Stream an image to disk (verified, resumable, renamed into place when complete)"""
+    if CLIENT.download(url, filename) is not None:
         print(f"Downloaded: {filename}")
         return True
     return False
@@ -120,27 +84,30 @@ assets_to_generate = [
 output_dir = "generated_assets"
 os.makedirs(output_dir, exist_ok=True)
 
-for asset in assets_to_generate:
-    print(f"\nGenerating: {asset['name']}...")
-    
-    image_url = generate_image(
-        prompt=asset['prompt'],
-        preset_style=asset.get('preset_style', 'ANIME'),
-        width=asset['width'],
-        height=asset['height']
+jobs = [
+    GenerationJob(
+        asset['name'],
+        build_payload(
+            prompt=asset['prompt'],
+            preset_style=asset.get('preset_style', 'ANIME'),
+            width=asset['width'],
+            height=asset['height']
+        ),
+        path=os.path.join(output_dir, f"{asset['name']}.png")
     )
-    
-    if image_url:
-        filename = os.path.join(output_dir, f"{asset['name']}.png")
-        if download_image(image_url, filename):
-            print(f"Successfully generated {asset['name']}")
-        else:
-            print(f"Failed to download {asset['name']}")
+    for asset in assets_to_generate
+]
+
+# All assets render in parallel; the scheduler keeps us under the API rate limit
+scheduler = GenerationScheduler(max_concurrency=4, rate_limit=2.0, cache=GenerationCache(), client=CLIENT,
+                                poller=POLLER, callbacks=callback_receiver_from_env())
+results = scheduler.run(jobs)
+
+for name, url in results.items():
+    if url:
+        print(f"Successfully generated {name}")
     else:
-        print(f"Failed to generate {asset['name']}")
-    
-    # Be nice to the API
-    time.sleep(3)
+        print(f"Failed to generate {name}")
 
 print("\nAsset generation complete! Check the 'generated_assets' folder.")
 print("\nTo use these assets:")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for Leonardo AI generations
+Entries are keyed on a hash of the full generation payload (prompt, modelId,
+size, presetStyle, ...), so re-running a generator only submits the assets
+whose payload actually changed. Least recently used entries are evicted once
+the cache grows past `max_bytes`.
+
+Usage: python generation_cache.py [--clear]
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+CACHE_DIR = os.environ.get('LEONARDO_CACHE_DIR', '.leonardo_cache')
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+
+def payload_key(payload):
+    """Stable sha256 of a generation payload (key order doesn't matter)"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class GenerationCache:
+    """
+    On-disk cache layout:
+        <root>/index.json        key -> {size, last_access, created}
+        <root>/<key>.bin         downloaded image bytes
+        <root>/<key>.json        payload + metadata (name, url, generation id)
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.index_path = os.path.join(root, 'index.json')
+        os.makedirs(root, exist_ok=True)
+        self.index = self.load_index()
+
+    def load_index(self):
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Drop entries whose blobs were deleted behind our back
+        return {key: entry for key, entry in index.items() if os.path.exists(self.blob_path(key))}
+
+    def save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def blob_path(self, key):
+        return os.path.join(self.root, f"{key}.bin")
+
+    def meta_path(self, key):
+        return os.path.join(self.root, f"{key}.json")
+
+    def total_bytes(self):
+        return sum(entry['size'] for entry in self.index.values())
+
+    def __contains__(self, payload):
+        return payload_key(payload) in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def lookup(self, payload):
+        """Return (blob_path, metadata) for a cached payload, or None on a miss"""
+        key = payload_key(payload)
+        with self.lock:
+            if key not in self.index:
+                return None
+            self.index[key]['last_access'] = time.time()
+            self.save_index()
+        try:
+            with open(self.meta_path(key)) as f:
+                metadata = json.load(f).get('metadata', {})
+        except (OSError, ValueError):
+            metadata = {}
+        return self.blob_path(key), metadata
+
+    def get(self, payload):
+        """Return the cached bytes for a payload, or None on a miss"""
+        hit = self.lookup(payload)
+        if not hit:
+            return None
+        with open(hit[0], 'rb') as f:
+            return f.read()
+
+    def put(self, payload, data, metadata=None):
+        """Store downloaded bytes for a payload and evict old entries if needed"""
+        key = payload_key(payload)
+        blob_path = self.blob_path(key)
+        with open(blob_path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(blob_path + '.tmp', blob_path)
+        return self.record(key, payload, len(data), metadata)
+
+    def put_file(self, payload, path, metadata=None):
+        """Like put(), for an image already streamed to disk; copied in chunks, never read whole"""
+        key = payload_key(payload)
+        blob_path = self.blob_path(key)
+        # A copy, not a link: callers may rewrite their output in place
+        shutil.copyfile(path, blob_path + '.tmp')
+        os.replace(blob_path + '.tmp', blob_path)
+        return self.record(key, payload, os.path.getsize(blob_path), metadata)
+
+    def record(self, key, payload, size, metadata):
+        with open(self.meta_path(key), 'w') as f:
+            json.dump({'payload': payload, 'metadata': metadata or {}}, f, indent=2)
+
+        now = time.time()
+        with self.lock:
+            self.index[key] = {'size': size, 'created': now, 'last_access': now}
+            self.evict(keep=key)
+            self.save_index()
+        return self.blob_path(key)
+
+    def evict(self, keep=None):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = self.total_bytes()
+        for key in sorted(self.index, key=lambda k: self.index[k]['last_access']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self.index.pop(key)['size']
+            for path in (self.blob_path(key), self.meta_path(key)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def clear(self):
+        with self.lock:
+            for key in list(self.index):
+                for path in (self.blob_path(key), self.meta_path(key)):
+                    if os.path.exists(path):
+                        os.remove(path)
+            self.index = {}
+            self.save_index()
+
+
+if __name__ == "__main__":
+    import sys
+
+    cache = GenerationCache()
+    if '--clear' in sys.argv:
+        cache.clear()
+        print(f"🧹 Cleared {cache.root}")
+    else:
+        print(f"📦 {cache.root}: {len(cache)} entries, {cache.total_bytes() / 1024:.1f} KB "
+              f"(cap {cache.max_bytes / 1024 / 1024:.0f} MB)")
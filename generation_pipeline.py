@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Staged generation pipeline
+submit -> poll -> download -> process -> write, each stage on its own
+workers and joined by bounded queues. While one sprite is being
+chroma-keyed the next is downloading and others are still rendering
+remotely, so a batch takes about as long as its slowest stage instead of
+the sum of all of them. A full queue blocks the stage feeding it, which
+caps how many images are held in memory at once.
+"""
+
+import queue
+import threading
+import time
+
+# Tells a worker thread to exit
+STOP = object()
+
+
+class Stage:
+    """`workers` threads applying `func(item)` to items from a bounded inbox; None results are dropped"""
+
+    def __init__(self, name, func, workers=1, capacity=4):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.inbox = queue.Queue(capacity)
+        self.threads = []
+        self.lock = threading.Lock()
+        self.processed = 0
+        self.failed = 0
+        self.busy = 0.0
+
+    def stats(self, elapsed):
+        return {
+            'workers': self.workers,
+            'processed': self.processed,
+            'failed': self.failed,
+            'busy': self.busy,
+            # Share of the run this stage's workers spent working; the highest is the bottleneck
+            'utilization': self.busy / (elapsed * self.workers) if elapsed else 0.0
+        }
+
+
+class Pipeline:
+    """
+    Chains Stages: each result is put on the next stage's inbox (blocking
+    while it is full); results of the last stage are collected in `results`.
+    """
+
+    def __init__(self, stages, verbose=True):
+        self.stages = list(stages)
+        self.verbose = verbose
+        self.results = []
+        self.started_at = None
+        self.elapsed = None
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        for index, stage in enumerate(self.stages):
+            downstream = self.stages[index + 1] if index + 1 < len(self.stages) else None
+            for n in range(stage.workers):
+                thread = threading.Thread(target=self.work, args=(stage, downstream),
+                                          name=f"{stage.name}-{n}", daemon=True)
+                thread.start()
+                stage.threads.append(thread)
+        return self
+
+    def work(self, stage, downstream):
+        while True:
+            item = stage.inbox.get()
+            if item is STOP:
+                return
+            start = time.perf_counter()
+            try:
+                result = stage.func(item)
+            except Exception as e:
+                result = None
+                self.log(f"❌ {stage.name}: {item!r}: {e}")
+            busy = time.perf_counter() - start
+            with stage.lock:
+                stage.busy += busy
+                if result is None:
+                    stage.failed += 1
+                else:
+                    stage.processed += 1
+            if result is None:
+                continue
+            if downstream:
+                downstream.inbox.put(result)
+            else:
+                with stage.lock:
+                    self.results.append(result)
+
+    def put(self, item):
+        """Feed the first stage; blocks while its queue is full"""
+        self.stages[0].inbox.put(item)
+
+    def close(self):
+        """Drain every stage in order and wait for the workers; returns the results"""
+        for stage in self.stages:
+            for _ in stage.threads:
+                stage.inbox.put(STOP)
+            for thread in stage.threads:
+                thread.join()
+        self.elapsed = time.perf_counter() - self.started_at
+        return self.results
+
+    def stats(self):
+        return {stage.name: stage.stats(self.elapsed) for stage in self.stages}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GenerationPipeline:
+    """
+    A GenerationScheduler (submit + poll) feeding download, process and write
+    stages. `process(job, data)` is the CPU work (decode, chroma key,
+    encode) and returns whatever `write(job, result)` needs to save.
+    An optional `dedup(job, result)` runs on a single worker between the
+    two, so each frame is checked against every frame before it.
+    """
+
+    def __init__(self, scheduler, process, write, download_workers=4, process_workers=2, write_workers=1,
+                 capacity=4, verbose=True, dedup=None):
+        self.scheduler = scheduler
+        self.process = process
+        self.write = write
+        self.dedup = dedup
+        self.download_workers = download_workers
+        self.process_workers = process_workers
+        self.write_workers = write_workers
+        self.capacity = capacity
+        self.verbose = verbose
+        self.pipeline = None
+
+    def download(self, job):
+        data = self.scheduler.retrieve(job)
+        if data is None:
+            raise IOError("download failed")
+        return job, data
+
+    def transform(self, item):
+        job, data = item
+        return job, self.process(job, data)
+
+    def check(self, item):
+        job, result = item
+        return job, self.dedup(job, result)
+
+    def save(self, item):
+        job, result = item
+        self.write(job, result)
+        return job
+
+    def run(self, jobs):
+        """Generate, download, process and write every job; returns {name: True if written}"""
+        stages = [
+            Stage('download', self.download, self.download_workers, self.capacity),
+            Stage('process', self.transform, self.process_workers, self.capacity),
+            Stage('write', self.save, self.write_workers, self.capacity)
+        ]
+        if self.dedup:
+            stages.insert(2, Stage('dedup', self.check, 1, self.capacity))
+        self.pipeline = Pipeline(stages, verbose=self.verbose)
+        with self.pipeline:
+            self.scheduler.run(jobs, on_ready=self.pipeline.put)
+        written = {job.name for job in self.pipeline.results}
+        return {job.name: job.name in written for job in jobs}
+
+    def print_stats(self):
+        print(f"\n⏱️  Pipeline finished in {self.pipeline.elapsed:.1f}s")
+        for name, stats in self.pipeline.stats().items():
+            print(f"   {name:<9} x{stats['workers']}  {stats['processed']:>3} done  {stats['failed']:>2} failed  "
+                  f"busy {stats['busy']:6.1f}s  ({stats['utilization']:.0%})")
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Leonardo AI Generation Scheduler
+Submits many generations at once, polls every in-flight job in a single
+loop and downloads results as they finish, instead of the serial
+submit -> poll -> sleep(3) flow. Each job is polled on its own adaptive
+schedule, or not at all when completions are pushed to a CallbackReceiver.
+"""
+
+import os
+import queue as queue_module
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import requests
+
+from adaptive_polling import AdaptivePoller, FixedPoller, model_id
+from leonardo_client import BASE_URL, LeonardoClient
+from sprite_processing import write_atomic
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` calls per second with bursts of `burst`"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class GenerationJob:
+    """One asset to generate: a name, the request payload and an optional download path"""
+
+    def __init__(self, name, payload, path=None):
+        self.name = name
+        self.payload = payload
+        self.path = path
+        self.generation_id = None
+        self.url = None
+        self.submitted_at = None
+        self.next_poll = None
+        self.last_pending = None
+        self.polls = 0
+        self.delivered_at = None
+        self.blob_path = None
+
+    @property
+    def model(self):
+        return model_id(self.payload)
+
+    @property
+    def time_to_image(self):
+        """Seconds from submission to the image bytes being in hand (None if not delivered)"""
+        if self.submitted_at is None or self.delivered_at is None:
+            return None
+        return self.delivered_at - self.submitted_at
+
+    def __repr__(self):
+        return f"GenerationJob({self.name!r})"
+
+
+class GenerationScheduler:
+    """
+    Runs a batch of GenerationJobs against the Leonardo REST API.
+
+    - at most `max_concurrency` generations are in flight at once
+    - every API call goes through a shared `rate_limit` (calls/second)
+    - in-flight jobs are polled on an AdaptivePoller schedule learned from
+      past completion times (or every `poll_interval` seconds if given)
+    - with a CallbackReceiver, pushed completions are picked up immediately
+      and polling only runs as a slow fallback
+    - finished images are downloaded on a worker pool while others render
+    - with a GenerationCache, payloads seen before are never resubmitted
+    - every HTTP call goes through one pooled, retrying LeonardoClient
+    """
+
+    def __init__(self, api_key=None, base_url=BASE_URL, max_concurrency=4, rate_limit=2.0,
+                 poll_interval=None, download_workers=4, job_timeout=600, cache=None, verbose=True,
+                 client=None, poller=None, callbacks=None):
+        self.client = client or LeonardoClient(api_key, base_url, pool_size=max(max_concurrency, download_workers),
+                                               verbose=verbose)
+        self.max_concurrency = max_concurrency
+        self.limiter = RateLimiter(rate_limit, burst=max(1, int(rate_limit or 1)))
+        self.poller = poller or (FixedPoller(poll_interval) if poll_interval else AdaptivePoller())
+        self.callbacks = callbacks
+        self.download_workers = download_workers
+        self.job_timeout = job_timeout
+        self.cache = cache
+        self.verbose = verbose
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def submit(self, job):
+        """Create the generation and return its id (None on error)"""
+        self.limiter.acquire()
+        try:
+            response = self.client.post('generations', json=job.payload)
+        except requests.RequestException as e:
+            self.log(f"❌ {job.name}: error creating generation: {e}")
+            return None
+        if response.status_code != 200:
+            self.log(f"❌ {job.name}: error creating generation: {response.status_code} - {response.text}")
+            return None
+        return response.json()['sdGenerationJob']['generationId']
+
+    def poll(self, generation_id):
+        """Return (status, image_url) for a generation; UNKNOWN if the API can't be reached"""
+        self.limiter.acquire()
+        try:
+            response = self.client.get(f'generations/{generation_id}')
+        except requests.RequestException:
+            return 'UNKNOWN', None
+        if response.status_code != 200:
+            return 'FAILED', None
+        data = response.json()['generations_by_pk']
+        images = data.get('generated_images') or []
+        return data['status'], (images[0]['url'] if images else None)
+
+    def fetch(self, url):
+        """Download a finished image into memory"""
+        return self.client.fetch(url)
+
+    def poll_delay(self, job):
+        """Seconds until `job` should next be polled"""
+        if job.polls == 0:
+            delay = self.poller.first_delay(job.model)
+        else:
+            delay = self.poller.next_delay(job.model, job.polls - 1, time.monotonic() - job.submitted_at)
+        if self.callbacks:
+            # Completions are pushed; polling is only a safety net for lost webhooks
+            delay = max(delay, self.poller.cap)
+        return delay
+
+    def deliver(self, job, data, on_complete):
+        """Write the image to the job's path and hand it to the caller"""
+        job.delivered_at = time.monotonic()
+        if job.path:
+            write_atomic(job.path, data)
+            self.log(f"✅ Saved: {job.path}")
+        if on_complete:
+            on_complete(job, data)
+
+    def finish(self, job, url, on_complete):
+        """Download a completed generation, cache it and deliver it"""
+        metadata = {'name': job.name, 'url': url, 'generation_id': job.generation_id}
+        try:
+            if job.path and not on_complete:
+                # Nobody needs the bytes in memory: stream straight to disk
+                if self.client.download(url, job.path) is None:
+                    self.log(f"❌ Download failed: {job.name}")
+                    return False
+                job.delivered_at = time.monotonic()
+                if self.cache is not None:
+                    self.cache.put_file(job.payload, job.path, metadata)
+                self.log(f"✅ Saved: {job.path}")
+                return True
+
+            data = self.fetch(url)
+            if data is None:
+                self.log(f"❌ Download failed: {job.name}")
+                return False
+            if self.cache is not None:
+                self.cache.put(job.payload, data, metadata)
+            self.deliver(job, data, on_complete)
+            return True
+        except Exception as e:
+            self.log(f"❌ {job.name}: {e}")
+            return False
+
+    def retrieve(self, job):
+        """Image bytes for a finished job, from its cache blob or the CDN (cached on the way); None on error"""
+        if job.blob_path:
+            with open(job.blob_path, 'rb') as f:
+                data = f.read()
+        else:
+            data = self.fetch(job.url)
+            if data is not None and self.cache is not None:
+                self.cache.put(job.payload, data, {
+                    'name': job.name,
+                    'url': job.url,
+                    'generation_id': job.generation_id
+                })
+        job.delivered_at = time.monotonic()
+        return data
+
+    def finish_cached(self, job, blob_path, on_complete):
+        """Deliver a cache hit without touching the API"""
+        try:
+            if job.path and not on_complete:
+                job.delivered_at = time.monotonic()
+                os.makedirs(os.path.dirname(job.path) or '.', exist_ok=True)
+                shutil.copyfile(blob_path, job.path + '.tmp')
+                os.replace(job.path + '.tmp', job.path)
+                self.log(f"✅ Saved: {job.path}")
+                return True
+            with open(blob_path, 'rb') as f:
+                data = f.read()
+            self.deliver(job, data, on_complete)
+            return True
+        except Exception as e:
+            self.log(f"❌ {job.name}: {e}")
+            return False
+
+    def hand_over(self, handoff, on_ready, errors):
+        """Feed ready jobs to `on_ready` on its own thread, so polling never waits on it"""
+        while True:
+            job = handoff.get()
+            if job is None:
+                return
+            if errors:
+                continue  # Drain the queue so run() never blocks on a dead consumer
+            try:
+                on_ready(job)
+            except Exception as e:
+                errors.append(e)
+
+    def run(self, jobs, on_complete=None, on_ready=None):
+        """
+        Generate every job and return {name: image_url or None}.
+        `on_complete(job, data)` is called from a worker thread with the image
+        bytes as each job finishes.
+        With `on_ready(job)`, finished jobs (cache hits have `blob_path` set)
+        are handed over undownloaded instead, e.g. to a GenerationPipeline.
+        It runs on a separate thread behind a queue of `max_concurrency`
+        jobs and may block to apply backpressure: while the queue is full no
+        new generations are submitted, but in-flight ones are still polled,
+        so their timeouts never include time spent waiting on it.
+        """
+        queue = deque()
+        in_flight = []
+        results = {job.name: None for job in jobs}
+        futures = []
+        # Finished jobs waiting for room in the hand-over queue
+        ready = deque()
+        if on_ready:
+            handoff = queue_module.Queue(max(1, self.max_concurrency))
+            errors = []
+            consumer = threading.Thread(target=self.hand_over, args=(handoff, on_ready, errors), daemon=True)
+            consumer.start()
+
+        def pass_ready(block=False):
+            while ready:
+                try:
+                    handoff.put(ready[0], block=block)
+                except queue_module.Full:
+                    return
+                ready.popleft()
+
+        pool_context = nullcontext() if on_ready else ThreadPoolExecutor(max_workers=self.download_workers)
+        with pool_context as pool:
+            # Serve unchanged payloads straight from the cache
+            for job in jobs:
+                hit = self.cache.lookup(job.payload) if self.cache is not None else None
+                if hit:
+                    blob_path, metadata = hit
+                    job.url = results[job.name] = metadata.get('url', blob_path)
+                    self.log(f"📦 Cached: {job.name}")
+                    if on_ready:
+                        job.blob_path = blob_path
+                        ready.append(job)
+                    else:
+                        futures.append((job, pool.submit(self.finish_cached, job, blob_path, on_complete)))
+                else:
+                    queue.append(job)
+
+            while queue or in_flight:
+                if on_ready:
+                    # Nothing to poll: waiting on the consumer can't delay anything
+                    pass_ready(block=not in_flight)
+
+                # Top up the in-flight set (held back while finished jobs wait for the consumer)
+                while queue and not ready and len(in_flight) < self.max_concurrency:
+                    job = queue.popleft()
+                    job.generation_id = self.submit(job)
+                    if job.generation_id:
+                        job.submitted_at = job.last_pending = time.monotonic()
+                        job.next_poll = job.submitted_at + self.poll_delay(job)
+                        in_flight.append(job)
+                        self.log(f"🎨 Submitted {job.name} ({job.generation_id})")
+
+                if not in_flight:
+                    continue
+
+                # Sleep until the next job is due a poll (or a webhook wakes us up)
+                wait = max(0.0, min(job.next_poll for job in in_flight) - time.monotonic())
+                if self.callbacks:
+                    self.callbacks.wait(wait)
+                else:
+                    time.sleep(wait)
+
+                for job in list(in_flight):
+                    pushed = self.callbacks.take(job.generation_id) if self.callbacks else None
+                    if pushed:
+                        status, url = pushed
+                        finished_at = time.monotonic()
+                    elif time.monotonic() >= job.next_poll:
+                        status, url = self.poll(job.generation_id)
+                        job.polls += 1
+                        # It finished somewhere between the last PENDING answer and now
+                        finished_at = (job.last_pending + time.monotonic()) / 2
+                    else:
+                        continue
+
+                    if status == 'COMPLETE':
+                        in_flight.remove(job)
+                        self.poller.record(job.model, finished_at - job.submitted_at)
+                        if url:
+                            job.url = url
+                            results[job.name] = url
+                            if on_ready:
+                                ready.append(job)
+                            else:
+                                futures.append((job, pool.submit(self.finish, job, url, on_complete)))
+                        else:
+                            self.log(f"❌ {job.name}: completed without images")
+                    elif status == 'FAILED':
+                        in_flight.remove(job)
+                        self.log(f"❌ {job.name}: generation failed")
+                    elif time.monotonic() - job.submitted_at > self.job_timeout:
+                        in_flight.remove(job)
+                        self.log(f"❌ {job.name}: timed out after {self.job_timeout}s")
+                    else:
+                        job.last_pending = time.monotonic()
+                        job.next_poll = job.last_pending + self.poll_delay(job)
+
+            for job, future in futures:
+                if not future.result():
+                    results[job.name] = None
+
+        if on_ready:
+            pass_ready(block=True)
+            handoff.put(None)
+            consumer.join()
+            if errors:
+                raise errors[0]
+        return results
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+WETCAT Image Previews (LQIP)
+For every large image the game loads (the sprites, tile levels and
+responsive variants listed in src/game/data/assetManifest.js), records its
+1x size and a tiny blurred preview (a ~24 px WebP, inline as a data: URI)
+in src/game/data/imagePreviews.js, keyed by asset name. The game can lay a
+screen out and paint an approximation on the first frame, then swap in the
+full image once it has streamed in (see ProgressiveImage in AssetLoader.js).
+
+Usage: python image_previews.py [--min-size 16] [--manifest src/game/data/assetManifest.js] [--out src/game/data/imagePreviews.js]
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+
+from PIL import Image
+
+from asset_fingerprint import MANIFEST_MODULE, read_manifest
+from sprite_processing import write_atomic
+
+PUBLIC_DIR = "public"
+PREVIEW_MODULE = "src/game/data/imagePreviews.js"
+MIN_BYTES = 16 * 1024
+PREVIEW_SIZE = 24
+PREVIEW_QUALITY = 40
+
+
+def preview_data_uri(img, size=PREVIEW_SIZE, quality=PREVIEW_QUALITY):
+    """The image shrunk to fit `size` px, as a WebP data: URI (alpha is kept)"""
+    small = img.convert("RGBA") if "A" in img.getbands() or img.mode == "P" else img.convert("RGB")
+    small.thumbnail((size, size), Image.LANCZOS)
+    buffer = io.BytesIO()
+    small.save(buffer, "WEBP", quality=quality, method=6)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def image_preview(path):
+    """{"width", "height", "preview"} for one image file"""
+    with Image.open(path) as img:
+        width, height = img.size
+        return {"width": width, "height": height, "preview": preview_data_uri(img)}
+
+
+def atlas_frames(manifest, public_dir=PUBLIC_DIR):
+    """Names the game draws from the packed atlas instead of loading individually"""
+    if not manifest.get("atlas"):
+        return set()
+    try:
+        with open(os.path.join(public_dir, manifest["atlas"])) as f:
+            return set(json.load(f)["frames"])
+    except (OSError, ValueError, KeyError):
+        return set()
+
+
+def loaded_images(manifest, public_dir=PUBLIC_DIR):
+    """
+    {asset name: [(URL, scale)]} for every full-size image the runtime can
+    load: the individually loaded sprites, each seamless tile's mip levels
+    and each image's responsive variants (WebP and fallback).
+    """
+    frames = atlas_frames(manifest, public_dir)
+    tiles = manifest.get("tiles", {})
+    images = {name: [(url, 1.0)] for name, url in manifest.get("images", {}).items()
+              if name not in frames and name not in tiles}
+    for name, tile in tiles.items():
+        images[name] = [(level["url"], level["scale"]) for level in tile["levels"]]
+    for name, variants in manifest.get("variants", {}).items():
+        images[name] = [(variant[kind], variant["scale"]) for variant in variants
+                        for kind in ("webp", "fallback") if variant.get(kind)]
+    return images
+
+
+def build_previews(manifest, public_dir=PUBLIC_DIR, min_bytes=MIN_BYTES):
+    """
+    {asset name: preview} for the images in `manifest` whose largest file is
+    at least `min_bytes`. width/height are the 1x size; the runtime scales
+    them to whichever level or variant it picked.
+    """
+    previews = {}
+    for name, files in loaded_images(manifest, public_dir).items():
+        sizes = [(os.path.getsize(os.path.join(public_dir, url)), url, scale) for url, scale in files
+                 if os.path.exists(os.path.join(public_dir, url))]
+        if not sizes or max(sizes)[0] < min_bytes:
+            continue
+        _, url, scale = max(sizes)
+        try:
+            entry = image_preview(os.path.join(public_dir, url))
+        except OSError:
+            continue
+        entry["width"], entry["height"] = round(entry["width"] / scale), round(entry["height"] / scale)
+        previews[name] = entry
+    return dict(sorted(previews.items()))
+
+
+def preview_module(previews):
+    # JSON is a valid JS expression, quotes and all
+    body = json.dumps(previews, indent=2, sort_keys=True)
+    return (
+        "// Generated by image_previews.py - do not edit by hand.\n"
+        "// 1x size and a tiny blurred preview for every large image the game loads, by asset name.\n"
+        f"export const IMAGE_PREVIEWS = {body};\n"
+    )
+
+
+def write_previews(previews, path=PREVIEW_MODULE):
+    """Write the ES module; returns True if its content changed"""
+    source = preview_module(previews).encode()
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == source:
+                return False
+    write_atomic(path, source)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write size + blurred preview metadata for large images")
+    parser.add_argument("--min-size", type=int, default=MIN_BYTES // 1024, help="KB; smaller images are skipped")
+    parser.add_argument("--manifest", default=MANIFEST_MODULE, help="asset manifest listing what the game loads")
+    parser.add_argument("--out", default=PREVIEW_MODULE)
+    args = parser.parse_args()
+
+    previews = build_previews(read_manifest(args.manifest), min_bytes=args.min_size * 1024)
+    for name, entry in previews.items():
+        print(f"🖼️  {name:<20} {entry['width']:>5}x{entry['height']:<5} -> {len(entry['preview'])} B preview")
+    changed = write_previews(previews, args.out)
+    print(f"{'✅ Wrote' if changed else '⏭️  Unchanged'}: {args.out} ({len(previews)} images)")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+WETCAT Responsive Image Variants
+Publishes 0.5x/1x copies of the menu background and the logo, each as
+WebP plus a fallback (JPEG, or PNG when the image has transparency), and
+lists them under "variants" in the asset manifest so the game can pick one
+by display size and devicePixelRatio. 1x is the size the game draws the
+image at on its 1280x720 canvas. That canvas is never backed by more
+pixels, so nothing above 1x is built. Scales that would need upscaling the
+source are skipped. Images are cropped to the target's aspect ratio unless
+their spec says "fit": "stretch".
+
+Lossy quality is chosen per image and format: the lowest quality whose
+SSIM against the resized original reaches the target.
+
+Usage: python image_variants.py [--ssim 0.98] [--scales 0.5,1]
+"""
+
+import argparse
+import io
+import json
+import os
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from asset_fingerprint import VARIANTS_FILE, fingerprint_assets, publish
+from sprite_processing import encode_png_optimized, write_atomic
+
+VARIANT_SPECS = [
+    {"key": "menuBackground", "source": "assets/menu_background.jpg", "name": "menu_background", "size": (1280, 720)},
+    # SplashScreen draws the square logo squeezed into 400x200, so it is stretched the same way, not cropped
+    {"key": "logo", "source": "public/wetcat-logo.png", "name": "wetcat_logo", "size": (400, 200), "fit": "stretch"},
+]
+SCALES = (0.5, 1.0)
+OUTPUT_DIR = "public/images"
+URL_PREFIX = "images/"
+TARGET_SSIM = 0.98
+QUALITY_RANGE = (30, 95)
+
+# SSIM over 7x7 windows of luma (as skimage does by default)
+SSIM_WINDOW = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+
+def luma(img):
+    """Float luma, with transparent pixels composited over black"""
+    pixels = np.asarray(img.convert("RGBA"), dtype=np.float64)
+    gray = pixels[..., :3] @ np.array([0.299, 0.587, 0.114])
+    return gray * pixels[..., 3] / 255
+
+
+def box_mean(values, size=SSIM_WINDOW):
+    """Mean over every size x size window (valid positions only)"""
+    summed = np.pad(values, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    total = summed[size:, size:] - summed[:-size, size:] - summed[size:, :-size] + summed[:-size, :-size]
+    return total / (size * size)
+
+
+def ssim(a, b):
+    """Mean structural similarity of two images of the same size (1.0 = identical)"""
+    x, y = luma(a), luma(b)
+    mx, my = box_mean(x), box_mean(y)
+    vx = box_mean(x * x) - mx * mx
+    vy = box_mean(y * y) - my * my
+    cov = box_mean(x * y) - mx * my
+    score = ((2 * mx * my + SSIM_C1) * (2 * cov + SSIM_C2)) / ((mx * mx + my * my + SSIM_C1) * (vx + vy + SSIM_C2))
+    return float(score.mean())
+
+
+def encode(img, fmt, quality):
+    buffer = io.BytesIO()
+    if fmt == "webp":
+        img.save(buffer, "WEBP", quality=quality, method=6)
+    else:
+        img.convert("RGB").save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def search_quality(img, fmt, target=TARGET_SSIM, quality_range=QUALITY_RANGE):
+    """
+    (quality, bytes, ssim) for the lowest quality reaching `target` (the
+    highest if none does). SSIM rises close enough to monotonically with
+    quality that a binary search (about seven encodes) finds it.
+    """
+    lo, hi = quality_range
+    best = None
+    while lo <= hi:
+        quality = (lo + hi) // 2
+        data = encode(img, fmt, quality)
+        with Image.open(io.BytesIO(data)) as decoded:
+            score = ssim(img, decoded)
+        if score >= target:
+            best = (quality, data, score)
+            hi = quality - 1
+        else:
+            lo = quality + 1
+    if best is None:
+        quality = quality_range[1]
+        data = encode(img, fmt, quality)
+        with Image.open(io.BytesIO(data)) as decoded:
+            best = (quality, data, ssim(img, decoded))
+    return best
+
+
+def has_alpha(img):
+    return img.mode in ("RGBA", "LA", "P") and img.convert("RGBA").getchannel("A").getextrema() != (255, 255)
+
+
+def variant_sizes(source_size, size, scales=SCALES):
+    """[(scale, (w, h))] for the scales the source is big enough for (always at least the smallest)"""
+    sizes = [(scale, (round(size[0] * scale), round(size[1] * scale))) for scale in sorted(scales)]
+    fitting = [(scale, dims) for scale, dims in sizes if dims[0] <= source_size[0] and dims[1] <= source_size[1]]
+    return fitting or sizes[:1]
+
+
+def build_variants(spec, scales=SCALES, target=TARGET_SSIM, output_dir=OUTPUT_DIR):
+    """Publish every variant of one spec; returns its manifest entries (smallest first)"""
+    with Image.open(spec["source"]) as source:
+        source.load()
+        alpha = has_alpha(source)
+        source = source.convert("RGBA" if alpha else "RGB")
+    fallback = "png" if alpha else "jpg"
+
+    entries = []
+    for scale, dims in variant_sizes(source.size, spec["size"], scales):
+        if spec.get("fit") == "stretch":
+            img = source.resize(dims, Image.LANCZOS)
+        else:
+            img = ImageOps.fit(source, dims, Image.LANCZOS)
+        entry = {"scale": scale, "width": dims[0], "height": dims[1]}
+        for fmt in ("webp", fallback):
+            if fmt == "png":
+                data, quality = encode_png_optimized(img), None
+            else:
+                quality, data, _ = search_quality(img, fmt, target)
+            filename = f"{spec['name']}-{scale:g}x.{fmt}"
+            entry[fmt if fmt == "webp" else "fallback"] = URL_PREFIX + publish(os.path.join(output_dir, filename), data)
+            entry.setdefault("quality", {})[fmt] = quality
+            entry.setdefault("bytes", {})[fmt] = len(data)
+        entries.append(entry)
+    return entries
+
+
+def write_variants(specs=VARIANT_SPECS, scales=SCALES, target=TARGET_SSIM, output_dir=OUTPUT_DIR,
+                   variants_file=VARIANTS_FILE):
+    """Build all variants and write `variants_file` (read by asset_fingerprint.py); returns it"""
+    os.makedirs(output_dir, exist_ok=True)
+    variants = {spec["key"]: build_variants(spec, scales, target, output_dir) for spec in specs}
+    manifest = {key: [{k: v for k, v in entry.items() if k not in ("quality", "bytes")} for entry in entries]
+                for key, entries in variants.items()}
+    write_atomic(variants_file, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return variants
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publish responsive WebP + fallback variants of large images")
+    parser.add_argument("--ssim", type=float, default=TARGET_SSIM, help="target SSIM for lossy quality search")
+    parser.add_argument("--scales", default=",".join(f"{s:g}" for s in SCALES), help="comma-separated scales")
+    args = parser.parse_args()
+
+    scales = tuple(float(s) for s in args.scales.split(","))
+    variants = write_variants(scales=scales, target=args.ssim)
+    for spec in VARIANT_SPECS:
+        original = os.path.getsize(spec["source"])
+        print(f"🖼️  {spec['key']} ({spec['source']}, {original / 1024:.1f} KB)")
+        for entry in variants[spec["key"]]:
+            parts = [f"{fmt} {size / 1024:6.1f} KB" + (f" q{entry['quality'][fmt]}" if entry['quality'][fmt] else "")
+                     for fmt, size in entry["bytes"].items()]
+            print(f"   {entry['scale']:g}x {entry['width']:>4}x{entry['height']:<4}  " + "   ".join(parts))
+    fingerprint_assets()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+WETCAT JS Asset Path Rewriter
+Replaces fix_audio_paths.py / fix_paths_relative.py. Each .js file is
+tokenized once and every asset path rule is applied in the same pass, so
+comments, template literals and regexes are never touched and the rules
+can't fight each other: paths are reduced to one canonical form and then
+rendered either relative ('yay.mp3') or under the deploy base
+('/wetcat-librarian/yay.mp3').
+
+A FileIndex skips files untouched since the last run (same rules) without
+reading them; the rest are rewritten on a process pool.
+
+Usage: python js_path_rewriter.py [--mode relative|absolute] [--dry-run] [--force] [paths...]
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from file_index import SKIP_DIRS, FileIndex
+from sprite_processing import write_atomic
+
+REWRITER_VERSION = 2
+STATE_FILE = ".js_rewrite_state.json"
+BASE_PATH = "/wetcat-librarian/"
+ASSET_EXTENSIONS = (".mp3", ".ogg", ".wav", ".mp4", ".webm", ".png", ".jpg", ".jpeg", ".webp", ".gif", ".json")
+
+# Matches any string literal inside a rule context
+STRING = "<string>"
+
+# (rule name, significant tokens that must directly precede the path string)
+DEFAULT_RULES = (
+    ("audio-constructor", ("new", "Audio", "(")),
+    ("src-assignment", (".", "src", "=")),
+    ("progressive-image", ("progressiveImage", "(", STRING, ",")),
+    ("loader-image", ("loadImage", "(", STRING, ",")),
+    ("loader-audio", ("loadAudio", "(", STRING, ",")),
+)
+
+REGEX_KEYWORDS = {"return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+                  "throw", "case", "do", "else", "yield", "await"}
+IDENTIFIER = re.compile(r"[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*")
+NUMBER = re.compile(r"(?:0[xXbBoO][\da-fA-F_]+|(?:\d[\d_]*)?\.?\d[\d_]*(?:[eE][+-]?\d+)?)n?")
+PUNCTUATOR = re.compile(r">>>=?|\.\.\.|[=!]==|\*\*=?|<<=?|>>=?|&&=?|\|\|=?|\?\?=?|\?\.|=>|[-+*/%&|^<>!=]=|\+\+|--|.", re.S)
+
+
+class Token:
+    __slots__ = ("kind", "text", "start", "end")
+
+    def __init__(self, kind, text, start, end):
+        self.kind = kind
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.text!r})"
+
+
+def regex_allowed(tokens):
+    """A '/' starts a regex literal unless it follows a value"""
+    prev = next((token for token in reversed(tokens) if token.kind != "comment"), None)
+    if prev is None:
+        return True
+    if prev.kind == "punct":
+        return prev.text not in (")", "]", "}")
+    return prev.kind == "name" and prev.text in REGEX_KEYWORDS
+
+
+def scan_quoted(src, i, quote):
+    j = i + 1
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == quote or c == "\n":
+            return j + 1
+        j += 1
+    return j
+
+
+def scan_regex(src, i):
+    """End of the regex literal at i, or None if it isn't one (newline before the closing /)"""
+    j = i + 1
+    in_class = False
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "\n":
+            return None
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            j += 1
+            while j < len(src) and (src[j].isalnum() or src[j] in "_$"):
+                j += 1
+            return j
+        j += 1
+    return None
+
+
+def scan_template(src, i):
+    """End of the template literal at i, skipping over ${...} expressions"""
+    j = i + 1
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+        elif c == "`":
+            return j + 1
+        elif src.startswith("${", j):
+            j = lex(src, j + 2, [], stop_at_brace=True) + 1
+        else:
+            j += 1
+    return j
+
+
+def lex(src, i, tokens, stop_at_brace=False):
+    """Append tokens from src[i:] (to the unmatched '}' if stop_at_brace); returns the end index"""
+    depth = 0
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c.isspace():
+            i += 1
+            continue
+        if src.startswith("//", i):
+            end = src.find("\n", i)
+            end = n if end < 0 else end
+            tokens.append(Token("comment", src[i:end], i, end))
+        elif src.startswith("/*", i):
+            end = src.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            tokens.append(Token("comment", src[i:end], i, end))
+        elif c in "'\"":
+            end = scan_quoted(src, i, c)
+            tokens.append(Token("string", src[i:end], i, end))
+        elif c == "`":
+            end = scan_template(src, i)
+            tokens.append(Token("template", src[i:end], i, end))
+        elif c == "/" and regex_allowed(tokens) and scan_regex(src, i) is not None:
+            end = scan_regex(src, i)
+            tokens.append(Token("regex", src[i:end], i, end))
+        elif c.isdigit() or (c == "." and i + 1 < n and src[i + 1].isdigit()):
+            end = NUMBER.match(src, i).end() or i + 1
+            tokens.append(Token("number", src[i:end], i, end))
+        elif IDENTIFIER.match(src, i):
+            end = IDENTIFIER.match(src, i).end()
+            tokens.append(Token("name", src[i:end], i, end))
+        else:
+            if stop_at_brace and c == "{":
+                depth += 1
+            elif stop_at_brace and c == "}":
+                if depth == 0:
+                    return i
+                depth -= 1
+            end = PUNCTUATOR.match(src, i).end()
+            tokens.append(Token("punct", src[i:end], i, end))
+        i = end
+    return i
+
+
+def tokenize(source):
+    tokens = []
+    lex(source, 0, tokens)
+    return tokens
+
+
+class PathPolicy:
+    """Reduces an asset path to its canonical form ('sprites/coin.png') and renders it for the chosen mode"""
+
+    def __init__(self, mode="relative", base=BASE_PATH, extensions=ASSET_EXTENSIONS):
+        if mode not in ("relative", "absolute"):
+            raise ValueError(f"Unknown path mode: {mode}")
+        self.mode = mode
+        self.base = "/" + base.strip("/") + "/"
+        self.extensions = extensions
+
+    def is_asset(self, path):
+        if path.startswith(("http:", "https:", "data:", "blob:", "//")):
+            return False
+        return path.split("?", 1)[0].lower().endswith(self.extensions)
+
+    def canonical(self, path):
+        if path.startswith(self.base):
+            path = path[len(self.base):]
+        return path.lstrip("/")
+
+    def apply(self, path):
+        if not self.is_asset(path):
+            return path
+        canonical = self.canonical(path)
+        return canonical if self.mode == "relative" else self.base + canonical
+
+
+def matches_context(significant, index, context):
+    if index < len(context):
+        return False
+    for token, expected in zip(significant[index - len(context):index], context):
+        if expected == STRING:
+            if token.kind != "string":
+                return False
+        elif token.text != expected:
+            return False
+    return True
+
+
+def rewrite_source(source, rules=DEFAULT_RULES, policy=None):
+    """Single pass over the tokens; returns (new source, [(rule name, old, new)])"""
+    policy = policy or PathPolicy()
+    significant = [token for token in tokenize(source) if token.kind != "comment"]
+    edits = []
+    for index, token in enumerate(significant):
+        # Only plain literals; anything with escapes is left for a human
+        if token.kind != "string" or "\\" in token.text or len(token.text) < 2:
+            continue
+        for name, context in rules:
+            if matches_context(significant, index, context):
+                old = token.text[1:-1]
+                new = policy.apply(old)
+                if new != old:
+                    edits.append((token, name, old, new))
+                break
+
+    if not edits:
+        return source, []
+    parts = []
+    last = 0
+    for token, _, _, new in edits:
+        quote = token.text[0]
+        parts.append(source[last:token.start])
+        parts.append(f"{quote}{new}{quote}")
+        last = token.end
+    parts.append(source[last:])
+    return "".join(parts), [(name, old, new) for _, name, old, new in edits]
+
+
+def rules_signature(rules, policy):
+    return hashlib.sha256(json.dumps({
+        "version": REWRITER_VERSION,
+        "rules": rules,
+        "mode": policy.mode,
+        "base": policy.base
+    }, sort_keys=True).encode()).hexdigest()
+
+
+def rewrite_file(task):
+    """(path, rules, mode, base, dry_run) -> (path, output sha256, changes, diff, error); runs in a worker"""
+    path, rules, mode, base, dry_run = task
+    try:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        rewritten, changes = rewrite_source(source, rules, PathPolicy(mode, base))
+        diff = None
+        if changes:
+            if dry_run:
+                diff = "".join(difflib.unified_diff(source.splitlines(True), rewritten.splitlines(True),
+                                                    f"a/{path}", f"b/{path}"))
+            else:
+                write_atomic(path, rewritten.encode("utf-8"))
+        return path, hashlib.sha256(rewritten.encode("utf-8")).hexdigest(), changes, diff, None
+    except Exception as e:
+        return path, None, [], None, str(e)
+
+
+def rewrite_tree(paths, rules=DEFAULT_RULES, mode="relative", base=BASE_PATH, dry_run=False,
+                 force=False, workers=None, state_path=STATE_FILE):
+    """Rewrite every JS file under `paths`; returns {"processed", "changed", "skipped", "errors", "diffs"}"""
+    policy = PathPolicy(mode, base)
+    index = FileIndex(state_path, rules_signature([list(rule) for rule in rules], policy))
+
+    tasks = []
+    skipped = []
+    for path, st in index.scan(paths, suffixes=(".js",), skip_dirs=SKIP_DIRS):
+        if not force and index.unchanged(path, st):
+            skipped.append(path)
+        else:
+            tasks.append((path, tuple(rules), mode, base, dry_run))
+
+    if workers == 1 or len(tasks) <= 1:
+        results = [rewrite_file(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(rewrite_file, tasks, chunksize=8))
+
+    report = {"processed": len(tasks), "changed": {}, "skipped": skipped, "errors": {}, "diffs": []}
+    for path, digest, changes, diff, error in results:
+        if error:
+            report["errors"][path] = error
+            continue
+        if changes:
+            report["changed"][path] = changes
+        if diff:
+            report["diffs"].append(diff)
+        if not dry_run:
+            index.record(path, digest)
+
+    if not dry_run:
+        index.prune()
+        index.save()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rewrite asset paths in the game's JS sources")
+    parser.add_argument("paths", nargs="*", default=["src"])
+    parser.add_argument("--mode", choices=["relative", "absolute"], default="relative",
+                        help="relative: 'yay.mp3' (default), absolute: '<base>yay.mp3'")
+    parser.add_argument("--base", default=BASE_PATH, help="deploy base for --mode absolute")
+    parser.add_argument("--rules", help="comma-separated subset of: " + ", ".join(name for name, _ in DEFAULT_RULES))
+    parser.add_argument("--dry-run", action="store_true", help="print a unified diff instead of writing")
+    parser.add_argument("--force", action="store_true", help="ignore the unchanged-file cache")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--state", default=STATE_FILE)
+    args = parser.parse_args()
+
+    rules = DEFAULT_RULES
+    if args.rules:
+        wanted = set(args.rules.split(","))
+        rules = tuple(rule for rule in DEFAULT_RULES if rule[0] in wanted)
+
+    start = time.perf_counter()
+    report = rewrite_tree(args.paths, rules, args.mode, args.base, args.dry_run, args.force, args.workers, args.state)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for diff in report["diffs"]:
+        print(diff, end="")
+    for path, changes in report["changed"].items():
+        print(f"{'🔍 Would fix' if args.dry_run else '✅ Fixed'} {len(changes)} path(s) in: {path}")
+    for path, error in report["errors"].items():
+        print(f"❌ Error processing {path}: {error}")
+
+    print(f"\n🎮 {report['processed']} file(s) tokenized, {len(report['changed'])} changed, "
+          f"{len(report['skipped'])} unchanged since last run in {elapsed:.0f}ms")
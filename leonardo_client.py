@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Leonardo AI HTTP Client
+One pooled requests.Session for every Leonardo API and CDN call:
+keep-alive connection reuse, connect/read timeouts on every request,
+and exponential backoff (honoring Retry-After) on 429/5xx and network errors.
+A POST creates a generation, so it is only resent when the server can't have
+acted on it: the connection never opened, or a 429 asked for a retry later.
+"""
+
+import hashlib
+import os
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+BASE_URL = os.environ.get('LEONARDO_BASE_URL', "https://cloud.leonardo.ai/api/rest/v1")
+
+# Responses worth retrying; anything else is returned to the caller as-is
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+# Methods that can be resent after a timeout or 5xx without doing the work twice
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+
+def api_headers(api_key):
+    """Headers shared by every Leonardo API call"""
+    return {
+        "accept": "application/json",
+        "authorization": f"Bearer {api_key}",
+        "content-type": "application/json"
+    }
+
+
+def retry_after_seconds(value):
+    """Parse a Retry-After header (delta-seconds or HTTP date); None if absent/invalid"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def never_sent(error):
+    """Whether a request failed before it reached the server (no connection was made)"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def content_range_total(value):
+    """Total length from a 'bytes 100-199/200' Content-Range header"""
+    if value and '/' in value and not value.endswith('/*'):
+        return int(value.rsplit('/', 1)[1])
+    return None
+
+
+def file_digest(path, algorithm, chunk_size=1 << 20):
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def verify_file(path, expected_size=None, expected_sha256=None, etag=None):
+    """None if the file checks out, else a description of the mismatch"""
+    size = os.path.getsize(path)
+    if expected_size is not None and size != expected_size:
+        return f"size {size} != {expected_size}"
+    if expected_sha256:
+        actual = file_digest(path, 'sha256')
+        return None if actual == expected_sha256 else f"sha256 {actual[:12]} != {expected_sha256[:12]}"
+    md5 = etag.strip('"') if etag and not etag.startswith('W/') else ''
+    if re.fullmatch(r'[0-9a-f]{32}', md5):
+        actual = file_digest(path, 'md5')
+        return None if actual == md5 else f"md5 {actual[:12]} != ETag {md5[:12]}"
+    return None
+
+
+class LeonardoClient:
+    """
+    Thread-safe enough for the scheduler's worker pool: requests shares the
+    connection pool, and each call builds its own request.
+
+    - `timeout` is (connect, read) seconds, applied to every call
+    - up to `retries` extra attempts with delays of backoff * 2^n (+ jitter),
+      capped at `max_backoff`; a server's Retry-After wins when it is given
+    - non-idempotent requests (POST) are only retried when never_sent() or
+      on a 429 with Retry-After, so a slow or failing create isn't billed twice
+    """
+
+    def __init__(self, api_key=None, base_url=BASE_URL, timeout=(5, 30), retries=4,
+                 backoff=0.5, max_backoff=30.0, pool_size=8, verbose=True):
+        self.api_key = api_key if api_key is not None else os.environ.get('LEONARDO_API_KEY', '')
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.verbose = verbose
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def url(self, path):
+        """Absolute URL for an API path; full URLs (CDN images) pass through"""
+        if path.startswith(('http://', 'https://')):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def delay(self, attempt, response=None):
+        """Seconds to wait before retry number `attempt` (0-based)"""
+        if response is not None:
+            retry_after = retry_after_seconds(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        wait = min(self.max_backoff, self.backoff * (2 ** attempt))
+        return wait * random.uniform(0.5, 1.0)
+
+    def request(self, method, path, api=True, **kwargs):
+        """
+        Send a request, retrying transient failures (see the class docstring for
+        which ones a POST may retry).
+        Returns the final response (which may still be an error status);
+        raises requests.RequestException once network errors exhaust the retries.
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        url = self.url(path)
+        kwargs.setdefault('timeout', self.timeout)
+        if api:
+            kwargs['headers'] = {**api_headers(self.api_key), **kwargs.get('headers', {})}
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.retries or not (idempotent or never_sent(e)):
+                    raise
+                wait = self.delay(attempt)
+                self.log(f"⚠️  {method} {url}: {type(e).__name__}, retrying in {wait:.1f}s")
+            else:
+                retryable = response.status_code in RETRY_STATUSES and (
+                    idempotent or (response.status_code == 429 and 'Retry-After' in response.headers))
+                if not retryable or attempt == self.retries:
+                    return response
+                wait = self.delay(attempt, response)
+                self.log(f"⚠️  {method} {url}: {response.status_code}, retrying in {wait:.1f}s")
+                response.close()
+            time.sleep(wait)
+
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request('POST', path, **kwargs)
+
+    def fetch(self, url):
+        """Download a CDN image into memory; None on error"""
+        response = self.request('GET', url, api=False)
+        if response.status_code != 200:
+            return None
+        return response.content
+
+    def download(self, url, path, expected_size=None, expected_sha256=None, chunk_size=1 << 16):
+        """
+        Stream a CDN image to `path` in fixed-size chunks, so memory stays flat
+        whatever the image size. Bytes go to `path`.part and are renamed into
+        place only once verified:
+
+        - size against `expected_size` / Content-Length / Content-Range
+        - sha256 against `expected_sha256`, else MD5 against a plain (S3-style) ETag
+
+        A connection dropped mid-body is resumed with a Range request (If-Range
+        guards against the object changing underneath). Returns bytes written or None.
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.part'
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        offset = 0
+        etag = None
+
+        for attempt in range(self.retries + 1):
+            headers = {}
+            if offset:
+                headers['Range'] = f"bytes={offset}-"
+                if etag:
+                    headers['If-Range'] = etag
+            try:
+                response = self.request('GET', url, api=False, stream=True, headers=headers)
+            except requests.RequestException as e:
+                self.log(f"❌ Download failed: {url}: {e}")
+                break
+
+            with response:
+                if response.status_code == 206 and offset:
+                    total = content_range_total(response.headers.get('Content-Range'))
+                    mode = 'ab'
+                elif response.status_code == 200:
+                    # Fresh body (first try, or the server ignored/refused our Range)
+                    offset = 0
+                    length = response.headers.get('Content-Length')
+                    total = int(length) if length and not response.headers.get('Content-Encoding') else None
+                    mode = 'wb'
+                else:
+                    self.log(f"❌ Download failed: {url}: HTTP {response.status_code}")
+                    break
+                etag = response.headers.get('ETag', etag)
+                total = expected_size or total
+
+                try:
+                    with open(tmp_path, mode) as f:
+                        for chunk in response.iter_content(chunk_size):
+                            f.write(chunk)
+                            offset += len(chunk)
+                except requests.RequestException as e:
+                    wait = self.delay(attempt)
+                    self.log(f"⚠️  Download interrupted at {offset} bytes ({type(e).__name__}), resuming in {wait:.1f}s")
+                    time.sleep(wait)
+                    continue
+
+            if total is not None and offset < total:
+                self.log(f"⚠️  Download short: {offset}/{total} bytes, resuming")
+                continue
+            problem = verify_file(tmp_path, total, expected_sha256, etag)
+            if problem:
+                self.log(f"⚠️  Download corrupt ({problem}), restarting")
+                os.remove(tmp_path)
+                offset = 0
+                continue
+            os.replace(tmp_path, path)
+            return offset
+
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
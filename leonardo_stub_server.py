@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Local stub of the Leonardo AI /generations endpoints
+Lets the generator scripts and tests run without an API key:
+
+    python leonardo_stub_server.py --port 8765 --latency 1.5
+    LEONARDO_BASE_URL=http://127.0.0.1:8765 python leonardo_wetcat_generation.py
+
+With --callback-url it also pushes webhooks, e.g. to the scripts' receiver:
+
+    python leonardo_stub_server.py --callback-url http://127.0.0.1:8787/ --callback-token dev
+    LEONARDO_CALLBACK_PORT=8787 LEONARDO_CALLBACK_TOKEN=dev LEONARDO_BASE_URL=http://127.0.0.1:8765 \
+        python generate_wetcat_assets.py
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image
+
+
+def placeholder_png(seed, size=(64, 64)):
+    """A small solid-color PNG derived from `seed` so every generation differs"""
+    value = int.from_bytes(hashlib.sha256(str(seed).encode()).digest()[:4], 'big')
+    color = (value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF, 255)
+    buffer = io.BytesIO()
+    Image.new('RGBA', size, color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class StubLeonardo:
+    """
+    In-memory generation state.
+    Jobs report PENDING until `latency` seconds after submission, then
+    COMPLETE (or FAILED when the prompt contains `fail_marker`).
+    Faults queued with inject() are applied to the next incoming requests.
+    With a `callback_url`, finished generations are also POSTed there the
+    way Leonardo's webhooks deliver them (with `callback_token` as the
+    bearer token).
+    """
+
+    def __init__(self, latency=0.2, fail_marker='FAIL', callback_url=None, callback_token=None):
+        self.latency = latency
+        self.fail_marker = fail_marker
+        self.callback_url = callback_url
+        self.callback_token = callback_token
+        self.base_url = None
+        self.jobs = {}
+        self.images = {}
+        self.lock = threading.Lock()
+        self.submissions = 0
+        self.polls = 0
+        self.downloads = 0
+        self.resumed = 0
+        self.peak_in_flight = 0
+        self.faults = deque()
+        self.faulted = 0
+        self.connections = 0
+
+    def inject(self, status=None, count=1, retry_after=None, delay=0.0, truncate=None):
+        """
+        Make the next `count` requests wait `delay` seconds and/or fail with `status`.
+        With `truncate`, an image download instead drops the connection after
+        that many bytes (of a full-length response).
+        """
+        with self.lock:
+            self.faults.extend([(status, retry_after, delay, truncate)] * count)
+
+    def next_fault(self):
+        with self.lock:
+            if not self.faults:
+                return None
+            self.faulted += 1
+            return self.faults.popleft()
+
+    def in_flight(self, now):
+        return sum(1 for job in self.jobs.values() if now - job['created'] < self.latency)
+
+    def create(self, payload):
+        generation_id = str(uuid.uuid4())
+        now = time.monotonic()
+        with self.lock:
+            self.jobs[generation_id] = {'created': now, 'payload': payload}
+            self.submissions += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight(now))
+        if self.callback_url:
+            threading.Timer(self.latency, self.push, (generation_id,)).start()
+        return generation_id
+
+    def push(self, generation_id):
+        """Deliver a webhook for a finished generation"""
+        result = self.result(generation_id, self.base_url)
+        body = {
+            'type': 'image_generation.complete',
+            'object': 'generation',
+            'data': {'object': {
+                'id': generation_id,
+                'status': result['status'],
+                'images': result['generated_images']
+            }}
+        }
+        headers = {'Content-Type': 'application/json'}
+        if self.callback_token:
+            headers['Authorization'] = f"Bearer {self.callback_token}"
+        request = urllib.request.Request(self.callback_url, json.dumps(body).encode(), headers)
+        try:
+            urllib.request.urlopen(request, timeout=5).close()
+        except OSError:
+            pass
+
+    def status(self, generation_id, base_url):
+        with self.lock:
+            self.polls += 1
+        return self.result(generation_id, base_url)
+
+    def result(self, generation_id, base_url):
+        with self.lock:
+            job = self.jobs.get(generation_id)
+        if job is None:
+            return None
+        if time.monotonic() - job['created'] < self.latency:
+            return {'status': 'PENDING', 'generated_images': []}
+        if self.fail_marker and self.fail_marker in job['payload'].get('prompt', ''):
+            return {'status': 'FAILED', 'generated_images': []}
+        with self.lock:
+            if generation_id not in self.images:
+                size = (job['payload'].get('width', 512) // 8, job['payload'].get('height', 512) // 8)
+                self.images[generation_id] = placeholder_png(job['payload'].get('prompt', generation_id), size)
+        return {
+            'status': 'COMPLETE',
+            'generated_images': [{'url': f"{base_url}/images/{generation_id}.png"}]
+        }
+
+    def image(self, generation_id):
+        with self.lock:
+            self.downloads += 1
+        return self.images.get(generation_id)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so clients can reuse connections
+    protocol_version = 'HTTP/1.1'
+    state = None
+    truncate = None
+
+    def setup(self):
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, code, body):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def base_url(self):
+        return f"http://{self.headers['Host']}"
+
+    def apply_fault(self):
+        """Serve an injected fault; True if the request was answered with an error"""
+        fault = self.state.next_fault()
+        if fault is None:
+            return False
+        status, retry_after, delay, truncate = fault
+        if delay:
+            time.sleep(delay)
+        self.truncate = truncate
+        if status is None:
+            return False
+        data = json.dumps({'error': 'injected fault'}).encode()
+        self.send_response(status)
+        if retry_after is not None:
+            self.send_header('Retry-After', str(retry_after))
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        return True
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        if self.apply_fault():
+            return
+        if self.path.rstrip('/') != '/generations':
+            return self.send_json(404, {'error': 'not found'})
+        payload = json.loads(body or b'{}')
+        generation_id = self.state.create(payload)
+        self.send_json(200, {'sdGenerationJob': {'generationId': generation_id}})
+
+    def do_GET(self):
+        self.truncate = None
+        if self.apply_fault():
+            return
+        match = re.fullmatch(r'/generations/([\w-]+)', self.path)
+        if match:
+            body = self.state.status(match.group(1), self.base_url())
+            if body is None:
+                return self.send_json(404, {'error': 'unknown generation'})
+            return self.send_json(200, {'generations_by_pk': body})
+
+        match = re.fullmatch(r'/images/([\w-]+)\.png', self.path)
+        data = match and self.state.image(match.group(1))
+        if not data:
+            return self.send_json(404, {'error': 'not found'})
+        self.send_image(data)
+
+    def send_image(self, data):
+        """Serve image bytes like a CDN: MD5 ETag, and 206 partial content for Range requests"""
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        start = 0
+        match = re.fullmatch(r'bytes=(\d+)-', self.headers.get('Range', ''))
+        if match and self.headers.get('If-Range', etag) == etag:
+            start = int(match.group(1))
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header('Content-Range', f"bytes */{len(data)}")
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            with self.state.lock:
+                self.state.resumed += 1
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{len(data) - 1}/{len(data)}")
+        else:
+            self.send_response(200)
+        body = data[start:]
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.truncate is not None:
+            # Promised the whole body, deliver part of it and hang up
+            self.wfile.write(body[:self.truncate])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients hanging up mid-response (timeouts, truncation tests) aren't stub bugs
+        pass
+
+
+def start_stub_server(port=0, **options):
+    """Start the stub on a background thread; returns (server, base_url)"""
+    state = StubLeonardo(**options)
+    handler = type('BoundStubHandler', (StubHandler,), {'state': state})
+    server = StubServer(('127.0.0.1', port), handler)
+    server.state = state
+    state.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state.base_url
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Leonardo /generations stub")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=1.0)
+    parser.add_argument('--callback-url', help="POST finished generations here (e.g. a CallbackReceiver)")
+    parser.add_argument('--callback-token', help="bearer token for the webhook POSTs")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(args.port, latency=args.latency, callback_url=args.callback_url,
+                                         callback_token=args.callback_token)
+    print(f"🧪 Leonardo stub listening on {base_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -4,21 +4,21 @@ Leonardo AI Asset Generator for WETCAT Survivors Game
 Requires: LEONARDO_API_KEY environment variable
 """
 
-import requests
-import json
-import time
 import os
-from datetime import datetime
+from generation_cache import GenerationCache
+from adaptive_polling import HISTORY_FILE, AdaptivePoller, CompletionHistory
+from callback_receiver import callback_receiver_from_env
+from generation_scheduler import GenerationJob, GenerationScheduler
+from leonardo_client import LeonardoClient
 
 # Leonardo AI API configuration
 API_KEY = os.environ.get('LEONARDO_API_KEY', '')
-BASE_URL = "https://cloud.leonardo.ai/api/rest/v1"
 
-headers = {
-    "accept": "application/json",
-    "authorization": f"Bearer {API_KEY}",
-    "content-type": "application/json"
-}
+# One pooled, retrying session for every API and CDN call
+CLIENT = LeonardoClient(API_KEY)
+
+# Polls when jobs of the same model usually finish, learned across runs
+POLLER = AdaptivePoller(CompletionHistory(HISTORY_FILE))
 
 def check_api_key():
     """Check if API key is set"""
@@ -31,16 +31,14 @@ def check_api_key():
         return False
     return True
 
-def generate_image(prompt, width=512, height=512, num_images=1, model_id=None, preset_style="LEONARDO"):
-    """Generate an image using Leonardo AI"""
-    
-    generation_url = f"{BASE_URL}/generations"
+def build_payload(prompt, width=512, height=512, num_images=1, model_id=None, preset_style="LEONARDO"):
+    """Build the Leonardo AI generation request for one asset"""
     
     # Use Leonardo Diffusion XL for high quality
     if not model_id:
         model_id = "1e60896f-3c26-4296-8ecc-53e2afecc132"  # Leonardo Diffusion XL
     
-    payload = {
+    return {
         "prompt": prompt,
         "negative_prompt": "blurry, low quality, text, watermark, signature",
         "modelId": model_id,
@@ -56,50 +54,16 @@ def generate_image(prompt, width=512, height=512, num_images=1, model_id=None, p
         "controlNet": False,
         "highResolution": True
     }
-    
-    print(f"🎨 Generating: {prompt[:60]}...")
-    response = requests.post(generation_url, json=payload, headers=headers)
-    
-    if response.status_code != 200:
-        print(f"❌ Error creating generation: {response.status_code} - {response.text}")
-        return None
-        
-    generation_data = response.json()
-    generation_id = generation_data['sdGenerationJob']['generationId']
-    
-    print(f"⏳ Generation ID: {generation_id}")
-    
-    # Poll for completion
-    while True:
-        check_url = f"{BASE_URL}/generations/{generation_id}"
-        response = requests.get(check_url, headers=headers)
-        
-        if response.status_code != 200:
-            print(f"❌ Error checking generation: {response.text}")
-            return None
-            
-        data = response.json()
-        status = data['generations_by_pk']['status']
-        
-        if status == 'COMPLETE':
-            images = data['generations_by_pk']['generated_images']
-            print(f"✅ Generation complete!")
-            return images[0]['url'] if images else None
-        elif status == 'FAILED':
-            print("❌ Generation failed")
-            return None
-            
-        print(f"⏳ Status: {status}...")
-        time.sleep(2)
+
+def generate_image(prompt, width=512, height=512, num_images=1, model_id=None, preset_style="LEONARDO"):
+    """Generate a single image using Leonardo AI and return its URL"""
+    job = GenerationJob(prompt[:60], build_payload(prompt, width, height, num_images, model_id, preset_style))
+    return GenerationScheduler(client=CLIENT, poller=POLLER).run([job])[job.name]
 
 def download_image(url, filename):
-    """Download image from URL"""
+    """Stream an image to disk (verified, resumable, renamed into place when complete)"""
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            with open(filename, 'wb') as f:
-                f.write(response.content)
+        if CLIENT.download(url, filename) is not None:
             print(f"✅ Downloaded: {filename}")
             return True
     except Exception as e:
@@ -185,34 +149,28 @@ if __name__ == "__main__":
     
     print(f"\n📋 Generating {len(assets)} assets...")
     
-    successful = 0
-    failed = 0
-    
-    for i, asset in enumerate(assets, 1):
-        print(f"\n[{i}/{len(assets)}] {asset['name']}")
-        print("-" * 40)
-        
-        # Generate image
-        image_url = generate_image(
-            prompt=asset['prompt'],
-            width=asset['width'],
-            height=asset['height'],
-            preset_style=asset.get('style', 'LEONARDO')
+    jobs = [
+        GenerationJob(
+            asset['name'],
+            build_payload(
+                prompt=asset['prompt'],
+                width=asset['width'],
+                height=asset['height'],
+                preset_style=asset.get('style', 'LEONARDO')
+            ),
+            path=asset['path']
         )
-        
-        if image_url:
-            # Download image
-            if download_image(image_url, asset['path']):
-                successful += 1
-            else:
-                failed += 1
-        else:
-            failed += 1
-        
-        # Rate limiting
-        if i < len(assets):
-            print("\n⏳ Waiting 3 seconds before next generation...")
-            time.sleep(3)
+        for asset in assets
+    ]
+    
+    # Submit everything up front; the scheduler handles concurrency and rate limiting
+    # and skips any asset whose payload is already in the generation cache
+    scheduler = GenerationScheduler(max_concurrency=4, rate_limit=2.0, cache=GenerationCache(), client=CLIENT,
+                                    poller=POLLER, callbacks=callback_receiver_from_env())
+    results = scheduler.run(jobs)
+    
+    successful = sum(1 for url in results.values() if url)
+    failed = len(results) - successful
     
     # Summary
     print("\n" + "=" * 50)
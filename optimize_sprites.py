@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+WETCAT Sprite Optimizer
+Rebuilds every sprite through the asset build graph - downscaled to its
+manifest draw size with NEAREST, stored as an indexed PNG when that's
+lossless - and reports the bytes saved per shipped file.
+
+Usage: python optimize_sprites.py [--dry-run] [sprite names...]
+"""
+
+import argparse
+import os
+
+from asset_build import sprite_graph
+from asset_manifest import SPRITES, output_paths
+
+
+def file_sizes(paths):
+    return {path: os.path.getsize(path) if os.path.exists(path) else 0 for path in paths}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Downscale and recompress shipped sprites")
+    parser.add_argument('names', nargs='*', help="sprite names (default: all)")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would be rebuilt")
+    args = parser.parse_args()
+
+    specs = [spec for spec in SPRITES if not args.names or spec["name"] in args.names]
+    paths = [path for spec in specs for path in output_paths(spec)]
+
+    before = file_sizes(paths)
+    sprite_graph(verbose=False).build([spec["name"] for spec in specs], force=True, dry_run=args.dry_run)
+    after = file_sizes(paths)
+
+    print(f"\n{'file':<42} {'before':>10} {'after':>10} {'saved':>10}")
+    print("-" * 76)
+    for path in paths:
+        if not before[path] and not after[path]:
+            continue
+        saved = before[path] - after[path]
+        print(f"{path:<42} {before[path] / 1024:>8.1f}KB {after[path] / 1024:>8.1f}KB {saved / 1024:>8.1f}KB")
+
+    total_before = sum(before.values())
+    total_after = sum(after.values())
+    print("-" * 76)
+    print(f"🎮 {total_before / 1024:.1f} KB -> {total_after / 1024:.1f} KB "
+          f"({(total_before - total_after) / 1024:.1f} KB saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from PIL import Image
 import os
+from batch_process import run_batch
 
 # Resize the character sprites to game-appropriate sizes
 sprites_to_resize = [
@@ -10,14 +11,24 @@ sprites_to_resize = [
     ("src/assets/sprites/wallet.png", 96, 120)
 ]
 
-for filepath, new_width, new_height in sprites_to_resize:
-    if os.path.exists(filepath):
-        img = Image.open(filepath)
-        # Use high-quality resampling for pixel art
-        resized = img.resize((new_width, new_height), Image.NEAREST)
-        resized.save(filepath)
-        print(f"✅ Resized {filepath} to {new_width}x{new_height}")
-    else:
-        print(f"❌ File not found: {filepath}")
+if __name__ == "__main__":
+    tasks = []
+    for filepath, new_width, new_height in sprites_to_resize:
+        if not os.path.exists(filepath):
+            print(f"❌ File not found: {filepath}")
+            continue
+        # Only the header is read here; sprites already at size are left untouched
+        with Image.open(filepath) as img:
+            if img.size == (new_width, new_height):
+                print(f"⏭️  {filepath} is already {new_width}x{new_height}")
+                continue
+        # Use nearest-neighbour resampling for pixel art
+        tasks.append((filepath, [filepath], [("resize", new_width, new_height)]))
 
-print("\n🎮 Sprites resized for optimal game display!")
\ No newline at end of file
+    for filepath, _, error in run_batch(tasks):
+        if error:
+            print(f"❌ {filepath}: {error}")
+        else:
+            print(f"✅ Resized {filepath}")
+
+    print("\n🎮 Sprites resized for optimal game display!")
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+WETCAT Seamless Tile Extractor
+Finds a repeating texture's period along x and y from its autocorrelation
+(FFT, NumPy), crops the smallest tile that repeats, cross-fades the wrap
+seams so it tiles without a visible edge, and publishes it with mip levels
+(1/2, 1/4, ...) downscaled with wraparound so they tile too. The levels
+are listed under "tiles" in the asset manifest; the game loads the one
+matching the scale it draws the floor at.
+
+A texture with no repeat stronger than MIN_CORRELATION keeps its full
+size: cropping it would show visible repetition. Then only the seams are
+fixed (if needed) and the mips do the shrinking.
+
+Usage: python seamless_tile.py [--source src/assets/sprites/wood_floor_tiles.jpg] [--key woodFloor]
+"""
+
+import argparse
+import io
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+from asset_fingerprint import PUBLISH_DIR, TILES_FILE, URL_PREFIX, fingerprint_assets, publish
+from asset_manifest import SPRITE_DIRS
+from image_variants import TARGET_SSIM, search_quality
+from sprite_processing import write_atomic
+
+TILE_SPECS = [
+    {"key": "woodFloor", "source": os.path.join(SPRITE_DIRS[0], "wood_floor_tiles.jpg"), "name": "wood_floor_tile"},
+]
+OUTPUT_DIR = PUBLISH_DIR
+# A peak this strong in the autocorrelation counts as a repeat
+MIN_CORRELATION = 0.6
+# Seam cross-fade width, as a share of the period
+BLEND_FRACTION = 0.125
+# A wrap seam up to this much stronger than neighbouring pixel steps is left alone
+SEAM_TOLERANCE = 1.25
+MIN_MIP_SIZE = 64
+WRAP_PAD = 8
+
+
+def gray(img):
+    return np.asarray(img.convert("L"), dtype=np.float64)
+
+
+def autocorrelation(values):
+    """
+    Normalized autocorrelation for every non-negative (dy, dx) lag. Zero
+    padding keeps lags from wrapping around; each lag is averaged over its
+    overlap, so long lags aren't biased toward zero.
+    """
+    h, w = values.shape
+    centered = values - values.mean()
+    variance = centered.var()
+    if variance == 0:
+        return np.ones((h, w))
+    spectrum = np.fft.rfft2(centered, s=(2 * h, 2 * w))
+    correlation = np.fft.irfft2(np.abs(spectrum) ** 2, s=(2 * h, 2 * w))[:h, :w]
+    overlap = np.outer(h - np.arange(h), w - np.arange(w))
+    return correlation / overlap / variance
+
+
+def find_period(profile, min_correlation=MIN_CORRELATION):
+    """
+    Smallest lag that repeats the texture along one axis, or len(profile)
+    if none does. Only lags seen at least twice (up to half the size) and
+    past the zero-lag lobe count; harmonics of a stronger, longer period
+    are skipped by taking the first peak within 90% of the best.
+    """
+    size = len(profile)
+    lag = 1
+    while lag < size // 2 and profile[lag] <= profile[lag - 1]:
+        lag += 1
+    peaks = [i for i in range(max(lag, 2), size // 2 + 1)
+             if i + 1 < size and profile[i] >= profile[i - 1] and profile[i] >= profile[i + 1]
+             and profile[i] >= min_correlation]
+    if not peaks:
+        return size
+    best = max(profile[i] for i in peaks)
+    return next(i for i in peaks if profile[i] >= 0.9 * best)
+
+
+def texture_period(img, min_correlation=MIN_CORRELATION):
+    """(period x, period y) in pixels"""
+    correlation = autocorrelation(gray(img))
+    return find_period(correlation[0], min_correlation), find_period(correlation[:, 0], min_correlation)
+
+
+def seam_error(values, axis):
+    """Mean step across the wrap seam relative to the mean step between neighbouring pixels"""
+    steps = np.abs(np.diff(values, axis=axis)).mean()
+    first = np.take(values, 0, axis=axis)
+    last = np.take(values, -1, axis=axis)
+    return np.abs(first - last).mean() / steps if steps else 0.0
+
+
+def blend_axis(region, period, blend, axis):
+    """
+    `period` samples of `region` (which holds period + blend) starting at
+    `blend`; the last `blend` fade into the samples just before the start,
+    so the end meets the beginning without a seam
+    """
+    region = np.moveaxis(region, axis, 0)
+    tile = region[blend:blend + period].copy()
+    if blend:
+        weight = (np.arange(1, blend + 1) / blend).reshape((-1,) + (1,) * (region.ndim - 1))
+        tile[period - blend:] = tile[period - blend:] * (1 - weight) + region[:blend] * weight
+    return np.moveaxis(tile, 0, axis)
+
+
+def extract_tile(img, period=None, blend_fraction=BLEND_FRACTION, seam_tolerance=SEAM_TOLERANCE):
+    """The smallest seamless tile of `img` (a PIL image of the same mode)"""
+    pixels = np.asarray(img, dtype=np.float64)
+    values = gray(img)
+    period = list(period or texture_period(img))
+    for axis, size in ((1, img.width), (0, img.height)):
+        index = 0 if axis == 1 else 1
+        blend = max(1, int(period[index] * blend_fraction))
+        full = period[index] >= size
+        if full and seam_error(values, axis) <= seam_tolerance:
+            continue
+        if full or period[index] + blend > size:
+            # No room past the tile for the fade: give up `blend` pixels of it
+            period[index] = size - blend
+        pixels = blend_axis(np.take(pixels, range(period[index] + blend), axis=axis), period[index], blend, axis)
+    return Image.fromarray(np.clip(np.rint(pixels), 0, 255).astype(np.uint8), img.mode)
+
+
+def downscale_wrapped(img, size):
+    """Resize a seamless tile, sampling across its wrap edges so the result tiles too"""
+    pixels = np.asarray(img)
+    pad = ((WRAP_PAD, WRAP_PAD), (WRAP_PAD, WRAP_PAD)) + ((0, 0),) * (pixels.ndim - 2)
+    padded = Image.fromarray(np.pad(pixels, pad, mode="wrap"), img.mode)
+    sx, sy = size[0] / img.width, size[1] / img.height
+    scaled = padded.resize((round(padded.width * sx), round(padded.height * sy)), Image.LANCZOS)
+    left, top = round(WRAP_PAD * sx), round(WRAP_PAD * sy)
+    return scaled.crop((left, top, left + size[0], top + size[1]))
+
+
+def mip_levels(tile, min_size=MIN_MIP_SIZE):
+    """[(scale, image)] from the full tile down by halves while both sides stay >= min_size"""
+    levels = [(1.0, tile)]
+    while min(levels[-1][1].size) // 2 >= min_size:
+        scale = levels[-1][0] / 2
+        size = (max(1, round(tile.width * scale)), max(1, round(tile.height * scale)))
+        levels.append((scale, downscale_wrapped(tile, size)))
+    return levels
+
+
+def encode_level(img, ext, target=TARGET_SSIM):
+    if ext == "png":
+        buffer = io.BytesIO()
+        img.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue()
+    return search_quality(img, "jpg", target)[1]
+
+
+def build_tiles(spec, output_dir=OUTPUT_DIR, min_correlation=MIN_CORRELATION):
+    """Publish the tile and its mips (hashed only) into `output_dir`; returns the manifest entry"""
+    with Image.open(spec["source"]) as source:
+        source.load()
+        mode = "RGBA" if "A" in source.getbands() else "RGB"
+        img = source.convert(mode)
+    ext = "png" if mode == "RGBA" else "jpg"
+    period = texture_period(img, min_correlation)
+    tile = extract_tile(img, period)
+
+    levels = []
+    for index, (scale, level) in enumerate(mip_levels(tile)):
+        suffix = f"_{index}" if index else ""
+        path = os.path.join(output_dir, f"{spec['name']}{suffix}.{ext}")
+        data = encode_level(level, ext)
+        levels.append({"scale": scale, "width": level.width, "height": level.height,
+                       "url": URL_PREFIX + publish(path, data), "bytes": len(data)})
+    return {"source": list(img.size), "period": list(period), "tile": list(tile.size), "levels": levels}
+
+
+def write_tiles(specs=TILE_SPECS, output_dir=OUTPUT_DIR, min_correlation=MIN_CORRELATION, tiles_file=TILES_FILE):
+    """Build every tile and write `tiles_file` (read by asset_fingerprint.py); returns the entries"""
+    tiles = {spec["key"]: build_tiles(spec, output_dir, min_correlation) for spec in specs}
+    manifest = {key: {"levels": [{k: v for k, v in level.items() if k != "bytes"} for level in entry["levels"]]}
+                for key, entry in tiles.items()}
+    write_atomic(tiles_file, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return tiles
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract a minimal seamless tile plus mip levels")
+    parser.add_argument("--source", help="texture to tile (default: every TILE_SPECS entry)")
+    parser.add_argument("--key", default="woodFloor", help="asset name for --source")
+    parser.add_argument("--name", help="output file stem for --source")
+    parser.add_argument("--min-correlation", type=float, default=MIN_CORRELATION)
+    args = parser.parse_args()
+
+    specs = TILE_SPECS
+    if args.source:
+        name = args.name or os.path.splitext(os.path.basename(args.source))[0] + "_tile"
+        specs = [{"key": args.key, "source": args.source, "name": name}]
+
+    tiles = write_tiles(specs, min_correlation=args.min_correlation)
+    for spec in specs:
+        entry = tiles[spec["key"]]
+        original = os.path.getsize(spec["source"])
+        print(f"🧱 {spec['key']}: {entry['source'][0]}x{entry['source'][1]} ({original / 1024:.1f} KB), "
+              f"period {entry['period'][0]}x{entry['period'][1]} -> tile {entry['tile'][0]}x{entry['tile'][1]}")
+        for level in entry["levels"]:
+            print(f"   {level['scale']:g}x {level['width']:>4}x{level['height']:<4} {level['bytes'] / 1024:7.1f} KB"
+                  f"  {level['url']}")
+    fingerprint_assets()
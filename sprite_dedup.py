@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+WETCAT Sprite Dedup
+Exact (sha256) and perceptual (aHash/dHash) hashes for sprites, indexed so
+a new frame is checked against everything seen in a few lookups. Leonardo
+often returns near-identical frames; the generation pipeline uses this to
+link byte-identical sprites instead of writing a second copy and to flag
+"walk cycle" frames that are really the same image.
+
+Perceptual hashes are taken over the alpha-keyed sprite (transparent pixels
+count as black, transparent borders are trimmed), so background noise
+under alpha 0 and placement within the canvas don't hide a duplicate.
+
+Usage: python sprite_dedup.py [--max-distance 4] [--json] [dirs...]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import defaultdict
+
+import numpy as np
+from PIL import Image
+
+from asset_fingerprint import FINGERPRINTED
+from asset_manifest import SPRITE_DIRS, SPRITES, output_paths, sprite_spec
+from file_index import scan
+from sprite_processing import link_or_copy
+
+HASH_SIZE = 8
+HASH_BITS = HASH_SIZE * HASH_SIZE
+# dHash is split into this many bands; any two hashes within BANDS - 1 bits
+# share at least one band exactly, so candidates come from a dict lookup
+BANDS = 8
+BAND_BITS = HASH_BITS // BANDS
+MAX_DISTANCE = 4
+SCAN_ROOTS = ["public", "assets", "src/assets", "wetcat_assets"]
+
+
+def alpha_keyed(img):
+    """Grayscale with transparent pixels forced to black, cropped to the visible sprite"""
+    img = img.convert("RGBA")
+    bbox = img.getchannel("A").getbbox()
+    if bbox:
+        img = img.crop(bbox)
+    pixels = np.asarray(img, dtype=np.float32)
+    gray = pixels[..., :3] @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    return Image.fromarray((gray * pixels[..., 3] / 255).astype(np.uint8), "L")
+
+
+def bits_to_int(bits):
+    return int("".join("1" if bit else "0" for bit in bits.ravel()), 2)
+
+
+def ahash(gray):
+    small = np.asarray(gray.resize((HASH_SIZE, HASH_SIZE), Image.BOX), dtype=np.float32)
+    return bits_to_int(small > small.mean())
+
+
+def dhash(gray):
+    small = np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.BOX), dtype=np.int16)
+    return bits_to_int(small[:, 1:] > small[:, :-1])
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def sprite_hashes(data):
+    """{"sha256", "ahash", "dhash"} for encoded image bytes"""
+    with Image.open(io.BytesIO(data)) as img:
+        gray = alpha_keyed(img)
+    return {"sha256": hashlib.sha256(data).hexdigest(), "ahash": ahash(gray), "dhash": dhash(gray)}
+
+
+def bands(value):
+    mask = (1 << BAND_BITS) - 1
+    return [(band, (value >> (band * BAND_BITS)) & mask) for band in range(BANDS)]
+
+
+class Match:
+    """`name` duplicates `other`: kind is "exact" (same bytes) or "near" (perceptual distance)"""
+
+    def __init__(self, kind, name, other, distance=0):
+        self.kind = kind
+        self.name = name
+        self.other = other
+        self.distance = distance
+
+    @property
+    def same_cycle(self):
+        """Both frames of one animation (wetcat_walk1 / wetcat_walk2 / wetcat_stand)"""
+        return self.name.rsplit("_", 1)[0] == self.other.rsplit("_", 1)[0]
+
+    def __repr__(self):
+        return f"Match({self.kind}, {self.name!r} ~ {self.other!r}, {self.distance})"
+
+
+class DuplicateIndex:
+    """sha256 -> names, plus dHash bands -> names for near-duplicate candidates"""
+
+    def __init__(self, max_distance=MAX_DISTANCE):
+        if max_distance >= BANDS:
+            raise ValueError(f"max_distance must be below {BANDS} for banded lookup")
+        self.max_distance = max_distance
+        self.hashes = {}
+        self.exact = defaultdict(set)
+        self.banded = defaultdict(set)
+
+    def add(self, name, hashes):
+        self.remove(name)
+        self.hashes[name] = hashes
+        self.exact[hashes["sha256"]].add(name)
+        for band in bands(hashes["dhash"]):
+            self.banded[band].add(name)
+
+    def remove(self, name):
+        hashes = self.hashes.pop(name, None)
+        if hashes:
+            self.exact[hashes["sha256"]].discard(name)
+            for band in bands(hashes["dhash"]):
+                self.banded[band].discard(name)
+
+    def match(self, name, hashes):
+        """Closest other entry duplicating `hashes`, or None"""
+        exact = sorted(self.exact.get(hashes["sha256"], set()) - {name})
+        if exact:
+            return Match("exact", name, exact[0])
+        candidates = set()
+        for band in bands(hashes["dhash"]):
+            candidates |= self.banded.get(band, set())
+        best = None
+        for other in sorted(candidates - {name}):
+            known = self.hashes[other]
+            distance = max(hamming(hashes["dhash"], known["dhash"]), hamming(hashes["ahash"], known["ahash"]))
+            if distance <= self.max_distance and (best is None or distance < best.distance):
+                best = Match("near", name, other, distance)
+        return best
+
+
+class SpriteDeduper:
+    """
+    Pipeline stage state: seeded with the sprites already published in
+    `sprite_dir`, then every checked frame joins the index under its name
+    (replacing its previous version, which never counts as a duplicate).
+    """
+
+    def __init__(self, sprite_dir=SPRITE_DIRS[0], max_distance=MAX_DISTANCE, verbose=True):
+        self.index = DuplicateIndex(max_distance)
+        self.lock = threading.Lock()
+        self.verbose = verbose
+        self.matches = []
+        for spec in SPRITES:
+            path = os.path.join(sprite_dir, f"{spec['name']}.{spec.get('ext', 'png')}")
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    self.index.add(spec["name"], sprite_hashes(f.read()))
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def check(self, name, data):
+        """Index `data` as sprite `name`; returns the Match it duplicates, or None"""
+        hashes = sprite_hashes(data)
+        with self.lock:
+            match = self.index.match(name, hashes)
+            self.index.add(name, hashes)
+            if match:
+                self.matches.append(match)
+        if match and match.kind == "exact":
+            self.log(f"♻️  {name} is byte-identical to {match.other}")
+        elif match:
+            hint = " (same animation: are these really different frames?)" if match.same_cycle else ""
+            self.log(f"⚠️  {name} looks like {match.other}, distance {match.distance}{hint}")
+        return match
+
+
+def link_duplicate(match, outputs):
+    """Point a sprite's outputs at the files of the sprite it duplicates"""
+    for source, path in zip(output_paths(sprite_spec(match.other)), outputs):
+        link_or_copy(source, path)
+    return outputs
+
+
+def find_duplicates(roots=SCAN_ROOTS, max_distance=MAX_DISTANCE):
+    """
+    {"exact": [[paths]], "near": [(path, path, distance)]} across image files,
+    ignoring fingerprinted copies and same-named mirrors in the sprite dirs
+    """
+    index = DuplicateIndex(max_distance)
+    exact = defaultdict(list)
+    near = []
+    for path, _ in scan(roots, suffixes=(".png", ".jpg", ".jpeg", ".webp")):
+        if FINGERPRINTED.match(os.path.basename(path)):
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            hashes = sprite_hashes(data)
+        except OSError:
+            continue
+        exact[hashes["sha256"]].append(path)
+        if len(exact[hashes["sha256"]]) > 1:
+            continue
+        match = index.match(path, hashes)
+        # A source and its built output share a file name and are meant to look alike
+        if match and match.kind == "near" and os.path.basename(match.other) != os.path.basename(path):
+            near.append((match.other, path, match.distance))
+        index.add(path, hashes)
+
+    groups = []
+    for paths in exact.values():
+        if len({os.path.basename(path) for path in paths}) > 1:
+            groups.append(sorted(paths))
+    return {"exact": sorted(groups), "near": sorted(near, key=lambda pair: pair[2])}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find exact and near-duplicate sprites")
+    parser.add_argument("dirs", nargs="*", default=SCAN_ROOTS)
+    parser.add_argument("--max-distance", type=int, default=MAX_DISTANCE,
+                        help=f"max aHash/dHash bit distance for a near duplicate (< {BANDS})")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    report = find_duplicates(args.dirs, args.max_distance)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"👯 Byte-identical ({len(report['exact'])} groups)")
+        for paths in report["exact"]:
+            size = os.path.getsize(paths[0])
+            print(f"   {size / 1024:.1f} KB x{len(paths)}")
+            for path in paths:
+                print(f"      {path}")
+        print(f"\n🔍 Near-duplicates ({len(report['near'])})")
+        for first, second, distance in report["near"]:
+            print(f"   {distance:>2}  {first}\n       {second}")
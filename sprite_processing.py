@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+WETCAT Sprite Processing
+Decode once, transform once, write everywhere: downloaded sprite bytes are
+decoded in memory, chroma-keyed and resized a single time, and the encoded
+PNG is fanned out to every destination (hard-linked where possible).
+Requires: numpy, Pillow
+"""
+
+import io
+import os
+import shutil
+
+import numpy as np
+from PIL import Image
+
+from chroma_key import key_color, key_corners
+
+
+def decode_image(data):
+    """Decode image bytes in memory as RGBA"""
+    return Image.open(io.BytesIO(data)).convert("RGBA")
+
+
+def to_indexed(img):
+    """
+    Exact palette version of an RGBA image (per-entry alpha via tRNS),
+    or None if it has more than 256 distinct colors and can't be indexed losslessly.
+    """
+    rgba = np.asarray(img.convert("RGBA"))
+    colors, indices = np.unique(rgba.reshape(-1, 4), axis=0, return_inverse=True)
+    if len(colors) > 256:
+        return None
+    indexed = Image.fromarray(indices.reshape(rgba.shape[:2]).astype(np.uint8), "P")
+    indexed.putpalette(colors[:, :3].flatten().tolist())
+    indexed.info["transparency"] = bytes(colors[:, 3].tolist())
+    return indexed
+
+
+def encode_png_optimized(img):
+    """Smallest lossless PNG: indexed when the colors allow it, optimized deflate either way"""
+    rgba = img.convert("RGBA")
+    candidates = [rgba]
+    if rgba.getchannel("A").getextrema() == (255, 255):
+        candidates.append(rgba.convert("RGB"))
+    indexed = to_indexed(rgba)
+    if indexed is not None:
+        candidates.append(indexed)
+
+    best = None
+    for candidate in candidates:
+        buffer = io.BytesIO()
+        options = {"optimize": True}
+        if candidate.mode == "P":
+            options["transparency"] = candidate.info["transparency"]
+        candidate.save(buffer, "PNG", **options)
+        if best is None or buffer.tell() < len(best):
+            best = buffer.getvalue()
+    return best
+
+
+def encode_image(img, ext):
+    """Encode an image for the given file extension (png/jpg)"""
+    if ext.lower() in ("jpg", "jpeg"):
+        buffer = io.BytesIO()
+        img.convert("RGB").save(buffer, "JPEG", quality=90)
+        return buffer.getvalue()
+    return encode_png_optimized(img)
+
+
+def fit_within(img, max_width, max_height):
+    """Downscale with NEAREST to fit inside max_width x max_height, keeping aspect ratio"""
+    scale = min(max_width / img.width, max_height / img.height)
+    if scale >= 1:
+        return img
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img.resize(size, Image.NEAREST)
+
+
+def apply_transforms(img, steps):
+    """
+    Run a declarative transform chain, e.g.
+        [("chroma_key",), ("resize", 64, 80)]
+    Steps are plain tuples so they can be shipped to worker processes.
+    """
+    for op, *args in steps:
+        if op == "chroma_key":
+            img = key_corners(img, opaque_corners_only=True)
+        elif op == "key_color":
+            img = key_color(img, tolerance=args[0] if args else 50)
+        elif op == "resize":
+            if img.size != tuple(args):
+                img = img.resize(tuple(args), Image.NEAREST)
+        elif op == "fit":
+            img = fit_within(img, *args)
+        else:
+            raise ValueError(f"Unknown transform: {op}")
+    return img
+
+
+def write_atomic(path, data):
+    """Write bytes via a temp file + rename so readers never see half a sprite"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def link_or_copy(source, destination):
+    """Hard-link `destination` to `source`, falling back to a copy across filesystems"""
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    if os.path.lexists(destination):
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            return
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def write_outputs(data, paths, link=True):
+    """Write encoded bytes to the first path and hard-link/copy the rest"""
+    paths = list(paths)
+    if not paths:
+        return []
+    first = paths[0]
+    # os.replace swaps the directory entry, so an old hard link is never written through
+    write_atomic(first, data)
+    for path in paths[1:]:
+        if link:
+            link_or_copy(first, path)
+        else:
+            write_atomic(path, data)
+    return paths
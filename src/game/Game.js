@@ -1,10 +1,14 @@
 import { GameLoop } from './GameLoop.js';
 import { StateManager } from './states/StateManager.js';
 import { InputManager } from './systems/InputManager.js';
-import { AssetLoader } from './systems/AssetLoader.js';
+import { AssetLoader, ProgressiveImage, chooseVariant, imagePreview } from './systems/AssetLoader.js';
+import { soundManager } from './systems/SoundManager.js';
 import { Camera } from './systems/Camera.js';
 import { Renderer } from './systems/Renderer.js';
 import { GameDebugger } from './debug/GameDebugger.js';
+import { ASSET_MANIFEST } from './data/assetManifest.js';
+import { FLOOR_SCALE } from './config/constants.js';
+import { EffectSprites } from './effects/ParticleSystem.js';
 
 export class Game {
   constructor(canvasId) {
@@ -31,6 +35,7 @@ export class Game {
     this.stateManager = new StateManager(this);
     this.inputManager = new InputManager(this.canvas);
     this.assetLoader = new AssetLoader();
+    this.effectSprites = null;
     this.camera = new Camera(this.width, this.height);
     this.renderer = new Renderer(this.ctx, this.camera);
 
@@ -82,6 +87,42 @@ export class Game {
 
     this.canvas.style.width = `${this.width * scale}px`;
     this.canvas.style.height = `${this.height * scale}px`;
+    this.displayScale = scale;
+  }
+
+  // Mip level of a seamless tile (python seamless_tile.py) for drawing it at
+  // `scale` canvas pixels per source pixel on this screen, or null without one
+  tileLevel(name, scale) {
+    const tile = ASSET_MANIFEST.tiles && ASSET_MANIFEST.tiles[name];
+    if (!tile || tile.levels.length === 0) {
+      return null;
+    }
+    const devicePixels = (this.displayScale || 1) * (window.devicePixelRatio || 1);
+    const needed = scale * Math.min(1, devicePixels);
+    // Levels run from full size down: take the smallest with enough pixels
+    return [...tile.levels].reverse().find(level => level.scale >= needed) || tile.levels[0];
+  }
+
+  // The responsive variant of an image (python image_variants.py) that matches
+  // the screen ({ url, scale, width, height }), or null without one. The canvas
+  // backing store is this.width pixels wide, so more than 1x can't add detail
+  // and is never picked.
+  imageVariant(name) {
+    const variants = ASSET_MANIFEST.variants && ASSET_MANIFEST.variants[name];
+    if (!variants || variants.length === 0) {
+      return null;
+    }
+    const devicePixels = (this.displayScale || 1) * (window.devicePixelRatio || 1);
+    return chooseVariant(variants, Math.min(1, devicePixels));
+  }
+
+  // A large image that draws its blurred preview until it has streamed in: the
+  // variant sized for the screen when they have been built, else `fallbackPath`
+  progressiveImage(name, fallbackPath) {
+    const variant = this.imageVariant(name);
+    return variant
+      ? new ProgressiveImage(variant.url, imagePreview(name, variant.scale))
+      : new ProgressiveImage(fallbackPath);
   }
 
   async init() {
@@ -105,30 +146,54 @@ export class Game {
   }
 
   async loadAssets() {
-    // Generate placeholder assets for development
-    this.assetLoader.generatePlaceholderAssets();
+    // Every sound effect is one sprite (python audio_sprite.py); boot doesn't wait
+    // for the decode, sounds played before it's ready use their own files
+    soundManager.loadSprite('sfx.json');
+
+    // Placeholders come pre-baked in one sheet that loads alongside the real
+    // assets and only fills names they don't provide; canvases are drawn only
+    // when the sheet hasn't been built
+    const placeholders = ASSET_MANIFEST.placeholders
+      ? this.assetLoader.loadPlaceholders(ASSET_MANIFEST.placeholders)
+      : null;
+    if (!placeholders) {
+      this.assetLoader.generatePlaceholderAssets();
+    }
 
-    // Load real assets with cache busting
-    const cacheBuster = `?v=${Date.now()}`;
+    // Real assets come from the generated manifest (python asset_fingerprint.py):
+    // every URL is content-hashed, so the browser only refetches sprites that changed
     const assets = {
-      images: {
-        woodFloor: `sprites/wood_floor_tiles.jpg${cacheBuster}`,
-        wetcatStand: `sprites/wetcat_stand.png${cacheBuster}`,
-        wetcatWalk1: `sprites/wetcat_walk1.png${cacheBuster}`,
-        wetcatWalk2: `sprites/wetcat_walk2.png${cacheBuster}`,
-        // Coin and wallet sprites
-        coin: `sprites/coin.png${cacheBuster}`,
-        wallet: `sprites/wallet.png${cacheBuster}`,
-        // Scammer sprites (using kid sprites for now)
-        scammer1Stand: `sprites/kid1_stand.png${cacheBuster}`,
-        scammer1Walk: `sprites/kid1_walk.png${cacheBuster}`,
-        scammer2Stand: `sprites/kid2_stand.png${cacheBuster}`,
-        scammer2Walk: `sprites/kid2_walk.png${cacheBuster}`,
-        scammer3Stand: `sprites/kid3_stand.png${cacheBuster}`,
-        scammer3Walk: `sprites/kid3_walk.png${cacheBuster}`
-      }
+      images: { ...ASSET_MANIFEST.images }
     };
-    await this.assetLoader.loadAll(assets);
+
+    // The floor is a seamless tile with mip levels (python seamless_tile.py):
+    // only the level matching how large it is drawn gets downloaded
+    const floor = this.tileLevel('woodFloor', FLOOR_SCALE);
+    if (floor) {
+      assets.images.woodFloor = floor.url;
+      this.assetLoader.setScale('woodFloor', floor.scale);
+    }
+
+    // Particles are blitted from a pre-rendered sheet (python effect_sprites.py)
+    // once it arrives; until then, or without one, they're drawn as vectors
+    const effects = ASSET_MANIFEST.effects
+      ? this.assetLoader.loadAtlas(ASSET_MANIFEST.effects, { name: 'effects' }).then(atlas => {
+        if (atlas) {
+          this.effectSprites = new EffectSprites(this.assetLoader, atlas.meta.effects);
+        }
+      })
+      : null;
+
+    // Character and item frames come from one packed atlas when it has been built
+    // (python atlas_packer.py); anything not in it is still loaded individually
+    const atlas = ASSET_MANIFEST.atlas && await this.assetLoader.loadAtlas(ASSET_MANIFEST.atlas);
+    if (atlas) {
+      for (const name of Object.keys(atlas.frames)) {
+        delete assets.images[name];
+      }
+    }
+
+    await Promise.all([this.assetLoader.loadAll(assets), placeholders, effects]);
   }
 
   update(deltaTime) {
@@ -0,0 +1,4 @@
+// Layout constants shared by the game states and asset loading
+
+// The wood floor is drawn at half its source size (Game picks the mip level to match)
+export const FLOOR_SCALE = 0.5;
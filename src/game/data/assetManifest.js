@@ -0,0 +1,86 @@
+// Generated by asset_fingerprint.py - do not edit by hand.
+// Maps asset names to content-hashed URLs under public/.
+export const ASSET_MANIFEST = {
+  "atlas": "sprites/atlas.632e740678.json",
+  "effects": "sprites/effects.bf7cf71cb4.json",
+  "images": {
+    "coin": "sprites/coin.faaab6febe.png",
+    "scammer1Stand": "sprites/kid1_stand.06e4e3c1af.png",
+    "scammer1Walk": "sprites/kid1_walk.caeb725361.png",
+    "scammer2Stand": "sprites/kid2_stand.ceca5c2d7f.png",
+    "scammer2Walk": "sprites/kid2_walk.af9866b9da.png",
+    "scammer3Stand": "sprites/kid3_stand.d05d54e9a0.png",
+    "scammer3Walk": "sprites/kid3_walk.001ce940fe.png",
+    "wallet": "sprites/wallet.a27e675295.png",
+    "wetcatStand": "sprites/wetcat_stand.c8c336f7a2.png",
+    "wetcatWalk1": "sprites/wetcat_walk1.f8145ff81e.png",
+    "wetcatWalk2": "sprites/wetcat_walk2.fe2c44ce17.png",
+    "woodFloor": "sprites/wood_floor_tiles.47463612f0.jpg"
+  },
+  "music": {},
+  "placeholders": "sprites/placeholders.c5be7e9135.json",
+  "tiles": {
+    "woodFloor": {
+      "levels": [
+        {
+          "height": 832,
+          "scale": 1.0,
+          "url": "sprites/wood_floor_tile.a6c752005c.jpg",
+          "width": 1472
+        },
+        {
+          "height": 416,
+          "scale": 0.5,
+          "url": "sprites/wood_floor_tile_1.60009f2bfc.jpg",
+          "width": 736
+        },
+        {
+          "height": 208,
+          "scale": 0.25,
+          "url": "sprites/wood_floor_tile_2.799539b332.jpg",
+          "width": 368
+        },
+        {
+          "height": 104,
+          "scale": 0.125,
+          "url": "sprites/wood_floor_tile_3.17769076d1.jpg",
+          "width": 184
+        }
+      ]
+    }
+  },
+  "variants": {
+    "logo": [
+      {
+        "fallback": "images/wetcat_logo-0.5x.68d5a59afa.jpg",
+        "height": 100,
+        "scale": 0.5,
+        "webp": "images/wetcat_logo-0.5x.c570720b74.webp",
+        "width": 200
+      },
+      {
+        "fallback": "images/wetcat_logo-1x.afdbcb798a.jpg",
+        "height": 200,
+        "scale": 1.0,
+        "webp": "images/wetcat_logo-1x.ab1be921bb.webp",
+        "width": 400
+      }
+    ],
+    "menuBackground": [
+      {
+        "fallback": "images/menu_background-0.5x.51c4fdd9fd.jpg",
+        "height": 360,
+        "scale": 0.5,
+        "webp": "images/menu_background-0.5x.6d29663736.webp",
+        "width": 640
+      },
+      {
+        "fallback": "images/menu_background-1x.4a487502c9.jpg",
+        "height": 720,
+        "scale": 1.0,
+        "webp": "images/menu_background-1x.6788ff7a39.webp",
+        "width": 1280
+      }
+    ]
+  }
+};
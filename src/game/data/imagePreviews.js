@@ -0,0 +1,19 @@
+// Generated by image_previews.py - do not edit by hand.
+// 1x size and a tiny blurred preview for every large image the game loads, by asset name.
+export const IMAGE_PREVIEWS = {
+  "logo": {
+    "height": 200,
+    "preview": "data:image/webp;base64,UklGRrYAAABXRUJQVlA4IKoAAADQBACdASoYAAwAPu1iqU2ppaOiMAgBMB2JaACdMoAlshl82iiDKt7g5NyaazHAAAD+7jqswVnaswIf0FeCn2Z6oAa/2/id99+j/y8oPMF3lJdbFld1hPx+ax65aApW4MiUT6+38WDHRbUaF62WS+cVfmp+2RAN/foFFcHkOeJdhup8kZw+oQTSVl0TF3WD6Zt1uqiJND5qM6ITUxGVviRUPZHYMV7xfYeAAA==",
+    "width": 400
+  },
+  "menuBackground": {
+    "height": 720,
+    "preview": "data:image/webp;base64,UklGRqIAAABXRUJQVlA4IJYAAAAQBACdASoYAA4APu1iqU2ppaOiMAgBMB2JbACdMoR3ACRAsN93rYTCAAD+v8Z2ti16gWvYNPczZaKMCD/Lf7mVlzd/1Ekxm+gUhk14vfo/KBOYNOmDN2rr5faOP11XtHzyBz72XOqyMaCG1rmoHUmFvQ8cOrJf4ZzVuZVpFtvFj66VBvs/cUMBXErYDcrojXAEU/y4kAA=",
+    "width": 1280
+  },
+  "woodFloor": {
+    "height": 832,
+    "preview": "data:image/webp;base64,UklGRpIAAABXRUJQVlA4IIYAAAAwBACdASoYAA4APu1iqU2ppaOiMAgBMB2JYgCsLwABhLZqgxD13YpPKgAA91C6nrdvJP/0E3FU8lzvMWd8qvjnjkKVjaEB97KMLdQnrbMh/1O7LUbHO+27EGMvcVn3VnXAz61x33Ulv/tgAnCHLnq3bX2FgkrcmcmEE+UXjqxdGZZUBMpAAA==",
+    "width": 1472
+  }
+};
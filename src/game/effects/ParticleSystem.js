@@ -1,3 +1,69 @@
+import { AtlasFrame } from '../systems/AssetLoader.js';
+
+// Pre-rendered particle frames from the effects atlas (python effect_sprites.py);
+// the atlas meta lists the baked sizes and colours.
+// Each draw call blits the nearest frame centred on (x, y) and returns
+// false when there isn't one, so the caller falls back to vector drawing.
+export class EffectSprites {
+  constructor(assetLoader, meta) {
+    this.assetLoader = assetLoader;
+    this.meta = meta || {};
+  }
+
+  frame(name) {
+    const frame = this.assetLoader.get(name);
+    return frame instanceof AtlasFrame ? frame : null;
+  }
+
+  // Smallest baked size that covers `size` (scaling down looks better than up)
+  static nearest(sizes, size) {
+    return sizes.find(baked => baked >= size) || sizes[sizes.length - 1];
+  }
+
+  static colorKey(color) {
+    return color.replace('#', '').toLowerCase();
+  }
+
+  drawFrame(ctx, frame, x, y, scale) {
+    if (!frame) return false;
+    const width = frame.width * scale;
+    const height = frame.height * scale;
+    frame.draw(ctx, x - width / 2, y - height / 2, width, height);
+    return true;
+  }
+
+  drawDollar(ctx, x, y, size, color, rotation) {
+    const dollar = this.meta.dollar;
+    if (!dollar || color.toUpperCase() !== dollar.color.toUpperCase()) return false;
+    const baked = EffectSprites.nearest(dollar.sizes, size);
+    const turns = rotation / (Math.PI * 2);
+    const step = ((Math.round(turns * dollar.rotations) % dollar.rotations) + dollar.rotations) % dollar.rotations;
+    return this.drawFrame(ctx, this.frame(`fx_dollar_${baked}_${step}`), x, y, size / baked);
+  }
+
+  drawDisc(ctx, x, y, radius, color) {
+    const disc = this.meta.disc;
+    if (!disc) return false;
+    const baked = EffectSprites.nearest(disc.sizes, radius);
+    const frame = this.frame(`fx_disc_${EffectSprites.colorKey(color)}_${baked}`);
+    return this.drawFrame(ctx, frame, x, y, radius / baked);
+  }
+
+  // `armLength` is the sparkle's current reach, 0..size
+  drawSparkle(ctx, x, y, size, armLength, color) {
+    const sparkle = this.meta.sparkle;
+    if (!sparkle) return false;
+    const baked = EffectSprites.nearest(sparkle.sizes, size);
+    const step = Math.round((armLength / size) * sparkle.steps);
+    const frame = this.frame(`fx_sparkle_${EffectSprites.colorKey(color)}_${baked}_${Math.max(step, 1)}`);
+    if (!frame) return false;
+    if (step > 0) { // At step 0 the cross has collapsed to nothing
+      this.drawFrame(ctx, frame, x, y, size / baked);
+    }
+    return true;
+  }
+}
+
 export class Particle {
   constructor(x, y, config) {
     this.x = x;
@@ -29,7 +95,8 @@ export class Particle {
     return this.life > 0;
   }
 
-  render(ctx) {
+  // `sprites` (an EffectSprites) blits pre-rendered frames where it has them
+  render(ctx, sprites = null) {
     const alpha = this.fade ? (this.life / this.maxLife) : 1;
 
     ctx.save();
@@ -37,6 +104,7 @@ export class Particle {
 
     switch (this.type) {
     case 'dollar':
+      if (sprites && sprites.drawDollar(ctx, this.x, this.y, this.size, this.color, this.rotation)) break;
       // Draw dollar sign
       ctx.fillStyle = this.color;
       ctx.font = `${this.size}px Arial`;
@@ -50,6 +118,7 @@ export class Particle {
       break;
 
     case 'splash':
+      if (sprites && sprites.drawDisc(ctx, this.x, this.y, this.size, '#4FC3F7')) break;
       // Draw water droplet
       ctx.fillStyle = '#4FC3F7';
       ctx.beginPath();
@@ -57,11 +126,12 @@ export class Particle {
       ctx.fill();
       break;
 
-    case 'sparkle':
+    case 'sparkle': {
+      const sparkleSize = this.size * (0.5 + Math.sin(this.rotation * 10) * 0.5);
+      if (sprites && sprites.drawSparkle(ctx, this.x, this.y, this.size, sparkleSize, this.color)) break;
       // Draw sparkle
       ctx.strokeStyle = this.color;
       ctx.lineWidth = 2;
-      const sparkleSize = this.size * (0.5 + Math.sin(this.rotation * 10) * 0.5);
       ctx.beginPath();
       ctx.moveTo(this.x - sparkleSize, this.y);
       ctx.lineTo(this.x + sparkleSize, this.y);
@@ -69,8 +139,10 @@ export class Particle {
       ctx.lineTo(this.x, this.y + sparkleSize);
       ctx.stroke();
       break;
+    }
 
     default:
+      if (sprites && sprites.drawDisc(ctx, this.x, this.y, this.size, this.color)) break;
       // Default circle
       ctx.fillStyle = this.color;
       ctx.beginPath();
@@ -139,7 +211,8 @@ export class ParticleSystem {
   }
 
   render(ctx) {
-    this.particles.forEach(particle => particle.render(ctx));
+    const sprites = this.game.effectSprites;
+    this.particles.forEach(particle => particle.render(ctx, sprites));
   }
 
   clear() {
@@ -1,4 +1,5 @@
 import { Entity } from './Entity.js';
+import { soundManager } from '../systems/SoundManager.js';
 
 export class Kid extends Entity {
   constructor(game, x, y, aggressionLevel = 1) {
@@ -702,10 +703,7 @@ export class Kid extends Entity {
     // Only play if we haven't already played it for this flee session
     if (!this.hasPlayedLaughSound) {
       // Select laugh sound based on sprite type
-      const laughFile = `/kid_laughing_${this.spriteType}.mp3`;
-      const laughSound = new Audio(laughFile);
-      laughSound.volume = 0.5;
-      laughSound.play().catch(e => console.log('Kid laugh sound play failed:', e));
+      soundManager.playSprite(`kid_laughing_${this.spriteType}`, { volume: 0.5 });
       this.hasPlayedLaughSound = true;
     }
   }
@@ -1,4 +1,5 @@
 import { Entity } from './Entity.js';
+import { soundManager } from '../systems/SoundManager.js';
 
 export class Player extends Entity {
   constructor(game, x, y) {
@@ -468,17 +469,14 @@ export class Player extends Entity {
 
   playOutOfBreathSound() {
     if (!this.outOfBreathSound) {
-      this.outOfBreathSound = new Audio('out_of_breath.mp3');
-      this.outOfBreathSound.volume = 0.6;
-      this.outOfBreathSound.loop = true;
+      this.outOfBreathSound = soundManager.playSprite('out_of_breath', { volume: 0.6, loop: true });
     }
-    this.outOfBreathSound.play().catch(e => console.log('Out of breath sound play failed:', e));
   }
 
   stopOutOfBreathSound() {
     if (this.outOfBreathSound) {
-      this.outOfBreathSound.pause();
-      this.outOfBreathSound.currentTime = 0;
+      this.outOfBreathSound.stop();
+      this.outOfBreathSound = null;
     }
   }
 
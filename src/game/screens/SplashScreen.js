@@ -3,10 +3,7 @@ export class SplashScreen {
     this.game = game;
     this.duration = 3;
     this.timer = 0;
-    this.logoLoaded = false;
-    this.logo = new Image();
-    this.logo.src = 'wetcat-logo.png';
-    this.logo.onload = () => this.logoLoaded = true;
+    this.logo = game.progressiveImage('logo', 'wetcat-logo.png');
   }
 
   update(deltaTime) {
@@ -26,15 +23,15 @@ export class SplashScreen {
     ctx.fillRect(0, 0, width, height);
 
     // Logo
-    if (this.logoLoaded) {
+    if (this.logo.ready) {
       const alpha = Math.min(1, this.timer * 2);
       ctx.save();
       ctx.globalAlpha = alpha;
 
       const logoWidth = 400;
       const logoHeight = 200;
-      ctx.drawImage(
-        this.logo,
+      this.logo.draw(
+        ctx,
         (width - logoWidth) / 2,
         (height - logoHeight) / 2 - 50,
         logoWidth,
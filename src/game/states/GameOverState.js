@@ -1,4 +1,5 @@
 import { State } from './State.js';
+import { soundManager } from '../systems/SoundManager.js';
 
 export class GameOverState extends State {
   constructor(game) {
@@ -11,7 +12,6 @@ export class GameOverState extends State {
       { text: 'Main Menu', action: () => this.mainMenu() }
     ];
     this.selectedIndex = 0;
-    this.selectSound = null;
 
     // Video background
     this.video = null;
@@ -23,17 +23,9 @@ export class GameOverState extends State {
     this.reason = data.reason || '';
     this.selectedIndex = 0;
 
-    // Initialize select sound if not already created
-    if (!this.selectSound) {
-      this.selectSound = new Audio('menu_select.mp3');
-      this.selectSound.volume = 0.7;
-    }
-
     // Play "uh oh" sound if player lost
     if (!this.won) {
-      const uhOhSound = new Audio('uh_oh.mp3');
-      uhOhSound.volume = 0.6;
-      uhOhSound.play().catch(e => console.log('Uh oh sound play failed:', e));
+      soundManager.playSprite('uh_oh', { volume: 0.6 });
     }
 
     // Create and setup video if not already created
@@ -285,9 +277,6 @@ export class GameOverState extends State {
   }
 
   playSelectSound() {
-    if (this.selectSound) {
-      this.selectSound.currentTime = 0;
-      this.selectSound.play().catch(e => console.log('Select sound play failed:', e));
-    }
+    soundManager.playSprite('menu_select', { volume: 0.7 });
   }
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 import { State } from './State.js';
 import { PlayingState } from './PlayingState.js';
+import { soundManager } from '../systems/SoundManager.js';
 
 export class MenuState extends State {
   constructor(game) {
@@ -13,14 +14,10 @@ export class MenuState extends State {
 
     // Background image
     this.backgroundImage = null;
-    this.imageLoaded = false;
 
     // Background music
     this.bgMusic = null;
     this.musicLoaded = false;
-
-    // Menu selection sound
-    this.selectSound = null;
   }
 
   enter() {
@@ -33,24 +30,14 @@ export class MenuState extends State {
     //   this.startGame();
     // }, 3000);
 
-    // Create and setup background image if not already created
+    // Create background image if not already created
     if (!this.backgroundImage) {
-      this.backgroundImage = new Image();
-      this.backgroundImage.src = 'menu_background.jpg';
-
-      this.backgroundImage.onload = () => {
-        this.imageLoaded = true;
-      };
-
-      this.backgroundImage.onerror = (e) => {
-        console.error('Background image loading error:', e);
-        this.imageLoaded = false;
-      };
+      this.backgroundImage = this.game.progressiveImage('menuBackground', 'menu_background.jpg');
     }
 
     // Create and setup background music if not already created
     if (!this.bgMusic) {
-      this.bgMusic = new Audio('wetcat-song-1.mp3');
+      this.bgMusic = soundManager.createMusic('wetcat-song-1');
       this.bgMusic.loop = true;
       this.bgMusic.volume = 0.5; // Set to 50% volume
 
@@ -66,12 +53,6 @@ export class MenuState extends State {
       // Resume playing if returning to menu
       this.bgMusic.play().catch(e => console.log('Music play failed:', e));
     }
-
-    // Create menu selection sound if not already created
-    if (!this.selectSound) {
-      this.selectSound = new Audio('menu_select.mp3');
-      this.selectSound.volume = 0.7; // Slightly louder than music
-    }
   }
 
   exit() {
@@ -145,7 +126,7 @@ export class MenuState extends State {
     const { width, height } = this.game;
 
     // Draw background image if loaded
-    if (this.backgroundImage && this.imageLoaded) {
+    if (this.backgroundImage && this.backgroundImage.ready) {
       // Scale image to cover the entire canvas
       const imgAspect = this.backgroundImage.width / this.backgroundImage.height;
       const canvasAspect = width / height;
@@ -166,7 +147,7 @@ export class MenuState extends State {
         drawY = (height - drawHeight) / 2;
       }
 
-      ctx.drawImage(this.backgroundImage, drawX, drawY, drawWidth, drawHeight);
+      this.backgroundImage.draw(ctx, drawX, drawY, drawWidth, drawHeight);
     } else {
       // Fallback background with gradient
       const gradient = ctx.createLinearGradient(0, 0, width, height);
@@ -324,10 +305,6 @@ export class MenuState extends State {
   }
 
   playSelectSound() {
-    if (this.selectSound) {
-      // Reset the sound to play from beginning
-      this.selectSound.currentTime = 0;
-      this.selectSound.play().catch(e => console.log('Select sound play failed:', e));
-    }
+    soundManager.playSprite('menu_select', { volume: 0.7 });
   }
 }
\ No newline at end of file
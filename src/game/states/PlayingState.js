@@ -4,11 +4,14 @@ import { Coin } from '../entities/Coin.js';
 import { Wallet } from '../entities/Wallet.js';
 import { Scammer } from '../entities/Scammer.js';
 import { WeaponSystem } from '../systems/WeaponSystem.js';
+import { AtlasFrame, ProgressiveImage } from '../systems/AssetLoader.js';
+import { soundManager } from '../systems/SoundManager.js';
 import { ParticleSystem } from '../effects/ParticleSystem.js';
 import { Web3UI } from '../ui/Web3UI.js';
 import { FUDDragon } from '../entities/bosses/FUDDragon.js';
 import { RugPullMonster } from '../entities/bosses/RugPullMonster.js';
 import { WhaleManipulator } from '../entities/bosses/WhaleManipulator.js';
+import { FLOOR_SCALE } from '../config/constants.js';
 
 export class PlayingState extends State {
   constructor(game) {
@@ -58,16 +61,14 @@ export class PlayingState extends State {
 
     // Performance optimizations
     this.floorPattern = null; // Cache floor pattern
+    this.floorPatternImage = null; // Image the pattern was drawn from
+    this.floorPatternComplete = false; // Whether it was drawn from the full image
     this.patternCanvas = null; // Canvas for pattern
 
     // Background music
     this.bgMusic = null;
     this.musicLoaded = false;
 
-    // Sound effects
-    this.pickupSounds = []; // Array of audio elements for overlapping sounds
-    this.shelfSound = null;
-
     this.spawnPoints = [
       { x: 50, y: 520 }, // Left entrance
       { x: 1550, y: 520 }, // Right entrance
@@ -142,7 +143,7 @@ export class PlayingState extends State {
 
     // Start background music
     if (!this.bgMusic) {
-      this.bgMusic = new Audio('wetcat-song-2.mp3');
+      this.bgMusic = soundManager.createMusic('wetcat-song-2');
       this.bgMusic.loop = true;
       this.bgMusic.volume = 0.4; // Slightly lower volume for gameplay
 
@@ -156,21 +157,6 @@ export class PlayingState extends State {
       // Resume if returning to game
       this.bgMusic.play().catch(e => console.log('Game music play failed:', e));
     }
-
-    // Initialize sound effects
-    if (this.pickupSounds.length === 0) {
-      // Create 5 audio instances for overlapping pickup sounds
-      for (let i = 0; i < 5; i++) {
-        const audio = new Audio('pickup_coin.mp3');
-        audio.volume = 0.7; // Increased from 0.5 for better audibility
-        this.pickupSounds.push(audio);
-      }
-    }
-
-    if (!this.shelfSound) {
-      this.shelfSound = new Audio('book_on_wallet.mp3');
-      this.shelfSound.volume = 0.6;
-    }
   }
 
   exit() {
@@ -203,10 +189,6 @@ export class PlayingState extends State {
     if (this.player) {
       this.player.cleanup();
     }
-
-    // Clear sound arrays to ensure re-initialization
-    this.pickupSounds = [];
-    this.shelfSound = null;
   }
 
   initializeLevel() {
@@ -704,7 +686,9 @@ export class PlayingState extends State {
   renderFloor(ctx) {
     const woodFloorImage = this.game.assetLoader.getImage('woodFloor');
 
-    if (!woodFloorImage || !woodFloorImage.complete) {
+    // A progressive floor is drawable as soon as its preview has decoded
+    const floorReady = woodFloorImage instanceof ProgressiveImage ? woodFloorImage.ready : woodFloorImage?.complete;
+    if (!floorReady) {
       // Fallback to solid color if image hasn't loaded
       const viewportX = this.game.camera.getViewportX();
       const viewportY = this.game.camera.getViewportY();
@@ -718,15 +702,23 @@ export class PlayingState extends State {
       return;
     }
 
-    // Create pattern once and cache it
-    if (!this.floorPattern) {
-      // Create a scaled pattern canvas
-      const scale = 0.5;
+    // Create pattern once and cache it (again when the placeholder is replaced by the
+    // real floor, or once a preview's full image arrives)
+    if (!this.floorPattern || this.floorPatternImage !== woodFloorImage ||
+        this.floorPatternComplete !== woodFloorImage.complete) {
+      this.floorPatternImage = woodFloorImage;
+      this.floorPatternComplete = woodFloorImage.complete;
+      // Create a scaled pattern canvas (a mip level is already partly scaled down)
+      const scale = FLOOR_SCALE / this.game.assetLoader.getScale('woodFloor');
       this.patternCanvas = document.createElement('canvas');
       this.patternCanvas.width = woodFloorImage.width * scale;
       this.patternCanvas.height = woodFloorImage.height * scale;
       const patternCtx = this.patternCanvas.getContext('2d');
-      patternCtx.drawImage(woodFloorImage, 0, 0, this.patternCanvas.width, this.patternCanvas.height);
+      if (woodFloorImage instanceof AtlasFrame || woodFloorImage instanceof ProgressiveImage) {
+        woodFloorImage.draw(patternCtx, 0, 0, this.patternCanvas.width, this.patternCanvas.height);
+      } else {
+        patternCtx.drawImage(woodFloorImage, 0, 0, this.patternCanvas.width, this.patternCanvas.height);
+      }
       this.floorPattern = this.game.renderer.ctx.createPattern(this.patternCanvas, 'repeat');
     }
 
@@ -1163,27 +1155,12 @@ export class PlayingState extends State {
   }
 
   playPickupSound() {
-    // Find an available audio instance that's not currently playing
-    for (const audio of this.pickupSounds) {
-      if (audio.paused || audio.ended) {
-        audio.currentTime = 0;
-        audio.play().catch(e => console.log('Pickup sound play failed:', e));
-        return;
-      }
-    }
-
-    // If all are playing, use the first one anyway (will restart it)
-    if (this.pickupSounds.length > 0) {
-      this.pickupSounds[0].currentTime = 0;
-      this.pickupSounds[0].play().catch(e => console.log('Pickup sound play failed:', e));
-    }
+    // Each call is its own buffer source, so pickups overlap freely
+    soundManager.playSprite('pickup_book', { volume: 0.7 });
   }
 
   playShelfSound() {
-    if (this.shelfSound) {
-      this.shelfSound.currentTime = 0;
-      this.shelfSound.play().catch(e => console.log('Shelf sound play failed:', e));
-    }
+    soundManager.playSprite('book_on_shelf', { volume: 0.6 });
   }
   
   onWaveChange(wave) {
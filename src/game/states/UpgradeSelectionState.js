@@ -1,5 +1,6 @@
 import { State } from './State.js';
 import { getRandomUpgrades } from '../data/upgrades.js';
+import { soundManager } from '../systems/SoundManager.js';
 
 export class UpgradeSelectionState extends State {
   constructor(game) {
@@ -8,7 +9,6 @@ export class UpgradeSelectionState extends State {
     this.upgrades = [];
     this.selectedIndex = 0;
     this.animationTimer = 0;
-    this.selectSound = null;
   }
 
   enter() {
@@ -35,16 +35,8 @@ export class UpgradeSelectionState extends State {
     // Clear any lingering input state
     this.game.inputManager.update();
 
-    // Initialize select sound if not already created
-    if (!this.selectSound) {
-      this.selectSound = new Audio('menu_select.mp3');
-      this.selectSound.volume = 0.7;
-    }
-
     // Play level up yay sound
-    const yaySound = new Audio('yay.mp3');
-    yaySound.volume = 0.5; // Reduced from 0.8 to be less jarring
-    yaySound.play().catch(e => console.log('Yay sound play failed:', e));
+    soundManager.playSprite('yay', { volume: 0.5 }); // Reduced from 0.8 to be less jarring
   }
 
   exit() {
@@ -270,9 +262,6 @@ export class UpgradeSelectionState extends State {
   }
 
   playSelectSound() {
-    if (this.selectSound) {
-      this.selectSound.currentTime = 0;
-      this.selectSound.play().catch(e => console.log('Select sound play failed:', e));
-    }
+    soundManager.playSprite('menu_select', { volume: 0.7 });
   }
 }
\ No newline at end of file
@@ -1,6 +1,134 @@
+import { IMAGE_PREVIEWS } from '../data/imagePreviews.js';
+
+// A frame packed into a texture atlas sheet (see atlas_packer.py).
+// width/height are the untrimmed source size so callers can treat it like an image.
+export class AtlasFrame {
+  constructor(image, frame) {
+    this.image = image;
+    this.sx = frame.frame.x;
+    this.sy = frame.frame.y;
+    this.sw = frame.frame.w;
+    this.sh = frame.frame.h;
+    this.offsetX = frame.spriteSourceSize.x;
+    this.offsetY = frame.spriteSourceSize.y;
+    this.width = frame.sourceSize.w;
+    this.height = frame.sourceSize.h;
+  }
+
+  // Image-like readiness check (the sheet is loaded before frames are created)
+  get complete() {
+    return this.image.complete;
+  }
+
+  // Draw as if the whole untrimmed frame were stretched to (x, y, width, height)
+  draw(ctx, x, y, width = this.width, height = this.height) {
+    const scaleX = width / this.width;
+    const scaleY = height / this.height;
+
+    ctx.drawImage(
+      this.image,
+      this.sx, this.sy, this.sw, this.sh,
+      x + this.offsetX * scaleX,
+      y + this.offsetY * scaleY,
+      this.sw * scaleX,
+      this.sh * scaleY
+    );
+  }
+}
+
+// Size and blurred preview of a large image (python image_previews.py), by
+// asset name. Entries hold the 1x size; `scale` gives the size of the mip level
+// or variant actually loaded, so layout matches the full image once it arrives.
+export function imagePreview(name, scale = 1) {
+  const entry = IMAGE_PREVIEWS[name];
+  if (!entry) {
+    return null;
+  }
+  return { ...entry, width: Math.round(entry.width * scale), height: Math.round(entry.height * scale) };
+}
+
+let webpSupport = null;
+
+// Whether this browser can encode WebP, which implies it can decode it.
+// Browsers that only decode it (older Safari) get the fallback, never a broken image.
+export function supportsWebP() {
+  if (webpSupport === null) {
+    const canvas = document.createElement('canvas');
+    canvas.width = canvas.height = 1;
+    webpSupport = canvas.toDataURL('image/webp').startsWith('data:image/webp');
+  }
+  return webpSupport;
+}
+
+// The smallest responsive variant (python image_variants.py) with at least
+// `scale` times the 1x pixels, or the largest if none has, with the `url` this
+// browser should load
+export function chooseVariant(variants, scale) {
+  const variant = variants.find(v => v.scale >= scale) || variants[variants.length - 1];
+  return { ...variant, url: supportsWebP() && variant.webp ? variant.webp : variant.fallback };
+}
+
+// A large image that can be drawn before it has downloaded: until then it
+// draws its preview stretched to the real size, which smooth upscaling turns
+// into a blur. width/height are known up front, so layout never waits.
+export class ProgressiveImage {
+  constructor(path, entry = null) {
+    this.width = entry ? entry.width : 0;
+    this.height = entry ? entry.height : 0;
+
+    this.preview = null;
+    this.previewLoaded = Promise.resolve(false);
+    if (entry) {
+      this.preview = new Image();
+      this.previewLoaded = new Promise(resolve => {
+        this.preview.onload = () => resolve(true);
+        this.preview.onerror = () => resolve(false);
+      });
+      this.preview.src = entry.preview;
+    }
+
+    this.image = new Image();
+    this.loaded = new Promise(resolve => {
+      this.image.onload = () => {
+        this.width = this.image.naturalWidth;
+        this.height = this.image.naturalHeight;
+        resolve(true);
+      };
+      this.image.onerror = () => {
+        console.error(`Failed to load image: ${path}`);
+        resolve(false);
+      };
+    });
+    this.image.src = path;
+  }
+
+  // The full image has loaded (same meaning as HTMLImageElement.complete)
+  get complete() {
+    return this.image.complete && this.image.naturalWidth > 0;
+  }
+
+  // Something can be drawn: the full image or its preview
+  get ready() {
+    return this.complete || Boolean(this.preview && this.preview.complete && this.preview.naturalWidth > 0);
+  }
+
+  draw(ctx, x, y, width = this.width, height = this.height) {
+    if (this.complete) {
+      ctx.drawImage(this.image, x, y, width, height);
+    } else if (this.ready) {
+      ctx.save();
+      ctx.imageSmoothingEnabled = true;
+      ctx.imageSmoothingQuality = 'high';
+      ctx.drawImage(this.preview, x, y, width, height);
+      ctx.restore();
+    }
+  }
+}
+
 export class AssetLoader {
   constructor() {
     this.assets = new Map();
+    this.scales = new Map(); // Images loaded at a fraction of their source size (mip levels)
     this.loadingProgress = 0;
     this.totalAssets = 0;
     this.loadedAssets = 0;
@@ -42,6 +170,18 @@ export class AssetLoader {
   }
 
   async loadImage(name, path) {
+    // Large images with a preview count as loaded once the preview has decoded;
+    // the full image keeps streaming in behind it
+    const preview = imagePreview(name, this.getScale(name));
+    if (preview) {
+      const image = new ProgressiveImage(path, preview);
+      this.assets.set(name, image);
+      await image.previewLoaded;
+      this.loadedAssets++;
+      this.updateProgress();
+      return image;
+    }
+
     return new Promise((resolve, reject) => {
       const img = new Image();
 
@@ -64,6 +204,45 @@ export class AssetLoader {
     });
   }
 
+  // Load a sprite atlas and register every frame under its asset name.
+  // Returns the atlas data, or null if it isn't available.
+  // `name` keeps each atlas's sheets apart; with `fallback`, frames never
+  // replace an asset that is already loaded (used for the placeholder atlas).
+  async loadAtlas(path, { name: atlasName = 'atlas', fallback = false } = {}) {
+    let atlas;
+    try {
+      const response = await fetch(path);
+      if (!response.ok) {
+        return null;
+      }
+      atlas = await response.json();
+    } catch (error) {
+      console.warn(`Sprite atlas not available: ${path}`);
+      return null;
+    }
+
+    // Sheet images live next to the JSON and share its query string
+    const queryIndex = path.indexOf('?');
+    const query = queryIndex >= 0 ? path.slice(queryIndex) : '';
+    const basePath = path.slice(0, path.lastIndexOf('/', queryIndex >= 0 ? queryIndex : path.length) + 1);
+
+    this.totalAssets += atlas.meta.sheets.length;
+    const sheets = await Promise.all(
+      atlas.meta.sheets.map((sheet, index) =>
+        this.loadImage(`${atlasName}Sheet${index}`, `${basePath}${sheet.image}${query}`)
+      )
+    );
+
+    for (const [name, frame] of Object.entries(atlas.frames)) {
+      const sheet = sheets[frame.sheet];
+      if (sheet && !(fallback && this.assets.has(name))) {
+        this.assets.set(name, new AtlasFrame(sheet, frame));
+      }
+    }
+
+    return atlas;
+  }
+
   async loadAudio(name, path) {
     return new Promise((resolve, reject) => {
       const audio = new Audio();
@@ -113,9 +292,18 @@ export class AssetLoader {
     return this.assets.get(name);
   }
 
+  setScale(name, scale) {
+    this.scales.set(name, scale);
+  }
+
+  // Size of the loaded image relative to its source: 0.5 for a half-size mip level
+  getScale(name) {
+    return this.scales.get(name) || 1;
+  }
+
   getImage(name) {
     const asset = this.get(name);
-    if (asset instanceof HTMLImageElement) {
+    if (asset instanceof HTMLImageElement || asset instanceof AtlasFrame || asset instanceof ProgressiveImage) {
       return asset;
     }
     return null;
@@ -168,7 +356,13 @@ export class AssetLoader {
     return img;
   }
 
-  // Generate placeholder assets for development
+  // Pre-baked placeholders (python create_wetcat_placeholders.py --atlas): one
+  // small sheet instead of drawing and encoding canvases on every boot
+  async loadPlaceholders(path) {
+    return this.loadAtlas(path, { name: 'placeholders', fallback: true });
+  }
+
+  // Generate placeholder assets for development (when no pre-baked sheet exists)
   generatePlaceholderAssets() {
     // WETCAT sprites
     this.assets.set('wetcat', this.createPlaceholderImage(48, 64, '#4169E1', 'W'));
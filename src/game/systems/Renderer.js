@@ -1,3 +1,5 @@
+import { AtlasFrame } from './AssetLoader.js';
+
 export class Renderer {
   constructor(ctx, camera) {
     this.ctx = ctx;
@@ -116,13 +118,17 @@ export class Renderer {
     );
 
     // Draw sprite centered
-    this.ctx.drawImage(
-      image,
-      -width / 2,
-      -height / 2,
-      width,
-      height
-    );
+    if (image instanceof AtlasFrame) {
+      image.draw(this.ctx, -width / 2, -height / 2, width, height);
+    } else {
+      this.ctx.drawImage(
+        image,
+        -width / 2,
+        -height / 2,
+        width,
+        height
+      );
+    }
 
     this.ctx.restore();
 
@@ -1,3 +1,5 @@
+import { ASSET_MANIFEST } from '../data/assetManifest.js';
+
 export class SoundManager {
   constructor() {
     this.sounds = new Map();
@@ -6,6 +8,111 @@ export class SoundManager {
     this.masterVolume = 0.7;
     this.sfxVolume = 0.8;
     this.musicVolume = 0.6;
+
+    // Audio sprite (python audio_sprite.py): every SFX in one decoded buffer
+    this.context = null;
+    this.spriteBuffer = null;
+    this.spriteMap = {};
+  }
+
+  getContext() {
+    if (!this.context) {
+      const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+      this.context = AudioContextClass ? new AudioContextClass() : null;
+    }
+    return this.context;
+  }
+
+  // One request and one decode for every sound effect; resolves false if unavailable
+  async loadSprite(mapPath = 'sfx.json') {
+    try {
+      const response = await fetch(mapPath);
+      if (!response.ok) {
+        return false;
+      }
+      const sprite = await response.json();
+      this.spriteMap = sprite.sounds;
+
+      const context = this.getContext();
+      if (!context) {
+        return false;
+      }
+      const basePath = mapPath.slice(0, mapPath.lastIndexOf('/') + 1);
+      const audio = await fetch(`${basePath}${sprite.file}`);
+      this.spriteBuffer = await context.decodeAudioData(await audio.arrayBuffer());
+      return true;
+    } catch (error) {
+      console.warn(`Audio sprite not available: ${mapPath}`, error);
+      return false;
+    }
+  }
+
+  // Play one region of the sprite at an absolute volume (like HTMLAudioElement.volume).
+  // Returns a handle with stop(); falls back to the individual file until the sprite is ready.
+  playSprite(name, { volume = 1, loop = false } = {}) {
+    const region = this.spriteMap[name];
+    if (!this.spriteBuffer || !region) {
+      return this.playFile(`${name}.mp3`, volume, loop);
+    }
+
+    const context = this.context;
+    if (context.state === 'suspended') {
+      context.resume();
+    }
+    const source = context.createBufferSource();
+    const gain = context.createGain();
+    source.buffer = this.spriteBuffer;
+    gain.gain.value = volume;
+    source.connect(gain).connect(context.destination);
+
+    if (loop) {
+      source.loop = true;
+      source.loopStart = region.start;
+      source.loopEnd = region.start + region.duration;
+      source.start(0, region.start);
+    } else {
+      source.start(0, region.start, region.duration);
+    }
+
+    return {
+      stop: () => {
+        try {
+          source.stop();
+        } catch (e) {
+          // Already finished
+        }
+      }
+    };
+  }
+
+  playFile(path, volume, loop) {
+    const audio = new Audio(path);
+    audio.volume = volume;
+    audio.loop = loop;
+    audio.play().catch(e => console.log('Sound play failed:', e));
+    return {
+      stop: () => {
+        audio.pause();
+        audio.currentTime = 0;
+      }
+    };
+  }
+
+  // Background music: the low-bitrate variant (python audio_optimize.py) on cellular
+  // or data-saver connections when the manifest lists one, otherwise the full track
+  createMusic(name) {
+    const connection = navigator.connection;
+    const constrained = connection && (connection.saveData || connection.type === 'cellular' ||
+      /2g|3g/.test(connection.effectiveType || ''));
+    const lite = constrained && ASSET_MANIFEST.music?.[name]?.lite;
+    const audio = new Audio(lite || `${name}.mp3`);
+    if (lite) {
+      audio.addEventListener('error', () => {
+        audio.src = `${name}.mp3`;
+        audio.load();
+      }, { once: true });
+    }
+    return audio;
   }
 
   async loadSound(name, path) {
@@ -22,6 +129,11 @@ export class SoundManager {
   }
 
   playSound(name, volume = 1) {
+    if (this.spriteBuffer && this.spriteMap[name]) {
+      this.playSprite(name, { volume: this.sfxVolume * this.masterVolume * volume });
+      return;
+    }
+
     const sound = this.sounds.get(name);
     if (sound) {
       const clone = sound.cloneNode();
@@ -59,4 +171,4 @@ export class SoundManager {
   }
 }
 
-export const soundManager = new SoundManager();
\ No newline at end of file
+export const soundManager = new SoundManager();
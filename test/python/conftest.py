@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT)
+
+from leonardo_stub_server import start_stub_server  # noqa: E402
+
+
+@pytest.fixture
+def stub_server():
+    server, base_url = start_stub_server(latency=0.3)
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
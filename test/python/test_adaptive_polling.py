@@ -0,0 +1,113 @@
+import json
+import statistics
+import urllib.error
+import urllib.request
+
+import pytest
+
+from adaptive_polling import AdaptivePoller, CompletionHistory, FixedPoller
+from callback_receiver import CallbackReceiver, parse_webhook
+from generation_scheduler import GenerationJob, GenerationScheduler
+from leonardo_stub_server import start_stub_server
+
+
+def make_jobs(count):
+    return [GenerationJob(f'asset_{i}', {'prompt': f'wet cat {i}', 'modelId': 'test-model'}) for i in range(count)]
+
+
+def mean_time_to_image(base_url, poller, callbacks=None):
+    jobs = make_jobs(4)
+    GenerationScheduler('test-key', base_url=base_url, rate_limit=0, poller=poller,
+                        callbacks=callbacks, verbose=False).run(jobs)
+    return statistics.mean(job.time_to_image for job in jobs)
+
+
+def test_history_persists_per_model(tmp_path):
+    path = str(tmp_path / 'history.json')
+    history = CompletionHistory(path, window=3)
+    for seconds in (9, 1, 2, 3):
+        history.record('model-a', seconds)
+
+    reloaded = CompletionHistory(path)
+
+    assert reloaded.samples == {'model-a': [1, 2, 3]}
+    assert reloaded.percentile('model-a', 0.9) == 3
+    assert reloaded.percentile('model-b', 0.5) is None
+
+
+def test_poller_ramps_to_cap_without_history():
+    poller = AdaptivePoller(initial=1.0, factor=2.0, cap=5.0, jitter=0)
+
+    delays = [poller.next_delay('m', attempt, elapsed=0) for attempt in range(5)]
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_poller_first_poll_follows_history():
+    history = CompletionHistory()
+    for seconds in (20, 22, 25):
+        history.record('slow-model', seconds)
+    poller = AdaptivePoller(history, initial=0.5, jitter=0)
+
+    assert poller.first_delay('slow-model') == 18.0
+    assert poller.next_delay('slow-model', 6, elapsed=21) == 0.5
+    assert poller.next_delay('slow-model', 6, elapsed=30) > 0.5
+
+
+def test_warm_history_beats_fixed_polling():
+    server, base_url = start_stub_server(latency=0.5)
+    try:
+        fixed = mean_time_to_image(base_url, FixedPoller(0.4))
+        poller = AdaptivePoller(initial=0.05, cap=0.4)
+        mean_time_to_image(base_url, poller)
+        warm = mean_time_to_image(base_url, poller)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert fixed >= 0.8
+    assert warm < fixed - 0.1
+
+
+def test_webhooks_replace_polling():
+    receiver = CallbackReceiver('secret')
+    server, base_url = start_stub_server(latency=0.3, callback_url=receiver.url, callback_token='secret')
+    try:
+        elapsed = mean_time_to_image(base_url, AdaptivePoller(cap=5.0), callbacks=receiver)
+    finally:
+        server.shutdown()
+        server.server_close()
+        receiver.close()
+
+    assert elapsed < 0.6
+    assert server.state.polls == 0
+
+
+def test_parse_webhook_payload():
+    body = {'type': 'image_generation.complete',
+            'data': {'object': {'id': 'gen-1', 'status': 'COMPLETE', 'images': [{'url': 'https://cdn/x.png'}]}}}
+
+    assert parse_webhook(body) == ('gen-1', 'COMPLETE', 'https://cdn/x.png')
+    assert parse_webhook({'data': {'object': {}}}) is None
+
+
+def test_receiver_rejects_unauthenticated_webhooks():
+    with pytest.raises(ValueError):
+        CallbackReceiver(None)
+
+    receiver = CallbackReceiver('secret')
+    body = json.dumps({'id': 'gen-1', 'status': 'COMPLETE', 'images': [{'url': 'https://evil/x.png'}]}).encode()
+    try:
+        assert receiver.server.server_address[0] == '127.0.0.1'
+        for headers in ({}, {'Authorization': 'Bearer wrong'}):
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(urllib.request.Request(receiver.url, body, headers), timeout=5)
+            assert error.value.code == 401
+        assert receiver.take('gen-1') is None
+
+        request = urllib.request.Request(receiver.url, body, {'Authorization': 'Bearer secret'})
+        urllib.request.urlopen(request, timeout=5).close()
+        receiver.wait(1)
+        assert receiver.take('gen-1') == ('COMPLETE', 'https://evil/x.png')
+    finally:
+        receiver.close()
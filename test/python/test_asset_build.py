@@ -0,0 +1,67 @@
+import os
+
+from asset_build import BuildGraph, BuildNode
+
+
+def copy_node(graph, name, source, outputs, runs):
+    def action(node):
+        runs.append(node.name)
+        with open(node.inputs[0], 'rb') as f:
+            data = f.read()
+        for path in node.outputs:
+            with open(path, 'wb') as f:
+                f.write(data)
+
+    return graph.add(BuildNode(name, [source], outputs, action, signature='copy'))
+
+
+def test_only_dirty_nodes_rebuild(tmp_path):
+    for name in ('a', 'b'):
+        (tmp_path / f'{name}.src').write_bytes(name.encode())
+    state = str(tmp_path / 'state.json')
+    runs = []
+
+    def graph():
+        g = BuildGraph(state, verbose=False)
+        for name in ('a', 'b'):
+            copy_node(g, name, str(tmp_path / f'{name}.src'), [str(tmp_path / f'{name}.out')], runs)
+        return g
+
+    assert graph().build()[0] == ['a', 'b']
+    assert graph().build()[0] == []
+
+    (tmp_path / 'b.src').write_bytes(b'changed')
+    assert graph().build()[0] == ['b']
+
+    os.remove(tmp_path / 'a.out')
+    assert graph().build()[0] == ['a']
+    assert runs == ['a', 'b', 'b', 'a']
+
+
+def test_touched_but_identical_input_is_not_rebuilt(tmp_path):
+    source = tmp_path / 'a.src'
+    source.write_bytes(b'same')
+    state = str(tmp_path / 'state.json')
+    runs = []
+
+    g = BuildGraph(state, verbose=False)
+    copy_node(g, 'a', str(source), [str(tmp_path / 'a.out')], runs)
+    g.build()
+
+    os.utime(source, (1, 1))
+    g = BuildGraph(state, verbose=False)
+    copy_node(g, 'a', str(source), [str(tmp_path / 'a.out')], runs)
+    assert g.build()[0] == []
+
+
+def test_dependencies_build_first(tmp_path):
+    (tmp_path / 'raw').write_bytes(b'raw')
+    runs = []
+    g = BuildGraph(str(tmp_path / 'state.json'), verbose=False)
+    copy_node(g, 'publish', str(tmp_path / 'mid'), [str(tmp_path / 'out')], runs)
+    copy_node(g, 'prepare', str(tmp_path / 'raw'), [str(tmp_path / 'mid')], runs)
+
+    g.build(['publish'])
+
+    assert runs == ['prepare', 'publish']
+    assert (tmp_path / 'out').read_bytes() == b'raw'
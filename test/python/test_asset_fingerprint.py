@@ -0,0 +1,65 @@
+import json
+import os
+
+from PIL import Image
+
+from asset_fingerprint import build_manifest, manifest_module, publish
+from atlas_packer import build_atlas
+
+
+def save_png(path, color):
+    Image.new("RGBA", (8, 8), color).save(path)
+
+
+def test_hashed_copy_follows_content(tmp_path):
+    work, public = tmp_path / "work", tmp_path / "public"
+    work.mkdir()
+    path = work / "coin.png"
+    save_png(path, (255, 200, 0, 255))
+    first = publish(str(path), directory=str(public))
+
+    save_png(path, (0, 200, 255, 255))
+    second = publish(str(path), directory=str(public))
+
+    assert first != second
+    assert first.startswith("coin.") and first.endswith(".png")
+    # The stale fingerprint is pruned; the plain working copy never reaches the deploy dir
+    assert os.listdir(public) == [second]
+    assert os.listdir(work) == ["coin.png"]
+    assert publish(str(path), directory=str(public)) == second
+
+    # A real copy: rewriting the working file in place leaves the published bytes alone
+    published = (public / second).read_bytes()
+    with open(path, "r+b") as f:
+        f.write(b"\0" * 8)
+    assert (public / second).read_bytes() == published
+
+
+def test_manifest_maps_keys_and_atlas_to_hashed_urls(tmp_path):
+    work, public = tmp_path / "work", tmp_path / "public"
+    work.mkdir()
+    save_png(work / "kid1_stand.png", (10, 20, 30, 255))
+    save_png(work / "wood_floor.png", (1, 2, 3, 255))
+    frame = {"key": "scammer1Stand", "name": "kid1_stand", "image": Image.new("RGBA", (8, 8), (9, 9, 9, 255)),
+             "offset": (0, 0), "source_size": (8, 8)}
+    build_atlas([frame], str(work / "atlas"), max_size=64)
+
+    manifest = build_manifest(str(work), str(public), variants_file=str(work / "variants.json"),
+                              tiles_file=str(work / "tiles.json"))
+
+    url = manifest["images"]["scammer1Stand"]
+    assert url.startswith("sprites/kid1_stand.") and (public / url[len("sprites/"):]).exists()
+    # Only sprites the game loads by name are listed
+    assert len(manifest["images"]) == 1
+    with open(public / manifest["atlas"][len("sprites/"):]) as f:
+        sheet = json.load(f)["meta"]["sheets"][0]["image"]
+    assert sheet != "atlas_0.png" and (public / sheet).exists()
+    assert len(os.listdir(public)) == 3
+
+
+def test_manifest_module_is_valid_with_quotes_in_values():
+    module = manifest_module({"images": {"it's": 'sprites/say "hi".png'}})
+
+    assert module.startswith("// Generated by asset_fingerprint.py")
+    body = module[module.index("=") + 1:].rstrip().rstrip(";")
+    assert json.loads(body) == {"images": {"it's": 'sprites/say "hi".png'}}
@@ -0,0 +1,79 @@
+import json
+
+from asset_graph import AssetGraph, extract_references, prune_bundle
+
+GAME_JS = """
+const music = new Audio('/wetcat-librarian/song.mp3');
+// new Audio('commented_out.mp3');
+const laugh = new Audio(`/kid_laughing_${this.spriteType}.mp3`);
+const sound = new Audio(`${name}.mp3`);
+this.image.src = 'missing.png';
+export const ASSET_MANIFEST = { 'atlas': 'sprites/atlas.json' };
+"""
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def make_project(root):
+    write(root / "src" / "game.js", GAME_JS.encode())
+    write(root / "public" / "song.mp3", b"song")
+    write(root / "public" / "kid_laughing_1.mp3", b"laugh1")
+    write(root / "public" / "kid_laughing_2.mp3", b"laugh2")
+    write(root / "public" / "unused.mp3", b"song")
+    write(root / "public" / "sprites" / "atlas.json", json.dumps({"meta": {"sheets": [{"image": "atlas_0.png"}]}}).encode())
+    write(root / "public" / "sprites" / "atlas_0.png", b"sheet")
+    write(root / "assets" / "Song.mp3", b"song")
+
+
+def make_graph(root):
+    return AssetGraph([str(root / "src")], [str(root / "public"), str(root / "assets")], str(root / "public"),
+                      str(root / "index.json"))
+
+
+def test_extracts_rules_and_template_patterns():
+    refs = extract_references(GAME_JS, "game.js")
+
+    assert [(ref.path, ref.rule) for ref in refs] == [
+        ("song.mp3", "audio-constructor"),
+        ("kid_laughing_*.mp3", "audio-constructor"),
+        ("*.mp3", "audio-constructor"),
+        ("missing.png", "src-assignment"),
+        ("sprites/atlas.json", "literal"),
+    ]
+
+
+def test_reports_missing_unused_and_duplicates(tmp_path):
+    make_project(tmp_path)
+
+    report = make_graph(tmp_path).report()
+
+    assert [item["path"] for item in report["missing"]] == ["missing.png"]
+    # `${name}.mp3` could be any mp3, so it is reported rather than marking them all as used
+    assert [item["path"] for item in report["unresolved"]] == ["*.mp3"]
+    assert [item["path"] for item in report["unused"]] == [str(tmp_path / "public" / "unused.mp3")]
+    assert report["unused_bytes"] == 4
+    assert report["duplicates"][0]["paths"] == sorted(
+        str(tmp_path / p) for p in ("assets/Song.mp3", "public/song.mp3", "public/unused.mp3"))
+    assert report["duplicate_bytes"] == 8
+    assert report["deployed_duplicate_bytes"] == 4
+
+
+def test_prune_only_touches_the_bundle(tmp_path):
+    make_project(tmp_path)
+    write(tmp_path / "public" / "unused.png", b"image")
+    dist = tmp_path / "dist"
+    write(dist / "unused.mp3", b"song")
+    write(dist / "unused.png", b"image")
+    write(dist / "song.mp3", b"song")
+
+    removed = prune_bundle(make_graph(tmp_path), str(dist))
+
+    assert removed == 5
+    assert not (dist / "unused.png").exists()
+    # Reported unused, but `${name}.mp3` might still load it at runtime
+    assert (dist / "unused.mp3").exists()
+    assert (dist / "song.mp3").exists()
+    assert (tmp_path / "public" / "unused.png").exists()
@@ -0,0 +1,52 @@
+import json
+
+from PIL import Image
+
+from atlas_packer import build_atlas, pack_sheets, trim
+
+
+def frame(key, w, h):
+    return {"key": key, "name": key, "image": Image.new("RGBA", (w, h), (255, 0, 0, 255)),
+            "offset": (0, 0), "source_size": (w, h)}
+
+
+def test_trim_crops_transparent_border():
+    img = Image.new("RGBA", (20, 30), (0, 0, 0, 0))
+    img.paste(Image.new("RGBA", (5, 6), (255, 255, 255, 255)), (4, 7))
+
+    cropped, offset = trim(img)
+
+    assert cropped.size == (5, 6)
+    assert offset == (4, 7)
+
+
+def test_frames_do_not_overlap_and_sheets_are_pow2():
+    frames = [frame(f"f{i}", 30 + i * 7, 50 - i * 3) for i in range(12)]
+
+    sheets = pack_sheets(frames, max_size=256, padding=1)
+
+    placed = {}
+    for size, placements in sheets:
+        assert size & (size - 1) == 0
+        for key, (x, y) in placements.items():
+            placed[key] = (size, x, y)
+    assert sorted(placed) == sorted(f["key"] for f in frames)
+
+    by_key = {f["key"]: f["image"] for f in frames}
+    for size, placements in sheets:
+        boxes = [(x, y, by_key[k].width, by_key[k].height) for k, (x, y) in placements.items()]
+        for i, a in enumerate(boxes):
+            assert a[0] + a[2] <= size and a[1] + a[3] <= size
+            for b in boxes[i + 1:]:
+                assert a[0] + a[2] <= b[0] or b[0] + b[2] <= a[0] or a[1] + a[3] <= b[1] or b[1] + b[3] <= a[1]
+
+
+def test_spills_to_extra_sheets_when_full(tmp_path):
+    frames = [frame(f"big{i}", 100, 100) for i in range(5)]
+
+    atlas = build_atlas(frames, str(tmp_path / "atlas"), max_size=256, padding=2)
+
+    assert len(atlas["meta"]["sheets"]) == 2
+    with open(tmp_path / "atlas.json") as f:
+        assert json.load(f)["frames"]["big0"]["sourceSize"] == {"w": 100, "h": 100}
+    assert (tmp_path / "atlas_1.png").exists()
@@ -0,0 +1,86 @@
+import math
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from audio_optimize import CATEGORIES, decode, encode, loudness, music_manifest, normalize, prepare, silence_bounds
+
+RATE = 44100
+
+
+def tone(seconds, amplitude=0.5, channels=2, frequency=440):
+    t = np.arange(int(seconds * RATE)) / RATE
+    wave = (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+    return np.repeat(wave[:, None], channels, axis=1)
+
+
+def padded(clip, before=0.5, after=0.3):
+    silence = lambda seconds: np.zeros((int(seconds * RATE), clip.shape[1]), dtype=np.float32)
+    return np.concatenate([silence(before), clip, silence(after)])
+
+
+def test_silence_bounds_keep_the_sound_plus_padding():
+    samples = padded(tone(1.0))
+
+    start, end = silence_bounds(samples, RATE, pad=0.02)
+
+    assert abs(start / RATE - 0.48) < 0.011
+    assert abs(end / RATE - 1.52) < 0.011
+    assert silence_bounds(np.zeros((RATE, 2), dtype=np.float32), RATE) == (0, RATE)
+
+
+def test_loudness_ignores_silence_and_normalize_respects_the_ceiling():
+    # A full-scale sine has a mean-square power of 1/2: -3 dB
+    assert loudness(tone(1.0, amplitude=1.0), RATE) == pytest.approx(-3.01, abs=0.05)
+    # 4 s of silence around it would pull a plain average down to -10 dB; only the
+    # blocks straddling the edges get through the gate
+    assert -5.0 < loudness(padded(tone(1.0, amplitude=1.0), 2.0, 2.0), RATE) < -3.0
+    assert loudness(np.zeros((RATE, 1), dtype=np.float32), RATE) == -math.inf
+
+    quiet, gain = normalize(tone(1.0, amplitude=0.05), RATE, target=-16.0)
+    assert gain > 0 and loudness(quiet, RATE) == pytest.approx(-16.0, abs=0.1)
+
+    # Raising this one to 0 dB would clip; the peak stops at -1 dBFS instead
+    loud, gain = normalize(tone(1.0, amplitude=0.5), RATE, target=0.0)
+    assert 20 * math.log10(np.abs(loud).max()) == pytest.approx(-1.0, abs=0.01)
+
+
+def test_sfx_are_trimmed_downmixed_and_matched_in_loudness():
+    reports = []
+    for amplitude in (0.05, 0.8):
+        samples, report = prepare(padded(tone(0.5, amplitude)), RATE, CATEGORIES["sfx"])
+        assert samples.shape[1] == 1
+        assert report["duration"] < 0.6 < report["duration_before"]
+        reports.append(report)
+
+    assert reports[0]["loudness"] == pytest.approx(reports[1]["loudness"], abs=0.1)
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_encode_round_trip(tmp_path):
+    path = str(tmp_path / "clip.mp3")
+
+    encode(tone(1.0, channels=1), RATE, path, bitrate=48)
+    samples, sample_rate = decode(path)
+
+    assert sample_rate == RATE and samples.shape[1] == 1
+    assert abs(len(samples) / RATE - 1.0) < 0.1
+
+
+def test_only_encoded_lite_tracks_are_listed(tmp_path):
+    encoded = tmp_path / "song-1-lite.mp3"
+    encoded.write_bytes(b"lite track")
+    assets = [
+        {"source": "song-1.mp3", "output": str(encoded), "category": "music", "key": "song-1"},
+        {"source": "song-2.mp3", "output": str(tmp_path / "song-2-lite.mp3"), "category": "music", "key": "song-2"},
+        {"source": "clip.mp3", "output": str(tmp_path / "clip.mp3"), "category": "sfx"},
+    ]
+
+    music = music_manifest(assets, publish_dir=str(tmp_path / "public"))
+
+    # Without an encoded file the game never asks for a lite URL
+    assert list(music) == ["song-1"]
+    assert music["song-1"]["lite"].startswith("song-1-lite.") and music["song-1"]["lite"].endswith(".mp3")
+    assert os.listdir(tmp_path / "public") == [music["song-1"]["lite"]]
@@ -0,0 +1,48 @@
+import pytest
+
+from audio_sprite import DECODER_DELAY, FrameHeader, build_sprite, parse_frames
+
+# MPEG1 Layer III, 128 kbps, 44.1 kHz, no CRC: 417 bytes per frame (418 padded)
+STEREO = 0xFFFB9000
+MONO = STEREO | (3 << 6)
+
+
+def frame(header, fill):
+    size = FrameHeader(header).size
+    return header.to_bytes(4, "big") + bytes([fill]) * (size - 4)
+
+
+def clip(frames, header=STEREO):
+    return b"".join(frame(header, 1 + n) for n in range(frames))
+
+
+def test_parse_frames_skips_tags_and_info_frame():
+    info = bytearray(frame(STEREO, 0))
+    info[4 + 32:4 + 36] = b"Info"
+    id3 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"title"
+    data = id3 + bytes(info) + clip(3) + b"TAG" + bytes(125)
+
+    frames = parse_frames(data)
+
+    assert [f[1][4] for f in frames] == [1, 2, 3]
+
+
+def test_clips_are_frame_aligned_and_duplicates_share_a_region():
+    data, sounds, sample_rate = build_sprite([("yay", clip(4)), ("uh_oh", clip(2)), ("again", clip(4))], gap=0.05)
+
+    assert sample_rate == 44100
+    gap = 2  # ceil(0.05 s / 1152 samples per frame)
+    assert sounds["yay"] == {"start": round((gap * 1152 + DECODER_DELAY) / 44100, 4),
+                             "duration": round(4 * 1152 / 44100, 4)}
+    assert sounds["uh_oh"]["start"] == round(((gap + 4 + gap) * 1152 + DECODER_DELAY) / 44100, 4)
+    assert sounds["again"] == sounds["yay"]
+
+    # Every byte is a whole frame: 3 gaps of silence plus the two unique clips
+    frames = parse_frames(data)
+    assert len(frames) == 3 * gap + 4 + 2
+    assert sum(len(f) for _, f in frames) == len(data)
+
+
+def test_mixed_formats_are_rejected():
+    with pytest.raises(ValueError):
+        build_sprite([("stereo", clip(2)), ("mono", clip(2, MONO))])
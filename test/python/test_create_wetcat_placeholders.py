@@ -0,0 +1,57 @@
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+import create_wetcat_placeholders as placeholders
+from font_resolver import get_font, resolve_font_path
+
+
+def test_fonts_are_resolved_once():
+    assert get_font(30) is get_font(30)
+    assert resolve_font_path() == resolve_font_path()
+    assert resolve_font_path.cache_info().currsize >= 1
+
+
+def test_tiled_background_matches_per_glyph_drawing():
+    expected = Image.new('RGB', placeholders.BACKGROUND_SIZE, placeholders.BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(expected)
+    for x in range(0, 1280, 64):
+        for y in range(0, 720, 60):
+            draw.text((x, y), "$", fill=(50, 50, 100), font=get_font(30))
+
+    tile = placeholders.glyph_tile("$", 30, placeholders.GLYPH_CELL, placeholders.BACKGROUND_COLOR, (50, 50, 100))
+    tiled = placeholders.tiled_pattern(placeholders.BACKGROUND_SIZE, tile)
+
+    assert np.array_equal(np.asarray(tiled), np.asarray(expected))
+
+
+def test_batch_covers_asset_loader_placeholders(tmp_path):
+    small = [spec for spec in placeholders.PLACEHOLDER_SPECS if spec["width"] <= 64]
+    specs = [dict(spec, name=f"{spec['name']}_{i}") for spec in small for i in range(20)]
+
+    start = time.perf_counter()
+    paths = placeholders.generate_placeholders(specs, str(tmp_path), scales=(1, 2))
+    elapsed = time.perf_counter() - start
+
+    assert len(paths) == len(specs) * 2 >= 400
+    assert elapsed < 2.0
+    with Image.open(tmp_path / "coin_0@2x.png") as img:
+        assert img.size == (48, 48)
+        assert img.getpixel((24, 2)) == (255, 215, 0, 255)
+        assert img.getpixel((0, 0)) == (0, 0, 0, 255)
+
+
+def test_placeholder_atlas_has_every_asset_loader_name(tmp_path):
+    atlas = placeholders.bake_placeholder_atlas(out_prefix=str(tmp_path / "placeholders"))
+
+    assert set(atlas["frames"]) == {spec["name"] for spec in placeholders.PLACEHOLDER_SPECS}
+    assert len(atlas["meta"]["sheets"]) == 1
+    # Identical placeholders share one packed frame
+    assert atlas["frames"]["wetcat"]["frame"] == atlas["frames"]["wetcatStand"]["frame"]
+    floor = atlas["frames"]["woodFloor"]
+    assert floor["sourceSize"] == {"w": 512, "h": 512}
+
+    with Image.open(tmp_path / "placeholders_0.png") as sheet:
+        x, y = floor["frame"]["x"], floor["frame"]["y"]
+        assert sheet.convert("RGBA").getpixel((x + 256, y + 256)) == (0x8B, 0x6F, 0x47, 255)
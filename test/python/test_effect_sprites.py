@@ -0,0 +1,49 @@
+import json
+import math
+
+import numpy as np
+
+from effect_sprites import EFFECTS, bake_effects, effect_frames, render_dollar, render_sparkle
+
+
+def alpha(img):
+    return np.asarray(img.getchannel("A"), dtype=np.float64)
+
+
+def test_every_listed_effect_gets_a_frame():
+    frames = effect_frames()
+
+    dollar = EFFECTS["dollar"]
+    assert f"fx_dollar_16_{dollar['rotations'] - 1}" in frames
+    assert "fx_disc_4fc3f7_3" in frames and "fx_sparkle_ffeb3b_8_8" in frames
+    expected = (len(dollar["sizes"]) * dollar["rotations"]
+                + len(EFFECTS["disc"]["colors"]) * len(EFFECTS["disc"]["sizes"])
+                + len(EFFECTS["sparkle"]["colors"]) * len(EFFECTS["sparkle"]["sizes"]) * EFFECTS["sparkle"]["steps"])
+    assert len(frames) == expected
+    # Even sides put the centre between pixels, so frames blit centred without a half-pixel shift
+    assert all(img.width % 2 == 0 and img.height % 2 == 0 for img in frames.values())
+
+
+def test_shapes_match_the_canvas_drawing():
+    # A quarter turn of the glyph is the unrotated one turned clockwise
+    upright, turned = alpha(render_dollar(24, 0, "#FFD93D")), alpha(render_dollar(24, math.pi / 2, "#FFD93D"))
+    assert np.abs(np.rot90(upright, -1) - turned).mean() < 8
+
+    # The sparkle cross reaches `arm` pixels either side of the centre
+    sparkle = alpha(render_sparkle(8, 4, "#FFEB3B", 2))
+    centre = sparkle.shape[0] // 2
+    row = sparkle[centre] > 0
+    assert row.sum() == 8 and row[centre - 4] and row[centre + 3] and not row[centre + 4]
+
+
+def test_atlas_meta_lists_what_was_baked(tmp_path):
+    atlas = bake_effects(str(tmp_path / "effects"))
+
+    with open(tmp_path / "effects.json") as f:
+        saved = json.load(f)
+    assert saved["meta"]["effects"] == EFFECTS
+    assert (tmp_path / saved["meta"]["sheets"][0]["image"]).exists()
+    # Frames are trimmed, but keep their untrimmed size for centring
+    disc = atlas["frames"]["fx_disc_4fc3f7_6"]
+    assert disc["sourceSize"] == {"w": 14, "h": 14}
+    assert disc["frame"]["w"] < 14
@@ -0,0 +1,66 @@
+import os
+
+import file_index
+from file_index import FileIndex
+
+
+def make_tree(root):
+    (root / "game" / "node_modules" / "pkg").mkdir(parents=True)
+    (root / "game" / "node_modules" / "pkg" / "index.js").write_text("x")
+    (root / "game" / "a.js").write_text("a")
+    (root / "game" / "b.js").write_text("b")
+    (root / "game" / "notes.txt").write_text("n")
+
+
+def old_mtime(path):
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+
+def test_ignored_dirs_are_never_entered(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    visited = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: visited.append(str(path)) or real_scandir(path))
+
+    found = [path for path, _ in FileIndex(str(tmp_path / "index.json")).scan([str(tmp_path)], suffixes=(".js",))]
+
+    assert sorted(os.path.basename(p) for p in found) == ["a.js", "b.js"]
+    assert not any("node_modules" in path for path in visited)
+
+
+def test_second_run_reads_only_changed_files(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    for name in ("a.js", "b.js"):
+        old_mtime(tmp_path / "game" / name)
+    index_path = str(tmp_path / "index.json")
+
+    index = FileIndex(index_path, rule_version="v1")
+    for path, _ in index.scan([str(tmp_path / "game")], suffixes=(".js",)):
+        index.record(path)
+    index.save()
+
+    reads = []
+    real_hash = file_index.sha256_file
+    monkeypatch.setattr(file_index, "sha256_file", lambda path: reads.append(path) or real_hash(path))
+    (tmp_path / "game" / "b.js").write_text("changed")
+
+    index = FileIndex(index_path, rule_version="v1")
+    unchanged = {os.path.basename(path): index.unchanged(path, st) for path, st in index.scan([str(tmp_path / "game")])}
+
+    assert unchanged == {"a.js": True, "b.js": False, "notes.txt": False}
+    assert [os.path.basename(path) for path in reads] == ["b.js"]
+
+
+def test_touched_file_and_rule_version(tmp_path):
+    path = tmp_path / "a.js"
+    path.write_text("a")
+    old_mtime(path)
+    index = FileIndex(str(tmp_path / "index.json"), rule_version="v1")
+    index.record(str(path))
+
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert index.unchanged(str(path))
+    assert index.files[str(path)]["mtime_ns"] == 2_000_000_000
+
+    index.rule_version = "v2"
+    assert not index.unchanged(str(path))
@@ -0,0 +1,52 @@
+from generation_cache import GenerationCache, payload_key
+from generation_scheduler import GenerationJob, GenerationScheduler
+
+
+def payload(prompt, **extra):
+    return dict({'prompt': prompt, 'modelId': 'model', 'width': 256, 'height': 256}, **extra)
+
+
+def test_key_ignores_field_order():
+    assert payload_key({'a': 1, 'b': 2}) == payload_key({'b': 2, 'a': 1})
+    assert payload_key(payload('cat')) != payload_key(payload('cat', presetStyle='PIXEL_ART'))
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = GenerationCache(str(tmp_path))
+    cache.put(payload('cat'), b'png-bytes', {'name': 'wetcat_stand'})
+
+    reopened = GenerationCache(str(tmp_path))
+    assert reopened.get(payload('cat')) == b'png-bytes'
+    assert reopened.lookup(payload('cat'))[1]['name'] == 'wetcat_stand'
+    assert reopened.get(payload('dog')) is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = GenerationCache(str(tmp_path), max_bytes=10)
+    cache.put(payload('a'), b'12345')
+    cache.put(payload('b'), b'12345')
+    cache.get(payload('a'))
+    cache.put(payload('c'), b'12345')
+
+    assert payload('a') in cache
+    assert payload('b') not in cache
+    assert payload('c') in cache
+    assert cache.total_bytes() <= 10
+
+
+def test_scheduler_skips_cached_payloads(stub_server, tmp_path):
+    server, base_url = stub_server
+    cache = GenerationCache(str(tmp_path / 'cache'))
+
+    def run(prompts):
+        jobs = [GenerationJob(p, payload(p), path=str(tmp_path / f'{p}.png')) for p in prompts]
+        scheduler = GenerationScheduler('test-key', base_url=base_url, poll_interval=0.05,
+                                        rate_limit=0, cache=cache, verbose=False)
+        return scheduler.run(jobs)
+
+    run(['one', 'two', 'three'])
+    assert server.state.submissions == 3
+
+    results = run(['one', 'two', 'three-edited'])
+    assert all(results.values())
+    assert server.state.submissions == 4
@@ -0,0 +1,98 @@
+import threading
+import time
+
+from generation_cache import GenerationCache
+from generation_pipeline import GenerationPipeline, Pipeline, Stage
+from generation_scheduler import GenerationJob, GenerationScheduler
+
+
+def sleeper(seconds):
+    def step(item):
+        time.sleep(seconds)
+        return item
+    return step
+
+
+def test_stages_overlap():
+    pipeline = Pipeline([
+        Stage('download', sleeper(0.05)),
+        Stage('process', sleeper(0.05)),
+        Stage('write', sleeper(0.05))
+    ], verbose=False)
+
+    start = time.monotonic()
+    with pipeline:
+        for i in range(10):
+            pipeline.put(i)
+    elapsed = time.monotonic() - start
+
+    assert sorted(pipeline.results) == list(range(10))
+    # Serially: 10 items x 3 stages x 0.05s = 1.5s; pipelined: ~ (10 + 2) x 0.05s
+    assert elapsed < 1.0
+    assert all(stats['processed'] == 10 for stats in pipeline.stats().values())
+
+
+def test_bounded_queues_apply_backpressure():
+    held = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def produce(item):
+        with lock:
+            held.append(item)
+            peak[0] = max(peak[0], len(held))
+        return item
+
+    def consume(item):
+        time.sleep(0.02)
+        with lock:
+            held.remove(item)
+        return item
+
+    pipeline = Pipeline([Stage('fast', produce, workers=2, capacity=2),
+                         Stage('slow', consume, workers=1, capacity=2)], verbose=False)
+    with pipeline:
+        for i in range(20):
+            pipeline.put(i)
+
+    # Queued (2) + being put by each fast worker (2) + being consumed (1)
+    assert peak[0] <= 5
+    assert len(pipeline.results) == 20
+
+
+def test_failures_are_dropped_not_fatal():
+    def flaky(item):
+        if item % 3 == 0:
+            raise ValueError("bad sprite")
+        return item
+
+    pipeline = Pipeline([Stage('process', flaky, workers=2)], verbose=False)
+    with pipeline:
+        for i in range(9):
+            pipeline.put(i)
+
+    assert sorted(pipeline.results) == [1, 2, 4, 5, 7, 8]
+    assert pipeline.stats()['process']['failed'] == 3
+
+
+def test_generation_pipeline_end_to_end(stub_server, tmp_path):
+    server, base_url = stub_server
+    jobs = [GenerationJob(f'asset_{i}', {'prompt': f'wet cat {i}', 'width': 128, 'height': 128}) for i in range(4)]
+    written = {}
+
+    def run():
+        scheduler = GenerationScheduler('test-key', base_url=base_url, poll_interval=0.05, rate_limit=0,
+                                        cache=GenerationCache(str(tmp_path / 'cache')), verbose=False)
+        pipeline = GenerationPipeline(scheduler, lambda job, data: data[::-1],
+                                      lambda job, result: written.__setitem__(job.name, result), verbose=False)
+        return pipeline.run(jobs)
+
+    assert all(run().values())
+    assert all(data.endswith(b'GNP\x89') for data in written.values())
+    assert server.state.downloads == 4
+
+    # Second run: every job is a cache hit that still flows through process/write
+    written.clear()
+    assert all(run().values())
+    assert len(written) == 4
+    assert server.state.submissions == 4
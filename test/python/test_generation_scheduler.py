@@ -0,0 +1,119 @@
+import os
+import time
+
+from adaptive_polling import FixedPoller
+from generation_scheduler import GenerationJob, GenerationScheduler, RateLimiter
+
+
+def make_jobs(count, tmp_path=None, prompt='pixel art wet cat'):
+    return [
+        GenerationJob(
+            f'asset_{i}',
+            {'prompt': f'{prompt} {i}', 'width': 256, 'height': 256},
+            path=str(tmp_path / f'asset_{i}.png') if tmp_path else None
+        )
+        for i in range(count)
+    ]
+
+
+def make_scheduler(base_url, **options):
+    options.setdefault('poll_interval', 0.05)
+    options.setdefault('rate_limit', 0)
+    return GenerationScheduler('test-key', base_url=base_url, verbose=False, **options)
+
+
+def test_batch_runs_concurrently(stub_server):
+    server, base_url = stub_server
+    jobs = make_jobs(6)
+
+    start = time.monotonic()
+    results = make_scheduler(base_url, max_concurrency=6).run(jobs)
+    elapsed = time.monotonic() - start
+
+    assert all(results.values())
+    assert server.state.peak_in_flight == 6
+    # Six 0.3s generations back to back would take at least 1.8s
+    assert elapsed < 1.0
+
+
+def test_max_concurrency_is_respected(stub_server):
+    server, base_url = stub_server
+
+    results = make_scheduler(base_url, max_concurrency=2).run(make_jobs(5))
+
+    assert all(results.values())
+    assert server.state.submissions == 5
+    assert server.state.peak_in_flight <= 2
+
+
+def test_results_are_downloaded_to_job_paths(stub_server, tmp_path):
+    server, base_url = stub_server
+    jobs = make_jobs(3, tmp_path)
+    completed = []
+
+    make_scheduler(base_url).run(jobs, on_complete=lambda job, data: completed.append(job.name))
+
+    for job in jobs:
+        assert os.path.getsize(job.path) > 0
+    assert sorted(completed) == ['asset_0', 'asset_1', 'asset_2']
+    assert server.state.downloads == 3
+
+
+def test_failed_generation_returns_none(stub_server):
+    _, base_url = stub_server
+    jobs = make_jobs(1) + make_jobs(1, prompt='FAIL')
+    jobs[1].name = 'broken'
+
+    results = make_scheduler(base_url).run(jobs)
+
+    assert results['asset_0']
+    assert results['broken'] is None
+
+
+def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(rate=20, burst=1)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+
+    # First call is free, the next four wait ~50ms each
+    assert time.monotonic() - start >= 0.18
+
+
+def test_batch_survives_transient_api_errors(stub_server):
+    server, base_url = stub_server
+    server.state.inject(429, count=3, retry_after=0)
+
+    results = make_scheduler(base_url).run(make_jobs(3))
+
+    assert all(results.values())
+    assert server.state.faulted == 3
+
+
+class RecordingPoller(FixedPoller):
+    def __init__(self, interval):
+        super().__init__(interval)
+        self.durations = []
+
+    def record(self, model, seconds):
+        self.durations.append(seconds)
+
+
+def test_blocking_on_ready_does_not_stall_polling(stub_server):
+    server, base_url = stub_server
+    handed = []
+
+    def slow_consumer(job):
+        # A pipeline applying backpressure
+        time.sleep(0.4)
+        handed.append(job.name)
+
+    poller = RecordingPoller(0.05)
+    results = make_scheduler(base_url, max_concurrency=4, poller=poller).run(make_jobs(4), on_ready=slow_consumer)
+
+    assert all(results.values())
+    assert sorted(handed) == ['asset_0', 'asset_1', 'asset_2', 'asset_3']
+    assert server.state.downloads == 0
+    # Every 0.3s generation was seen finishing on time, not after the consumer got to it
+    assert max(poller.durations) < 0.45
@@ -0,0 +1,61 @@
+import base64
+import io
+import json
+
+import numpy as np
+from PIL import Image
+
+from asset_fingerprint import manifest_module, read_manifest
+from image_previews import build_previews, preview_module
+
+
+def noisy_image(path, size, mode="RGB"):
+    # Noise keeps the encoded file big enough to pass the size threshold
+    pixels = np.random.default_rng(0).integers(0, 255, (size[1], size[0], len(mode)), dtype=np.uint8)
+    Image.fromarray(pixels, mode).save(path)
+
+
+def test_images_the_game_loads_get_size_and_a_tiny_preview(tmp_path):
+    public = tmp_path / "public"
+    (public / "sprites").mkdir(parents=True)
+    (public / "images").mkdir()
+    noisy_image(public / "sprites" / "hero.0123456789.png", (300, 400), "RGBA")
+    noisy_image(public / "sprites" / "packed.0123456789.png", (300, 400), "RGBA")
+    noisy_image(public / "sprites" / "unlisted.png", (300, 400), "RGBA")
+    Image.new("RGB", (640, 360)).save(public / "sprites" / "small.0123456789.png")
+    (public / "sprites" / "atlas.0123456789.json").write_text(json.dumps({"frames": {"packed": {}}}))
+    noisy_image(public / "sprites" / "floor.0123456789.jpg", (512, 256))
+    noisy_image(public / "sprites" / "floor_1.0123456789.jpg", (256, 128))
+    noisy_image(public / "images" / "bg-1x.0123456789.webp", (640, 360))
+    manifest = {
+        "images": {"hero": "sprites/hero.0123456789.png", "packed": "sprites/packed.0123456789.png",
+                   "small": "sprites/small.0123456789.png"},
+        "atlas": "sprites/atlas.0123456789.json",
+        "tiles": {"floor": {"levels": [{"url": "sprites/floor.0123456789.jpg", "scale": 1.0},
+                                       {"url": "sprites/floor_1.0123456789.jpg", "scale": 0.5}]}},
+        "variants": {"bg": [{"scale": 2.0, "webp": "images/bg-1x.0123456789.webp", "fallback": None}]},
+    }
+
+    previews = build_previews(manifest, str(public), min_bytes=16 * 1024)
+
+    # Keyed by asset name; atlas frames and files the manifest doesn't list get none
+    assert sorted(previews) == ["bg", "floor", "hero"]
+    hero = previews["hero"]
+    assert (hero["width"], hero["height"]) == (300, 400)
+    assert hero["preview"].startswith("data:image/webp;base64,") and len(hero["preview"]) < 2048
+    with Image.open(io.BytesIO(base64.b64decode(hero["preview"].split(",", 1)[1]))) as preview:
+        assert preview.size == (18, 24) and preview.mode == "RGBA"
+    # Sizes are 1x, whichever file the preview was made from
+    assert (previews["floor"]["width"], previews["floor"]["height"]) == (512, 256)
+    assert (previews["bg"]["width"], previews["bg"]["height"]) == (320, 180)
+
+
+def test_preview_module_is_json(tmp_path):
+    previews = {"logo": {"width": 1, "height": 1, "preview": "data:image/webp;base64,AA=="}}
+    source = preview_module(previews)
+    assert json.loads(source[source.index("=") + 1:source.rindex(";")]) == previews
+    assert "export const IMAGE_PREVIEWS = {};" in preview_module({})
+
+    (tmp_path / "assetManifest.js").write_text(manifest_module({"images": {"it's": "a\"b"}}))
+    assert read_manifest(str(tmp_path / "assetManifest.js")) == {"images": {"it's": "a\"b"}}
+    assert read_manifest(str(tmp_path / "missing.js")) == {}
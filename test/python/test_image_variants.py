@@ -0,0 +1,76 @@
+import io
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+from image_variants import build_variants, encode, search_quality, ssim, variant_sizes
+
+
+def scene(size=(320, 180)):
+    img = Image.new("RGB", size, (40, 30, 80))
+    draw = ImageDraw.Draw(img)
+    for i in range(0, size[0], 24):
+        draw.rectangle([i, size[1] // 3, i + 12, size[1] - 10], fill=(200, 150 + i % 100, 60))
+    draw.text((10, 10), "WETCAT", fill=(255, 220, 60))
+    return img
+
+
+def test_ssim_is_one_for_identical_images_and_drops_with_damage():
+    img = scene()
+
+    assert ssim(img, img) == 1.0
+    blurred = ssim(img, img.filter(ImageFilter.GaussianBlur(1)))
+    noisy = Image.fromarray(np.clip(np.asarray(img, dtype=np.int16) +
+                                    np.random.default_rng(0).integers(-40, 40, (180, 320, 3)), 0, 255).astype(np.uint8))
+    assert 0.5 < blurred < 1.0
+    assert ssim(img, noisy) < blurred
+
+
+def test_quality_search_finds_the_lowest_quality_reaching_the_target():
+    img = scene()
+
+    quality, data, score = search_quality(img, "jpg", target=0.985)
+
+    assert score >= 0.985
+    with Image.open(io.BytesIO(encode(img, "jpg", quality - 1))) as worse:
+        assert ssim(img, worse) < 0.985
+    assert len(search_quality(img, "webp", target=0.9)[1]) < len(search_quality(img, "webp", target=0.99)[1])
+
+
+def test_variants_skip_upscaling_and_are_published_with_hashes(tmp_path):
+    assert variant_sizes((1280, 720), (1280, 720)) == [(0.5, (640, 360)), (1.0, (1280, 720))]
+    assert variant_sizes((100, 50), (400, 200)) == [(0.5, (200, 100))]
+
+    source = tmp_path / "logo.png"
+    img = scene((400, 200)).convert("RGBA")
+    img.putpixel((0, 0), (0, 0, 0, 0))
+    img.save(source)
+    spec = {"key": "logo", "source": str(source), "name": "logo", "size": (200, 100)}
+
+    entries = build_variants(spec, scales=(0.5, 1.0, 2.0), output_dir=str(tmp_path), target=0.95)
+
+    assert [(e["scale"], e["width"], e["height"]) for e in entries] == [(0.5, 100, 50), (1.0, 200, 100), (2.0, 400, 200)]
+    # Transparency means a lossless PNG fallback
+    assert all(e["webp"].endswith(".webp") and e["fallback"].endswith(".png") for e in entries)
+    for entry in entries:
+        assert os.path.exists(tmp_path / entry["webp"].split("/", 1)[1])
+        assert os.path.exists(tmp_path / entry["fallback"].split("/", 1)[1])
+
+
+def test_stretched_specs_keep_the_whole_image(tmp_path):
+    source = tmp_path / "square.png"
+    img = Image.new("RGB", (200, 200), (255, 255, 255))
+    ImageDraw.Draw(img).rectangle([0, 0, 199, 19], fill=(255, 0, 0))
+    img.save(source)
+    spec = {"key": "square", "source": str(source), "name": "square", "size": (200, 100)}
+
+    cropped = build_variants(spec, scales=(1.0,), output_dir=str(tmp_path), target=0.95)
+    stretched = build_variants({**spec, "name": "stretched", "fit": "stretch"}, scales=(1.0,), output_dir=str(tmp_path), target=0.95)
+
+    # Cropping to 2:1 cuts the red band off the top; stretching squeezes it to half its height
+    with Image.open(tmp_path / cropped[0]["fallback"].split("/", 1)[1]) as top:
+        assert top.convert("RGB").getpixel((100, 2))[1] > 200
+    with Image.open(tmp_path / stretched[0]["fallback"].split("/", 1)[1]) as top:
+        red = top.convert("RGB")
+        assert red.getpixel((100, 2))[1] < 60 and red.getpixel((100, 20))[1] > 200
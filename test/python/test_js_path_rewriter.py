@@ -0,0 +1,65 @@
+from js_path_rewriter import PathPolicy, rewrite_source, rewrite_tree, tokenize
+
+SOURCE = """// new Audio('/wetcat-librarian/comment.mp3') stays a comment
+const pattern = /new Audio\\('\\/x.mp3'\\)/g;
+const label = `new Audio('/template.mp3') ${count / 2}`;
+this.music = new Audio('/wetcat-librarian/song.mp3');
+this.image.src = '/menu_background.jpg';
+this.api.src = '/api/session';
+loader.loadImage('coin', "/sprites/coin.png");
+this.logo = game.progressiveImage('logo', 'wetcat-logo.png');
+"""
+
+
+def test_tokenizer_keeps_comments_regexes_and_templates_whole():
+    kinds = [token.kind for token in tokenize(SOURCE)]
+
+    assert kinds[0] == "comment"
+    assert "regex" in kinds and "template" in kinds
+    assert [t.text for t in tokenize("a = b / c / d")].count("/") == 2
+
+
+def test_relative_mode_strips_base_and_leading_slash():
+    rewritten, changes = rewrite_source(SOURCE, policy=PathPolicy("relative"))
+
+    assert "new Audio('song.mp3')" in rewritten
+    assert "src = 'menu_background.jpg'" in rewritten
+    assert 'loadImage(\'coin\', "sprites/coin.png")' in rewritten
+    assert "progressiveImage('logo', 'wetcat-logo.png')" in rewritten
+    # Non-asset URLs, comments, regexes and templates are untouched
+    assert "src = '/api/session'" in rewritten
+    assert rewritten.splitlines()[:3] == SOURCE.splitlines()[:3]
+    assert [name for name, _, _ in changes] == ["audio-constructor", "src-assignment", "loader-image"]
+
+
+def test_modes_round_trip_and_are_idempotent():
+    absolute, _ = rewrite_source(SOURCE, policy=PathPolicy("absolute"))
+    relative, _ = rewrite_source(absolute, policy=PathPolicy("relative"))
+
+    assert "new Audio('/wetcat-librarian/song.mp3')" in absolute
+    assert "src = '/wetcat-librarian/menu_background.jpg'" in absolute
+    # The fallback path handed to Game.progressiveImage, not the asset name before it
+    assert "progressiveImage('logo', '/wetcat-librarian/wetcat-logo.png')" in absolute
+    assert rewrite_source(absolute, policy=PathPolicy("absolute")) == (absolute, [])
+    assert relative == rewrite_source(SOURCE)[0]
+
+
+def test_tree_rewrite_dry_run_and_unchanged_skip(tmp_path):
+    src = tmp_path / "src"
+    (src / "node_modules").mkdir(parents=True)
+    (src / "node_modules" / "lib.js").write_text("new Audio('/lib.mp3');")
+    game = src / "game.js"
+    game.write_text("new Audio('/yay.mp3');\n")
+    state = str(tmp_path / "state.json")
+
+    dry = rewrite_tree([str(src)], dry_run=True, workers=1, state_path=state)
+    assert game.read_text() == "new Audio('/yay.mp3');\n"
+    assert "+new Audio('yay.mp3');" in dry["diffs"][0]
+
+    first = rewrite_tree([str(src)], workers=1, state_path=state)
+    second = rewrite_tree([str(src)], workers=1, state_path=state)
+
+    assert list(first["changed"]) == [str(game)]
+    assert game.read_text() == "new Audio('yay.mp3');\n"
+    assert second["processed"] == 0 and second["skipped"] == [str(game)]
+    assert (src / "node_modules" / "lib.js").read_text() == "new Audio('/lib.mp3');"
@@ -0,0 +1,177 @@
+import hashlib
+import time
+
+import pytest
+import requests
+
+from leonardo_client import LeonardoClient, never_sent, retry_after_seconds
+
+
+def make_client(base_url, **options):
+    options.setdefault('backoff', 0.01)
+    return LeonardoClient('test-key', base_url=base_url, verbose=False, **options)
+
+
+def create(client):
+    return client.post('generations', json={'prompt': 'wet cat', 'width': 64, 'height': 64})
+
+
+def generation_id(response):
+    return response.json()['sdGenerationJob']['generationId']
+
+
+def poll(client, base_url):
+    """Create a generation without faults, then GET its status"""
+    generation = generation_id(create(make_client(base_url)))
+    return client.get(f'generations/{generation}')
+
+
+def test_retries_5xx_then_succeeds(stub_server):
+    server, base_url = stub_server
+    client = make_client(base_url)
+    generation = generation_id(create(client))
+    server.state.inject(503, count=2)
+
+    response = client.get(f'generations/{generation}')
+
+    assert response.status_code == 200
+    assert server.state.faulted == 2
+
+
+def test_post_is_not_retried_on_5xx(stub_server):
+    server, base_url = stub_server
+    server.state.inject(503, count=2)
+
+    response = create(make_client(base_url))
+
+    # The server may have created the job before failing, so a resend could bill it twice
+    assert response.status_code == 503
+    assert server.state.faulted == 1
+
+
+def test_honors_retry_after_on_429(stub_server):
+    server, base_url = stub_server
+    server.state.inject(429, retry_after=0.4)
+
+    start = time.monotonic()
+    response = create(make_client(base_url))
+
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.4
+
+
+def test_gives_up_after_retries(stub_server):
+    server, base_url = stub_server
+    generation = generation_id(create(make_client(base_url)))
+    server.state.inject(500, count=10)
+
+    response = make_client(base_url, retries=2).get(f'generations/{generation}')
+
+    assert response.status_code == 500
+    assert server.state.faulted == 3
+
+
+def test_read_timeout_is_retried(stub_server):
+    server, base_url = stub_server
+    generation = generation_id(create(make_client(base_url)))
+    server.state.inject(delay=0.5)
+
+    response = make_client(base_url, timeout=(1, 0.2)).get(f'generations/{generation}')
+
+    assert response.status_code == 200
+
+
+def test_read_timeout_raises_when_retries_exhausted(stub_server):
+    server, base_url = stub_server
+    generation = generation_id(create(make_client(base_url)))
+    server.state.inject(delay=0.5, count=2)
+
+    with pytest.raises(requests.Timeout):
+        make_client(base_url, timeout=(1, 0.2), retries=1).get(f'generations/{generation}')
+
+
+def test_post_that_times_out_is_not_sent_again(stub_server):
+    server, base_url = stub_server
+    server.state.inject(delay=0.5)
+
+    with pytest.raises(requests.ReadTimeout):
+        create(make_client(base_url, timeout=(1, 0.2)))
+
+    # The server still creates the first job once its delay is over; nothing else arrives
+    time.sleep(0.6)
+    assert server.state.submissions == 1
+
+
+def test_only_failures_to_connect_count_as_never_sent():
+    with pytest.raises(requests.ConnectionError) as refused:
+        requests.get('http://127.0.0.1:9', timeout=1)
+
+    assert never_sent(refused.value)
+    assert never_sent(requests.ConnectTimeout())
+    assert not never_sent(requests.ReadTimeout())
+    assert not never_sent(requests.ConnectionError('Connection aborted.'))
+
+
+def test_session_reuses_connections(stub_server):
+    server, base_url = stub_server
+    client = make_client(base_url)
+
+    for _ in range(5):
+        generation_id = create(client).json()['sdGenerationJob']['generationId']
+        client.get(f'generations/{generation_id}')
+
+    assert server.state.connections == 1
+
+
+def image_url(client):
+    generation_id = create(client).json()['sdGenerationJob']['generationId']
+    time.sleep(0.35)
+    return client.get(f'generations/{generation_id}').json()['generations_by_pk']['generated_images'][0]['url']
+
+
+def test_download_streams_to_disk(stub_server, tmp_path):
+    server, base_url = stub_server
+    client = make_client(base_url)
+    url = image_url(client)
+    server.state.inject(502)
+
+    path = tmp_path / 'sprites' / 'cat.png'
+    written = client.download(url, str(path))
+
+    assert written == path.stat().st_size > 0
+    assert path.read_bytes().startswith(b'\x89PNG')
+    assert not (tmp_path / 'sprites' / 'cat.png.part').exists()
+
+
+def test_download_resumes_after_truncation(stub_server, tmp_path):
+    server, base_url = stub_server
+    client = make_client(base_url)
+    url = image_url(client)
+    expected = client.fetch(url)
+    server.state.inject(truncate=40)
+
+    path = tmp_path / 'cat.png'
+    written = client.download(url, str(path), expected_sha256=hashlib.sha256(expected).hexdigest(), chunk_size=16)
+
+    assert written == len(expected)
+    assert path.read_bytes() == expected
+    assert server.state.resumed == 1
+
+
+def test_download_rejects_checksum_mismatch(stub_server, tmp_path):
+    server, base_url = stub_server
+    client = make_client(base_url, retries=1)
+    url = image_url(client)
+
+    path = tmp_path / 'cat.png'
+    assert client.download(url, str(path), expected_sha256='0' * 64) is None
+    assert client.download(url, str(path), expected_size=1) is None
+    assert not path.exists()
+    assert not (tmp_path / 'cat.png.part').exists()
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds('3') == 3.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds('soon') is None
+    assert retry_after_seconds('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
@@ -0,0 +1,51 @@
+import numpy as np
+from PIL import Image
+
+from seamless_tile import extract_tile, mip_levels, seam_error, texture_period
+
+
+def tiled_texture(period=(24, 16), repeats=(10, 8), noise=0):
+    rng = np.random.default_rng(3)
+    tile = rng.integers(0, 255, (period[1], period[0], 3))
+    # Smooth it so neighbouring pixels are related, like a real texture
+    tile = (tile + np.roll(tile, 1, 0) + np.roll(tile, 1, 1) + np.roll(tile, (1, 1), (0, 1))) / 4
+    pixels = np.tile(tile, (repeats[1], repeats[0], 1)) + rng.normal(0, noise, (period[1] * repeats[1],
+                                                                             period[0] * repeats[0], 3))
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), "RGB")
+
+
+def test_period_of_a_repeating_texture_is_found():
+    assert texture_period(tiled_texture()) == (24, 16)
+    assert texture_period(tiled_texture(noise=8)) == (24, 16)
+
+    # Pure noise doesn't repeat: keep the whole image
+    noise = Image.fromarray(np.random.default_rng(0).integers(0, 255, (60, 80, 3), dtype=np.uint8), "RGB")
+    assert texture_period(noise) == (80, 60)
+
+
+def test_extracted_tile_repeats_without_seams():
+    texture = tiled_texture(noise=4)
+    tile = extract_tile(texture)
+
+    assert tile.size == (24, 16)
+    pixels = np.asarray(tile, dtype=np.float64).mean(axis=2)
+    assert seam_error(pixels, 1) < 1.5 and seam_error(pixels, 0) < 1.5
+
+    # A gradient has a hard wrap edge; the tile gives up a little width to fade it out
+    gradient = Image.fromarray(np.tile(np.linspace(0, 255, 80), (40, 1)).astype(np.uint8), "L").convert("RGB")
+    faded = extract_tile(gradient)
+    assert faded.width < 80
+    assert seam_error(np.asarray(faded, dtype=np.float64).mean(axis=2), 1) < \
+        seam_error(np.asarray(gradient, dtype=np.float64).mean(axis=2), 1)
+
+
+def test_mip_levels_halve_and_stay_seamless():
+    tile = extract_tile(tiled_texture(period=(256, 128), repeats=(2, 2)))
+
+    levels = mip_levels(tile, min_size=32)
+
+    assert [(scale, level.size) for scale, level in levels] == [
+        (1.0, (256, 128)), (0.5, (128, 64)), (0.25, (64, 32))]
+    for _, level in levels[1:]:
+        pixels = np.asarray(level, dtype=np.float64).mean(axis=2)
+        assert seam_error(pixels, 1) < 1.5 and seam_error(pixels, 0) < 1.5
@@ -0,0 +1,64 @@
+import io
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from sprite_dedup import DuplicateIndex, find_duplicates, sprite_hashes
+
+
+def sprite(offset=(8, 8), shape="cat", noise=False, canvas=(64, 64)):
+    img = Image.new("RGBA", canvas, (0, 0, 0, 0))
+    if noise:
+        # Garbage color under fully transparent pixels, as chroma keying leaves behind
+        pixels = np.random.default_rng(1).integers(0, 255, (canvas[1], canvas[0], 4), dtype=np.uint8)
+        pixels[..., 3] = 0
+        img = Image.fromarray(pixels, "RGBA")
+    draw = ImageDraw.Draw(img)
+    x, y = offset
+    if shape == "cat":
+        draw.ellipse([x, y + 10, x + 30, y + 40], fill=(100, 100, 200, 255))
+        draw.ellipse([x + 5, y, x + 25, y + 20], fill=(200, 200, 250, 255))
+    else:
+        draw.rectangle([x, y, x + 12, y + 40], fill=(250, 180, 20, 255))
+        draw.rectangle([x + 14, y + 30, x + 36, y + 40], fill=(30, 30, 30, 255))
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_exact_and_near_duplicates_are_found():
+    index = DuplicateIndex(max_distance=4)
+    index.add("wetcat_walk1", sprite_hashes(sprite()))
+
+    exact = index.match("wetcat_walk2", sprite_hashes(sprite()))
+    assert exact.kind == "exact" and exact.other == "wetcat_walk1" and exact.same_cycle
+
+    # Different bytes: noise under alpha 0 and a different position on the canvas
+    near = index.match("wetcat_sprint", sprite_hashes(sprite(offset=(20, 2), noise=True)))
+    assert near.kind == "near" and near.distance <= 1
+
+    assert index.match("coin", sprite_hashes(sprite(shape="other"))) is None
+
+
+def test_an_entry_never_matches_itself():
+    index = DuplicateIndex()
+    index.add("wallet", sprite_hashes(sprite()))
+
+    assert index.match("wallet", sprite_hashes(sprite())) is None
+    index.add("wallet", sprite_hashes(sprite(shape="other")))
+    assert index.match("coin", sprite_hashes(sprite())) is None
+
+
+def test_scan_groups_byte_identical_files(tmp_path):
+    for directory in ("public/sprites", "src/assets/sprites"):
+        (tmp_path / directory).mkdir(parents=True)
+        (tmp_path / directory / "kid1_stand.png").write_bytes(sprite())
+    (tmp_path / "public/sprites/librarian_stand.png").write_bytes(sprite(shape="other"))
+    (tmp_path / "public/sprites/librarian_walk2.png").write_bytes(sprite(shape="other"))
+
+    report = find_duplicates([str(tmp_path)])
+
+    # Same-named mirrors in both sprite dirs are by design and not reported
+    assert [[p.rsplit("/", 1)[1] for p in group] for group in report["exact"]] == [
+        ["librarian_stand.png", "librarian_walk2.png"]]
+    assert report["near"] == []
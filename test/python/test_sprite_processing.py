@@ -0,0 +1,33 @@
+import io
+
+import numpy as np
+from PIL import Image
+
+from sprite_processing import encode_png_optimized, fit_within, to_indexed
+
+
+def test_fit_within_keeps_aspect_and_never_upscales():
+    img = Image.new("RGBA", (600, 1200))
+
+    assert fit_within(img, 72, 96).size == (48, 96)
+    assert fit_within(Image.new("RGBA", (20, 30)), 72, 96).size == (20, 30)
+
+
+def test_indexed_png_is_lossless_including_alpha():
+    rgba = np.zeros((16, 16, 4), dtype=np.uint8)
+    rgba[4:12, 4:12] = (200, 40, 10, 255)
+    rgba[6:10, 6:10] = (10, 40, 200, 128)
+    img = Image.fromarray(rgba, "RGBA")
+
+    assert to_indexed(img).mode == "P"
+    decoded = Image.open(io.BytesIO(encode_png_optimized(img))).convert("RGBA")
+    assert np.array_equal(np.asarray(decoded), rgba)
+
+
+def test_too_many_colors_stays_truecolor():
+    rgba = np.random.default_rng(0).integers(0, 256, (32, 32, 4), dtype=np.uint8)
+    img = Image.fromarray(rgba, "RGBA")
+
+    assert to_indexed(img) is None
+    decoded = Image.open(io.BytesIO(encode_png_optimized(img))).convert("RGBA")
+    assert np.array_equal(np.asarray(decoded), rgba)